@@ -0,0 +1 @@
+"""Shared tooling for the Advent of Code solutions under src/YY/DD"""
@@ -0,0 +1,137 @@
+"""Answers stored by content, keyed by (year, day, part, sha256 of the input, sha256 of the source)
+
+An answer is returned from the store as long as neither the input nor the source which solved it has
+changed; editing either one changes its digest, so the old row simply stops matching. The source is the
+day's script and every module of the aoc package, since most of the solving happens in shared helpers
+(search, csr, memo, topology, parse, ...), so editing any of them re-verifies every answer. The store is
+one SQLite database in write-ahead-log mode, CACHE/answers.sqlite, which any number of worker processes
+can read and write at once.
+"""
+from __future__ import annotations
+from dataclasses import dataclass
+from functools import lru_cache
+from pathlib import Path
+
+from aoc.days import Day
+from aoc.inputs import CACHE
+
+DATABASE = CACHE.joinpath('answers.sqlite')
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS answers (
+    year INTEGER, day INTEGER, part INTEGER, input TEXT, source TEXT,
+    answer TEXT, seconds REAL, created REAL,
+    PRIMARY KEY (year, day, part, input, source)
+)
+"""
+
+
+def digest(lines: list[str]) -> str:
+    from hashlib import sha256
+    return sha256('\n'.join(lines).encode()).hexdigest()
+
+
+@lru_cache(maxsize=1)
+def package_digest() -> str:
+    """The sha256 of every module of the aoc package, read once per process"""
+    from hashlib import sha256
+    package = Path(__file__).resolve().parent
+    h = sha256()
+    for path in sorted(package.rglob('*.py')):
+        h.update(path.relative_to(package).as_posix().encode() + b'\0' + path.read_bytes() + b'\0')
+    return h.hexdigest()
+
+
+def source_digest(day: Day) -> str:
+    from hashlib import sha256
+    return sha256(day.path.read_bytes() + package_digest().encode()).hexdigest()
+
+
+@dataclass
+class Answer:
+    answer: str
+    seconds: float
+    created: float
+
+
+class AnswerStore:
+    def __init__(self, path: Path | str = DATABASE, timeout: float = 30):
+        self.path = Path(path)
+        self.timeout = timeout
+        self._connection = None
+        self._pid = None
+
+    def connection(self):
+        """One connection per process, since SQLite connections must not be shared across a fork"""
+        import os
+        import sqlite3
+        if self._connection is None or self._pid != os.getpid():
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            self._connection = sqlite3.connect(self.path, timeout=self.timeout, isolation_level=None)
+            self._connection.execute('PRAGMA journal_mode=WAL')
+            self._connection.execute('PRAGMA synchronous=NORMAL')
+            self._connection.execute(_SCHEMA)
+            self._pid = os.getpid()
+        return self._connection
+
+    def get(self, year: int, day: int, part: int, input_digest: str, source: str) -> Answer | None:
+        row = self.connection().execute(
+            'SELECT answer, seconds, created FROM answers WHERE year=? AND day=? AND part=? AND input=? AND source=?',
+            (year, day, part, input_digest, source)).fetchone()
+        return None if row is None else Answer(*row)
+
+    def put(self, year: int, day: int, part: int, input_digest: str, source: str, answer: str, seconds: float):
+        from time import time
+        self.connection().execute('INSERT OR REPLACE INTO answers VALUES (?, ?, ?, ?, ?, ?, ?, ?)',
+                                  (year, day, part, input_digest, source, answer, seconds, time()))
+
+    def prune(self, days: list[Day]) -> int:
+        """Delete the answers from older versions of these days' scripts or of aoc, returning how many went"""
+        removed = 0
+        for d in days:
+            removed += self.connection().execute('DELETE FROM answers WHERE year=? AND day=? AND source!=?',
+                                                 (d.year, d.day, source_digest(d))).rowcount
+        return removed
+
+    def rows(self) -> list[tuple]:
+        return self.connection().execute(
+            'SELECT year, day, part, answer, seconds, created FROM answers ORDER BY year, day, part').fetchall()
+
+
+def solve(day: Day, part: int, lines: list[str], store: AnswerStore | None = None, force: bool = False,
+          solver=None) -> tuple[str, float, bool]:
+    """The answer, its solving time and whether it came from the store, solving and storing it if needed"""
+    from time import perf_counter
+    store = AnswerStore() if store is None else store
+    key = day.year, day.day, part, digest(lines), source_digest(day)
+    if not force and (found := store.get(*key)) is not None:
+        return found.answer, found.seconds, True
+    solver = day.solver(part) if solver is None else solver
+    start = perf_counter()
+    answer = str(solver(lines))
+    seconds = perf_counter() - start
+    store.put(*key, answer, seconds)
+    return answer, seconds, False
+
+
+if __name__ == '__main__':
+    from argparse import ArgumentParser
+    from datetime import datetime
+    from aoc.days import discover
+    parser = ArgumentParser(description='Inspect or tidy the stored Advent of Code answers')
+    parser.add_argument('command', choices=('list', 'prune', 'clear'))
+    parser.add_argument('-y', '--year', type=int, nargs='*', help='the year(s) to prune', default=None)
+    parser.add_argument('-d', '--day', type=int, nargs='*', help='the day(s) of advent to prune', default=None)
+    parser.add_argument('--database', type=str, help='the answer database', default=str(DATABASE))
+    args = parser.parse_args()
+
+    answers = AnswerStore(args.database)
+    if args.command == 'list':
+        for y, d, p, a, s, c in answers.rows():
+            print(f'{y} {d:2d} {p}  {a:>20s}  {s:9.3f}s  {datetime.fromtimestamp(c):%Y-%m-%d %H:%M}')
+    elif args.command == 'prune':
+        print(f'removed {answers.prune(discover(args.year, args.day))} stale answers')
+    else:
+        answers.path.unlink(missing_ok=True)
+        for suffix in ('-wal', '-shm'):
+            answers.path.with_name(answers.path.name + suffix).unlink(missing_ok=True)
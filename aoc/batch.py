@@ -0,0 +1,173 @@
+"""One (year, day, part) against a corpus of inputs, with identical inputs solved once and the rest
+spread over a process pool, answers streamed back as they are found
+
+    for outcome in stream(2024, 7, 2, corpus):        # in completion order
+        print(outcome.index, outcome.answer)
+    answers = solve(2024, 7, 2, corpus)               # in input order
+
+Inputs are lists of lines, puzzle text as a str, or paths as pathlib.Path (any os.PathLike). A str is
+always text: a one-line str naming an existing file raises ValueError rather than being solved as a
+puzzle, so wrap file names in Path. Inputs are deduplicated by the sha256 of their lines (as in
+aoc.answers), and the distinct ones are sent to the workers in chunks, several per worker, so that
+submitting and collecting stays cheap against solving while a slow chunk can not hold up the rest of
+the pool for long. Each worker imports the day and resolves the part's entry point once, in its
+initializer, and keeps them, with any module-level caches, for every input it is sent.
+
+There is no separate cache of parsed inputs: every entry point here takes the raw lines and parses
+them itself, so parsing can not be shared apart from solving. Deduplicating by digest is what keeps
+an input from being parsed (and solved) more than once per batch.
+"""
+from __future__ import annotations
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Iterator
+
+
+@dataclass(order=True)
+class Outcome:
+    index: int
+    answer: str = ''
+    seconds: float = 0.0
+    status: str = 'ok'
+    digest: str = ''
+    duplicate: bool = False
+
+
+def _names_file(text: str) -> bool:
+    if '\n' in text:
+        return False
+    try:
+        return Path(text).is_file()
+    except (OSError, ValueError):
+        # too long, or holding a NUL, to be a file name
+        return False
+
+
+def _lines(source) -> list[str]:
+    import os
+    if isinstance(source, os.PathLike):
+        return Path(source).read_text().splitlines()
+    if isinstance(source, str):
+        if _names_file(source):
+            raise ValueError(f'{source!r} names a file, pass Path({source!r}) to solve its contents')
+        return source.splitlines()
+    return list(source)
+
+
+def _warm(year: int, day: int, part: int):
+    from aoc.registry import registry
+    registry().solver(year, day, part)
+
+
+def _solve_chunk(year: int, day: int, part: int, chunk: list[tuple[str, list[str]]],
+                 timeout: float | None) -> list[tuple[str, str, float, str]]:
+    """The (digest, answer, seconds, status) of each input of a chunk, solved in this worker"""
+    from contextlib import redirect_stdout
+    from os import devnull
+    from time import perf_counter
+    from aoc.days import deadline
+    from aoc.registry import registry
+    solver = registry().solver(year, day, part)
+    solved = []
+    with open(devnull, 'w') as sink, redirect_stdout(sink):
+        for key, lines in chunk:
+            start = perf_counter()
+            try:
+                with deadline(timeout):
+                    answer = solver(lines)
+                solved.append((key, str(answer), perf_counter() - start, 'ok'))
+            except TimeoutError:
+                solved.append((key, '', timeout, 'timeout'))
+            except Exception as error:
+                solved.append((key, '', perf_counter() - start, f'{type(error).__name__}: {error}'))
+    return solved
+
+
+def chunked(items: list, workers: int, chunksize: int | None = None) -> list[list]:
+    """Split items into chunks of chunksize, by default about four chunks per worker"""
+    if chunksize is None:
+        chunksize = max(1, -(-len(items) // (4 * workers)))
+    return [items[i:i + chunksize] for i in range(0, len(items), chunksize)]
+
+
+def stream(year: int, day: int, part: int, inputs: list, workers: int | None = None,
+           chunksize: int | None = None, timeout: float | None = None) -> Iterator[Outcome]:
+    """An Outcome for every input, as soon as its chunk is solved; duplicates arrive with their first copy
+
+    workers=0 solves everything in this process, one input at a time, which is easiest to debug.
+    """
+    import os
+    from aoc.answers import digest
+    year = year if year >= 2000 else 2000 + year
+    copies: dict[str, list[int]] = {}
+    distinct = []
+    for index, source in enumerate(inputs):
+        lines = _lines(source)
+        key = digest(lines)
+        if key not in copies:
+            copies[key] = []
+            distinct.append((key, lines))
+        copies[key].append(index)
+
+    def outcomes(solved):
+        for key, answer, seconds, status in solved:
+            for n, index in enumerate(copies[key]):
+                yield Outcome(index, answer, seconds, status, key, n > 0)
+
+    if workers == 0:
+        _warm(year, day, part)
+        for item in distinct:
+            yield from outcomes(_solve_chunk(year, day, part, [item], timeout))
+        return
+
+    from concurrent.futures import ProcessPoolExecutor, as_completed
+    workers = workers or os.cpu_count() or 1
+    with ProcessPoolExecutor(max_workers=workers, initializer=_warm, initargs=(year, day, part)) as pool:
+        futures = [pool.submit(_solve_chunk, year, day, part, chunk, timeout)
+                   for chunk in chunked(distinct, workers, chunksize)]
+        for future in as_completed(futures):
+            yield from outcomes(future.result())
+
+
+def solve(year: int, day: int, part: int, inputs: list, workers: int | None = None,
+          chunksize: int | None = None, timeout: float | None = None) -> list[Outcome]:
+    """Every input's Outcome, in input order"""
+    return sorted(stream(year, day, part, inputs, workers, chunksize, timeout))
+
+
+if __name__ == '__main__':
+    from argparse import ArgumentParser
+    from time import perf_counter
+    parser = ArgumentParser(description='Solve one part of one day for every input of a corpus, in parallel')
+    parser.add_argument('-y', '--year', type=int, help='the year', required=True)
+    parser.add_argument('-d', '--day', type=int, help='the day of advent', required=True)
+    parser.add_argument('-p', '--part', type=int, help='the part', default=1)
+    parser.add_argument('inputs', type=str, nargs='*', help='input files')
+    parser.add_argument('-g', '--generate', type=int, help='also solve this many generated inputs', default=0)
+    parser.add_argument('-n', '--size', type=int, help='the size of generated inputs', default=None)
+    parser.add_argument('-j', '--workers', type=int, help='worker processes, default one per CPU, 0 for none',
+                        default=None)
+    parser.add_argument('-c', '--chunksize', type=int, help='inputs per task, default four tasks per worker')
+    parser.add_argument('-t', '--timeout', type=float, help='per-input time limit in seconds', default=None)
+    args = parser.parse_args()
+
+    corpus = [Path(name) for name in args.inputs]
+    names = list(args.inputs)
+    if args.generate:
+        from aoc.generators import generate
+        year = args.year if args.year >= 2000 else 2000 + args.year
+        corpus += [generate(year, args.day, args.size, seed) for seed in range(args.generate)]
+        names += [f'seed {seed}' for seed in range(args.generate)]
+    wall = perf_counter()
+    results = []
+    for outcome in stream(args.year, args.day, args.part, corpus, args.workers, args.chunksize, args.timeout):
+        results.append(outcome)
+        answer = outcome.answer if outcome.status == 'ok' else outcome.status
+        print(f'{names[outcome.index]}\t{answer}\t{outcome.seconds:0.6f}{" (duplicate)" * outcome.duplicate}',
+              flush=True)
+    wall = perf_counter() - wall
+    solved = [r for r in results if not r.duplicate]
+    print(f'{len(results)} inputs, {len(solved)} distinct, in {wall:0.3f} s wall time, '
+          f'{sum(r.seconds for r in solved):0.3f} s summed, {len(results) / max(wall, 1e-9):0.1f} inputs/s')
+    if any(r.status != 'ok' for r in results):
+        raise SystemExit(1)
@@ -0,0 +1,157 @@
+from __future__ import annotations
+from dataclasses import dataclass, field
+from pathlib import Path
+
+from aoc.counters import report as counter_report
+from aoc.days import Day, ROOT, discover, deadline
+
+BASELINE = ROOT.joinpath('benchmarks.json')
+
+
+@dataclass
+class Measurement:
+    key: str
+    samples: list[float] = field(default_factory=list)
+    peak: int = 0
+    status: str = 'ok'
+    counters: dict[str, int] = field(default_factory=dict)
+
+    @property
+    def median(self):
+        from statistics import median
+        return median(self.samples)
+
+    @property
+    def spread(self):
+        """Median absolute deviation scaled to estimate the standard deviation of normal noise"""
+        from statistics import median
+        m = self.median
+        return 1.4826 * median(abs(x - m) for x in self.samples)
+
+    def summary(self) -> dict:
+        return {'median': self.median, 'min': min(self.samples), 'max': max(self.samples), 'spread': self.spread,
+                'runs': len(self.samples), 'peak': self.peak, 'counters': self.counters}
+
+
+def inputs(day: Day) -> list[Path]:
+    return day.examples() + day.cached()
+
+
+def read_lines(path: Path) -> list[str]:
+    with path.open('r') as file:
+        return file.read().splitlines()
+
+
+def measure(day: Day, part: int, path: Path, runs: int = 5, warmup: int = 1, timeout: float | None = None):
+    """Time one part on one input: warm up, then run repeatedly with freshly imported module state
+
+    Every repetition re-imports the solution so module-level caches from an earlier run can not
+    make later runs look faster. One extra run under tracemalloc records the peak allocation, and
+    the operation counters, which stay off during the timed runs.
+    """
+    from contextlib import redirect_stdout
+    from os import devnull
+    from time import perf_counter
+    import tracemalloc
+    from aoc.counters import collect
+    result = Measurement(f'{day.name}:{part}:{path.name}')
+    lines = read_lines(path)
+    try:
+        with open(devnull, 'w') as sink, redirect_stdout(sink), deadline(timeout):
+            for i in range(warmup + runs):
+                solver = day.solver(part, fresh=True)
+                start = perf_counter()
+                solver(lines)
+                elapsed = perf_counter() - start
+                if i >= warmup:
+                    result.samples.append(elapsed)
+            solver = day.solver(part, fresh=True)
+            tracemalloc.start()
+            try:
+                with collect() as result.counters:
+                    solver(lines)
+                result.peak = tracemalloc.get_traced_memory()[1]
+            finally:
+                tracemalloc.stop()
+    except TimeoutError:
+        result.status = 'timeout'
+    except Exception as error:
+        result.status = f'{type(error).__name__}: {error}'
+    return result
+
+
+def load_baseline(path: Path = BASELINE) -> dict[str, dict]:
+    import json
+    if not path.exists():
+        return {}
+    with path.open('r') as file:
+        return json.load(file)
+
+
+def save_baseline(measurements: list[Measurement], path: Path = BASELINE):
+    import json
+    baseline = load_baseline(path)
+    baseline.update({m.key: m.summary() for m in measurements if m.status == 'ok'})
+    with path.open('w') as file:
+        json.dump(dict(sorted(baseline.items())), file, indent=1)
+
+
+def compare(m: Measurement, base: dict | None, threshold: float, memory: float,
+            floor: float = 1e-3, memory_floor: int = 1 << 16) -> str:
+    """Flag a slowdown only if it exceeds the relative threshold, the run-to-run noise and an absolute floor"""
+    if m.status != 'ok':
+        return m.status
+    if base is None:
+        return 'new'
+    problems = []
+    noise = max(3 * max(m.spread, base['spread']), floor)
+    if m.median > base['median'] * (1 + threshold) and m.median - base['median'] > noise:
+        problems.append(f'slower x{m.median / base["median"]:0.2f}')
+    if m.peak > base['peak'] * (1 + memory) and m.peak - base['peak'] > memory_floor:
+        problems.append(f'memory x{m.peak / base["peak"]:0.2f}')
+    return 'REGRESSION ' + ', '.join(problems) if problems else 'ok'
+
+
+def report(rows: list[tuple[Measurement, dict | None, str]]) -> str:
+    width = max([len(m.key) for m, _, _ in rows] + [4])
+    lines = [f'{"case":{width}s} {"median":>10s} {"spread":>10s} {"baseline":>10s} {"peak kB":>10s}  verdict']
+    for m, base, verdict in rows:
+        median = f'{m.median:10.5f}' if m.samples else f'{"-":>10s}'
+        spread = f'{m.spread:10.5f}' if m.samples else f'{"-":>10s}'
+        before = f'{base["median"]:10.5f}' if base else f'{"-":>10s}'
+        lines.append(f'{m.key:{width}s} {median} {spread} {before} {m.peak / 1024:10.1f}  {verdict}')
+    counted = {f'{m.key} {name}': n for m, _, _ in rows for name, n in m.counters.items()}
+    if counted:
+        before = {f'{m.key} {name}': n for m, base, _ in rows if base for name, n in base.get('counters', {}).items()}
+        lines.extend(['', counter_report(counted, before)])
+    return '\n'.join(lines)
+
+
+if __name__ == '__main__':
+    from argparse import ArgumentParser
+    parser = ArgumentParser(description='Benchmark Advent of Code solutions against a saved baseline, offline')
+    parser.add_argument('-y', '--year', type=int, nargs='*', help='the year(s) to benchmark', default=None)
+    parser.add_argument('-d', '--day', type=int, nargs='*', help='the day(s) of advent to benchmark', default=None)
+    parser.add_argument('-p', '--part', type=int, nargs='*', help='the part(s) to benchmark', default=[1, 2])
+    parser.add_argument('-n', '--runs', type=int, help='timed repetitions per case', default=5)
+    parser.add_argument('-w', '--warmup', type=int, help='untimed repetitions per case', default=1)
+    parser.add_argument('-t', '--timeout', type=float, help='time limit per case in seconds', default=60)
+    parser.add_argument('--threshold', type=float, help='allowed relative slowdown', default=0.25)
+    parser.add_argument('--memory', type=float, help='allowed relative peak memory growth', default=0.25)
+    parser.add_argument('--baseline', type=str, help='baseline JSON file', default=str(BASELINE))
+    parser.add_argument('--save', action='store_true', help='store these measurements as the new baseline')
+    args = parser.parse_args()
+
+    baseline_path = Path(args.baseline)
+    baseline = load_baseline(baseline_path)
+    rows = []
+    for d in discover(args.year, args.day):
+        for p in args.part:
+            for source in inputs(d):
+                m = measure(d, p, source, args.runs, args.warmup, args.timeout)
+                rows.append((m, baseline.get(m.key), compare(m, baseline.get(m.key), args.threshold, args.memory)))
+    print(report(rows))
+    if args.save:
+        save_baseline([m for m, _, _ in rows], baseline_path)
+    elif any(v.startswith('REGRESSION') for _, _, v in rows):
+        raise SystemExit(1)
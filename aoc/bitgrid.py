@@ -0,0 +1,144 @@
+"""Sets of grid cells as the bits of one Python integer, so a whole BFS layer is a few word-level operations
+
+Cell (row, column) is bit row * stride + column, where stride = cols + 1 leaves one always-clear guard
+bit at the end of every row. Shifting the integer by one moves every cell east or west, and by a
+stride north or south. Every shifted result is masked back onto the grid, whose guard bits are clear,
+so single east and west steps never wrap onto the next row; shift() drops the columns a longer step
+would carry across the edge before moving them.
+
+    reach = reach.neighbours() & garden        # one breadth-first layer, for every cell at once
+    reach.count()                              # popcount
+
+Positions are (row, column) pairs, as in aoc.grid. Operands of &, | and ^ must have the same shape.
+"""
+from __future__ import annotations
+from dataclasses import dataclass
+from functools import lru_cache
+
+
+@lru_cache(maxsize=64)
+def _full(rows: int, cols: int) -> int:
+    return _columns(rows, cols, 0, cols)
+
+
+@lru_cache(maxsize=256)
+def _columns(rows: int, cols: int, first: int, last: int) -> int:
+    """The bits of columns first to last - 1 of every row"""
+    stride = cols + 1
+    if last <= first:
+        return 0
+    # one row's run of set bits times the repunit with a 1 at the start of every row
+    return (((1 << (last - first)) - 1) << first) * (((1 << (rows * stride)) - 1) // ((1 << stride) - 1))
+
+
+@dataclass(frozen=True)
+class BitGrid:
+    rows: int
+    cols: int
+    bits: int = 0
+
+    @property
+    def stride(self) -> int:
+        return self.cols + 1
+
+    @property
+    def full(self) -> int:
+        """Every in-grid bit set, the guard bits clear"""
+        return _full(self.rows, self.cols)
+
+    @classmethod
+    def from_lines(cls, lines: list[str], chars: str = '.'):
+        """The cells holding any of chars"""
+        cols = len(lines[0]) if lines else 0
+        if any(len(line) != cols for line in lines):
+            raise ValueError('Lines of a grid must all have the same length')
+        table = str.maketrans({c: '1' if c in chars else '0' for c in set(''.join(lines))})
+        # bit 0 is column 0 of row 0, so each row's characters are reversed into binary digits
+        text = '0'.join(line.translate(table)[::-1] for line in reversed(lines))
+        return cls(len(lines), cols, int(text, 2) if text else 0)
+
+    @classmethod
+    def from_cells(cls, rows: int, cols: int, cells):
+        stride = cols + 1
+        bits = 0
+        for r, c in cells:
+            bits |= 1 << (r * stride + c)
+        return cls(rows, cols, bits)
+
+    def _like(self, bits: int) -> BitGrid:
+        return BitGrid(self.rows, self.cols, bits)
+
+    def __and__(self, other: BitGrid) -> BitGrid:
+        return self._like(self.bits & other.bits)
+
+    def __or__(self, other: BitGrid) -> BitGrid:
+        return self._like(self.bits | other.bits)
+
+    def __xor__(self, other: BitGrid) -> BitGrid:
+        return self._like(self.bits ^ other.bits)
+
+    def __invert__(self) -> BitGrid:
+        return self._like(self.full & ~self.bits)
+
+    def __bool__(self):
+        return self.bits != 0
+
+    def __contains__(self, cell: tuple[int, int]) -> bool:
+        r, c = cell
+        return 0 <= r < self.rows and 0 <= c < self.cols and (self.bits >> (r * self.stride + c)) & 1 == 1
+
+    def count(self) -> int:
+        return self.bits.bit_count()
+
+    def shift(self, dr: int, dc: int) -> BitGrid:
+        """Every cell moved by (dr, dc); cells moved off the grid are dropped"""
+        bits = self.bits
+        if dc:
+            # one guard bit only stops a single column step; further, drop the columns which would cross an edge
+            bits &= _columns(self.rows, self.cols, max(0, -dc), min(self.cols, self.cols - dc))
+        by = dr * self.stride + dc
+        bits = bits << by if by >= 0 else bits >> -by
+        return self._like(bits & self.full)
+
+    def neighbours(self) -> BitGrid:
+        """The cells one N, S, E or W step from any cell, unmasked except for the guard bits and the edges"""
+        b, s = self.bits, self.stride
+        return self._like(((b << 1) | (b >> 1) | (b << s) | (b >> s)) & self.full)
+
+    def dilate(self) -> BitGrid:
+        """These cells and their neighbours"""
+        return self | self.neighbours()
+
+    def tile(self, down: int, across: int) -> BitGrid:
+        """This grid repeated down x across times"""
+        stride = self.stride
+        row_mask = (1 << self.cols) - 1
+        rows = [(self.bits >> (r * stride)) & row_mask for r in range(self.rows)]
+        wide = []
+        for row in rows:
+            repeated = 0
+            for i in range(across):
+                repeated |= row << (i * self.cols)
+            wide.append(repeated)
+        cols = self.cols * across
+        bits = 0
+        for r, row in enumerate(wide * down):
+            bits |= row << (r * (cols + 1))
+        return BitGrid(self.rows * down, cols, bits)
+
+    def cells(self) -> list[tuple[int, int]]:
+        found = []
+        bits, stride = self.bits, self.stride
+        while bits:
+            low = bits & -bits
+            index = low.bit_length() - 1
+            found.append(divmod(index, stride))
+            bits ^= low
+        return found
+
+    def to_lines(self, on: str = '#', off: str = '.') -> list[str]:
+        text = bin(self.bits)[2:].zfill(self.rows * self.stride)[::-1].translate(str.maketrans('01', off + on))
+        return [text[r * self.stride:r * self.stride + self.cols] for r in range(self.rows)]
+
+    def __str__(self):
+        return '\n'.join(self.to_lines())
@@ -0,0 +1,125 @@
+"""Snapshots of a long search's progress on disk, so that an interrupted run resumes where it stopped
+
+    with Checkpoint('y15d04', key, n) as checkpoint:
+        start = checkpoint.state or 0               # None unless an earlier run left a snapshot
+        for i in range(start, limit):
+            ...
+            if checkpoint.due():
+                checkpoint.save(i)                  # the counter, the pending stack, the best so far, ...
+
+Checkpointing is opt-in: with $AOC_CHECKPOINT unset (or '0') state is always None and due() always False,
+so a search pays one method call per check. Set it to '1' for CACHE/checkpoints, or to another
+directory. Snapshots are written at most every $AOC_CHECKPOINT_INTERVAL seconds (default 30).
+
+A snapshot is named by the search and the repr of its key, so the key must identify the inputs. It is
+pickled to a temporary file which then replaces the last snapshot, so killing a run mid-write leaves
+the previous snapshot whole. Leaving the with block normally deletes the snapshot; leaving it by an
+exception (KeyboardInterrupt, ...) or being killed keeps the last one for the next run. A snapshot does
+not know the code which wrote it, so `python -m aoc.checkpoint clear` after changing a search's state.
+"""
+from __future__ import annotations
+import os
+from pathlib import Path
+from time import monotonic, time
+
+from aoc.inputs import CACHE
+
+DIRECTORY = CACHE.joinpath('checkpoints')
+
+
+def location() -> Path | None:
+    """The snapshot directory named by $AOC_CHECKPOINT, or None if checkpointing is off"""
+    setting = os.environ.get('AOC_CHECKPOINT', '')
+    if setting in ('', '0'):
+        return None
+    return DIRECTORY if setting == '1' else Path(setting)
+
+
+def interval() -> float:
+    return float(os.environ.get('AOC_CHECKPOINT_INTERVAL', '30'))
+
+
+class Checkpoint:
+    def __init__(self, name: str, *key, every: float | None = None, directory: Path | str | None = None):
+        from hashlib import sha256
+        self.name = name
+        self.key = repr(key)
+        self.directory = location() if directory is None else Path(directory)
+        self.every = interval() if every is None else every
+        self.enabled = self.directory is not None
+        digest = sha256(self.key.encode()).hexdigest()[:16]
+        self.path = self.directory.joinpath(f'{name}-{digest}.pickle') if self.enabled else None
+        self.state = self.load()
+        self.resumed = self.state is not None
+        self._next = monotonic() + self.every
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, kind, value, traceback):
+        if kind is None:
+            self.discard()
+        return False
+
+    def load(self):
+        """The state of the last snapshot of this search, or None"""
+        if not self.enabled or not self.path.exists():
+            return None
+        from pickle import load
+        with self.path.open('rb') as file:
+            snapshot = load(file)
+        # two keys sharing a digest prefix must not resume each other
+        return snapshot['state'] if snapshot['key'] == self.key else None
+
+    def due(self) -> bool:
+        """Whether the interval since the last snapshot has passed"""
+        return self.enabled and monotonic() >= self._next
+
+    def save(self, state):
+        """Snapshot state, replacing the last snapshot only once the new one is completely written"""
+        if not self.enabled:
+            return
+        from pickle import dump
+        from tempfile import NamedTemporaryFile
+        self.directory.mkdir(parents=True, exist_ok=True)
+        with NamedTemporaryFile('wb', dir=self.directory, prefix=f'.{self.name}-', delete=False) as file:
+            dump({'name': self.name, 'key': self.key, 'saved': time(), 'state': state}, file)
+            file.flush()
+            os.fsync(file.fileno())
+        os.replace(file.name, self.path)
+        self.state = state
+        self._next = monotonic() + self.every
+
+    def discard(self):
+        if self.enabled:
+            self.path.unlink(missing_ok=True)
+
+
+def snapshots(directory: Path | str | None = None) -> list[tuple[str, float, int, Path]]:
+    """The (name, saved time, size, path) of every snapshot in directory"""
+    from pickle import load
+    directory = Path(directory or location() or DIRECTORY)
+    found = []
+    for path in sorted(directory.glob('*.pickle')):
+        with path.open('rb') as file:
+            snapshot = load(file)
+        found.append((snapshot['name'], snapshot['saved'], path.stat().st_size, path))
+    return found
+
+
+if __name__ == '__main__':
+    from argparse import ArgumentParser
+    from datetime import datetime
+    parser = ArgumentParser(description='List or remove the snapshots of interrupted searches')
+    parser.add_argument('command', choices=('list', 'clear'))
+    parser.add_argument('names', nargs='*', help='only the snapshots of these searches')
+    parser.add_argument('--directory', type=str, help='the snapshot directory', default=str(location() or DIRECTORY))
+    args = parser.parse_args()
+
+    for name, saved, size, path in snapshots(args.directory):
+        if args.names and name not in args.names:
+            continue
+        if args.command == 'list':
+            print(f'{name:20s} {datetime.fromtimestamp(saved):%Y-%m-%d %H:%M:%S} {size:10d} {path.name}')
+        else:
+            path.unlink()
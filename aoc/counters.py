@@ -0,0 +1,115 @@
+"""Named operation counters, to tell whether a change did less work or only did the same work faster
+
+    expanded = 0
+    while queue:
+        ...
+        expanded += 1                               # a plain local in the hot loop
+    counters.add('dial.expanded', expanded)         # once per search
+
+Counting is off unless enabled, by enable() or $AOC_COUNTERS, and add() then returns at once; hot loops
+count into locals and add their totals once per call, so a disabled counter costs an integer increment
+in the loop and nothing else. Memoised functions already count their hits and misses (aoc.memo), and
+collect() adds those made while it is open as '<function>.hits' and '<function>.misses'.
+
+Like aoc.timer's Registry, a forked child starts with empty counts; send its counts() back to the parent
+and merge() them there.
+"""
+from __future__ import annotations
+import os
+from contextlib import contextmanager
+
+_enabled = os.environ.get('AOC_COUNTERS', '') not in ('', '0')
+
+
+class Counters:
+    """Totals per counter name, safe to share between threads"""
+
+    def __init__(self):
+        from threading import Lock
+        self._lock = Lock()
+        self._counts: dict[str, int] = {}
+
+    def _after_fork(self):
+        from threading import Lock
+        self._lock = Lock()
+        self._counts = {}
+
+    def add(self, name: str, n: int = 1) -> None:
+        with self._lock:
+            self._counts[name] = self._counts.get(name, 0) + n
+
+    def merge(self, counts: dict[str, int]) -> None:
+        with self._lock:
+            for name, n in counts.items():
+                self._counts[name] = self._counts.get(name, 0) + n
+
+    def counts(self) -> dict[str, int]:
+        with self._lock:
+            return dict(sorted(self._counts.items()))
+
+    def clear(self) -> None:
+        with self._lock:
+            self._counts.clear()
+
+    def report(self) -> str:
+        return report(self.counts())
+
+
+COUNTERS = Counters()
+if hasattr(os, 'register_at_fork'):
+    os.register_at_fork(after_in_child=COUNTERS._after_fork)
+
+
+def enabled() -> bool:
+    return _enabled
+
+
+def enable(on: bool = True):
+    global _enabled
+    _enabled = on
+
+
+def add(name: str, n: int = 1) -> None:
+    if _enabled:
+        COUNTERS.add(name, n)
+
+
+def _memo_counts() -> dict[str, tuple[int, int]]:
+    from aoc.memo import stats
+    return {s.name: (s.hits, s.misses) for s in stats()}
+
+
+@contextmanager
+def collect():
+    """Count everything done in the with block, into the dict it yields, filled when the block ends"""
+    global _enabled
+    counts = {}
+    was, _enabled = _enabled, True
+    before, memos = COUNTERS.counts(), _memo_counts()
+    try:
+        yield counts
+    finally:
+        _enabled = was
+        found = {name: n - before.get(name, 0) for name, n in COUNTERS.counts().items() if n != before.get(name, 0)}
+        for name, (hits, misses) in _memo_counts().items():
+            hits0, misses0 = memos.get(name, (0, 0))
+            if misses != misses0 or hits != hits0:
+                found[f'{name}.hits'] = hits - hits0
+                found[f'{name}.misses'] = misses - misses0
+        counts.update(sorted(found.items()))
+
+
+def report(counts: dict[str, int], baseline: dict[str, int] | None = None) -> str:
+    width = max([len(name) for name in counts] + [7])
+    header = f'{"counter":{width}s} {"count":>14s}'
+    lines = [header + (f' {"baseline":>14s} {"ratio":>7s}' if baseline is not None else '')]
+    for name, n in counts.items():
+        line = f'{name:{width}s} {n:14d}'
+        if baseline is not None:
+            before = baseline.get(name)
+            if before is None:
+                line += f' {"-":>14s} {"-":>7s}'
+            else:
+                line += f' {before:14d} {n / before if before else float("nan"):7.3f}'
+        lines.append(line)
+    return '\n'.join(lines)
@@ -0,0 +1,149 @@
+"""NumPy compressed sparse row graphs over integer state ids, built from a grid and a move rule
+
+On a (ny, nx) grid with k directions the state of a walker at cell = y * nx + x facing direction d
+is cell * k + d, so no Python object is created per state or edge. Each move is applied to the
+whole grid at once, and a state's edges come out already in row order. Indices are int32 whenever
+the graph is small enough, which keeps tens of millions of states within a few hundred MB.
+"""
+from __future__ import annotations
+
+from aoc import counters
+from aoc.lazy import module
+from aoc.search import CSR, Paths
+
+np = module('numpy')
+
+
+def index_dtype(size: int):
+    return np.int32 if size < (1 << 31) else np.int64
+
+
+def weight_dtype(weights):
+    """The narrowest unsigned type holding every (non-negative) weight"""
+    return np.min_scalar_type(int(np.max(weights, initial=0)))
+
+
+def shift(shape: tuple[int, int], dx: int, dy: int):
+    """Matching (source, target) slices of a (ny, nx) array for a step of (dx, dy)"""
+    ny, nx = shape
+    source = slice(max(0, -dy), max(0, ny - dy)), slice(max(0, -dx), max(0, nx - dx))
+    target = slice(max(0, dy), max(0, ny + dy)), slice(max(0, dx), max(0, nx + dx))
+    return source, target
+
+
+def from_table(targets: np.ndarray, weights) -> CSR:
+    """A CSR from a (states, moves) table of target states, with -1 where a move is not possible"""
+    valid = targets >= 0
+    size = targets.shape[0]
+    dtype = index_dtype(max(size, int(valid.sum())))
+    indptr = np.zeros(size + 1, dtype=dtype)
+    np.cumsum(valid.sum(axis=1, dtype=dtype), out=indptr[1:])
+    indices = targets[valid].astype(dtype, copy=False)
+    weights = np.broadcast_to(np.asarray(weights, dtype=weight_dtype(weights)), targets.shape)[valid]
+    return CSR(indptr, indices, weights)
+
+
+def from_edges(sources, targets, weights, size: int) -> CSR:
+    """A CSR from parallel edge arrays in any order, parallel edges are all kept"""
+    sources = np.asarray(sources)
+    order = np.argsort(sources, kind='stable')
+    dtype = index_dtype(max(size, len(order)))
+    indptr = np.zeros(size + 1, dtype=dtype)
+    np.cumsum(np.bincount(sources, minlength=size), out=indptr[1:])
+    indices = np.asarray(targets)[order].astype(dtype, copy=False)
+    weights = np.broadcast_to(np.asarray(weights, dtype=weight_dtype(weights)), sources.shape)[order]
+    return CSR(indptr, indices, weights)
+
+
+def transpose(graph: CSR) -> CSR:
+    """The reverse graph, with every edge pointing the other way"""
+    flipped = matrix(graph).T.tocsr()
+    return CSR(flipped.indptr, flipped.indices, flipped.data)
+
+
+def matrix(graph: CSR):
+    """A SciPy sparse array sharing the graph's arrays, explicit zero weights are kept as edges"""
+    from scipy.sparse import csr_array
+    size = graph.size
+    weights = np.ones(len(graph.indices), dtype=np.uint8) if graph.weights is None else graph.weights
+    return csr_array((weights, graph.indices, graph.indptr), shape=(size, size))
+
+
+def cells(open_cells: np.ndarray, offsets, weight: int = 1) -> CSR:
+    """Steps between neighbouring open cells, one state per cell"""
+    open_cells = np.asarray(open_cells, dtype=bool)
+    ny, nx = open_cells.shape
+    dtype = index_dtype(ny * nx)
+    ids = np.arange(ny * nx, dtype=dtype).reshape(ny, nx)
+    table = np.full((ny, nx, len(offsets)), -1, dtype=dtype)
+    for j, (dx, dy) in enumerate(offsets):
+        source, target = shift(open_cells.shape, dx, dy)
+        table[source + (j,)] = np.where(open_cells[source] & open_cells[target], ids[target], -1)
+    return from_table(table.reshape(ny * nx, len(offsets)), weight)
+
+
+def states(open_cells: np.ndarray, offsets, moves) -> CSR:
+    """Edges between (cell, direction) states, with state id cell * len(offsets) + direction
+
+    Each move is a (turn, advance, weight) triple: from direction d the walker turns to
+    (d + turn) % len(offsets), then steps advance cells that way, onto an open cell.
+    """
+    open_cells = np.asarray(open_cells, dtype=bool)
+    ny, nx = open_cells.shape
+    k = len(offsets)
+    dtype = index_dtype(ny * nx * k)
+    ids = np.arange(ny * nx, dtype=dtype).reshape(ny, nx) * k
+    table = np.full((ny, nx, k, len(moves)), -1, dtype=dtype)
+    for d in range(k):
+        for j, (turn, advance, _) in enumerate(moves):
+            e = (d + turn) % k
+            dx, dy = offsets[e]
+            source, target = shift(open_cells.shape, dx * advance, dy * advance)
+            ok = open_cells[source] & open_cells[target]
+            table[source + (d, j)] = np.where(ok, ids[target] + e, -1)
+    return from_table(table.reshape(ny * nx * k, len(moves)), [w for _, _, w in moves])
+
+
+def shortest(graph: CSR, sources) -> Paths:
+    """Dijkstra from one or more source states (each at distance zero) in compiled code
+
+    Returns int64 distances with -1 for unreached states, and the predecessors with -1 for none.
+    """
+    from scipy.sparse.csgraph import dijkstra
+    sources = np.atleast_1d(np.asarray(sources))
+    distance, previous, _ = dijkstra(matrix(graph), indices=sources, return_predecessors=True, min_only=True)
+    unreached = np.isinf(distance)
+    distance[unreached] = -1
+    if counters.enabled():
+        # compiled Dijkstra settles every state it reaches, and relaxes every edge leaving them
+        reached = np.flatnonzero(~unreached)
+        counters.add('csr.shortest.expanded', len(reached))
+        counters.add('csr.shortest.relaxed', int((graph.indptr[reached + 1] - graph.indptr[reached]).sum()))
+    previous[previous < 0] = -1
+    return Paths(distance.astype(np.int64), previous)
+
+
+if __name__ == '__main__':
+    from time import perf_counter
+    import tracemalloc
+    n = 2000
+    rng = np.random.default_rng(1)
+    walls = rng.random((n, n)) < 0.3
+    walls[0, :] = walls[-1, :] = walls[:, 0] = walls[:, -1] = True
+    walls[n - 2, 1] = walls[1, n - 2] = False
+    directions = (0, 1), (1, 0), (0, -1), (-1, 0)
+    tracemalloc.start()
+    start = perf_counter()
+    forward = states(~walls, directions, ((0, 1, 1), (1, 0, 1000), (-1, 0, 1000)))
+    built = perf_counter() - start
+    reverse = transpose(forward)
+    flipped = perf_counter() - start - built
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    paths = shortest(forward, ((n - 2) * n + 1) * 4 + 1)
+    searched = perf_counter() - start - built - flipped
+    goal = ((1 * n + n - 2) * 4 + np.arange(4))
+    print(f'{forward.size} states, {len(forward.indices)} edges: built in {built:0.2f} s, '
+          f'reversed in {flipped:0.2f} s using {peak / 2**20:0.0f} MB, searched in {searched:0.2f} s')
+    reached = paths.distance[goal][paths.distance[goal] >= 0]
+    print(f'cheapest path {reached.min() if len(reached) else "not found"}')
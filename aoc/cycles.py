@@ -0,0 +1,132 @@
+"""Cycle finding for deterministic simulations, to answer "after N steps" without running N steps
+
+A simulation is a start state and a step function returning the next state, or None once it ends.
+States are compared through key(state), which should be small, hashable and equal exactly when the
+states are: a sorted tuple of rock positions rather than the board they sit on, for example.
+
+    lead, period = brent(start, step, key)            # constant memory, simulates about 3 (lead + period) steps
+    cycle = history(start, step, key, observe)        # remembers each key once, and an observable per step
+    cycle.at(10 ** 18)                                # the observable after any number of steps, no simulation
+
+A sequence which reaches no repeat because its step returned None has no cycle, and both return None.
+"""
+from __future__ import annotations
+from dataclasses import dataclass, field
+from typing import Any, Callable, Hashable
+
+from aoc import counters
+
+
+def _identity(state):
+    return state
+
+
+@dataclass
+class Cycle:
+    """States lead .. lead + period - 1 repeat forever; observed[i] is the observable after i steps"""
+    lead: int
+    period: int
+    observed: list = field(default_factory=list)
+
+    def index(self, n: int) -> int:
+        """The step within the first lead + period whose state matches the state after n steps"""
+        return n if n < self.lead else self.lead + (n - self.lead) % self.period
+
+    def at(self, n: int):
+        return self.observed[self.index(n)]
+
+
+def brent(start, step: Callable[[Any], Any], key: Callable[[Any], Hashable] = _identity) -> tuple[int, int] | None:
+    """The lead-in and period of the states reached from start, by Brent's algorithm, or None if they end"""
+    if (lam := period(start, step, key)) is None:
+        return None
+    # a hare lam steps ahead of the tortoise meets it exactly when the tortoise enters the cycle
+    hare = start
+    for _ in range(lam):
+        hare = step(hare)
+    tortoise, mu = start, 0
+    while key(tortoise) != key(hare):
+        tortoise, hare, mu = step(tortoise), step(hare), mu + 1
+    return mu, lam
+
+
+def period(start, step: Callable[[Any], Any], key: Callable[[Any], Hashable] = _identity) -> int | None:
+    """The period of the states reached from start, or None if they end; only two states are kept"""
+    power = lam = steps = 1
+    tortoise = key(start)
+    if (hare := step(start)) is None:
+        counters.add('cycles.steps', steps)
+        return None
+    while tortoise != (hare_key := key(hare)):
+        if power == lam:
+            # teleport the tortoise to the hare, and give it twice as long to be caught
+            tortoise, power, lam = hare_key, power * 2, 0
+        steps += 1
+        if (hare := step(hare)) is None:
+            counters.add('cycles.steps', steps)
+            return None
+        lam += 1
+    counters.add('cycles.steps', steps)
+    return lam
+
+
+def search(start, step: Callable[[Any], Any], predicate: Callable[[Any], bool],
+           key: Callable[[Any], Hashable] = _identity) -> int | None:
+    """The first number of steps after which predicate holds, or None if it never does before the states repeat
+
+    Brent's algorithm runs alongside, so an exhausted search stops once every distinct state has been seen.
+    """
+    power = lam = 1
+    steps, state = 0, start
+    tortoise = key(start)
+    found = None
+    while True:
+        if predicate(state):
+            found = steps
+            break
+        if (state := step(state)) is None:
+            break
+        steps += 1
+        if tortoise == (state_key := key(state)):
+            break
+        if power == lam:
+            tortoise, power, lam = state_key, power * 2, 0
+        lam += 1
+    counters.add('cycles.steps', steps)
+    return found
+
+
+def history(start, step: Callable[[Any], Any], key: Callable[[Any], Hashable] = _identity,
+            observe: Callable[[Any], Any] | None = None, limit: int | None = None) -> Cycle | None:
+    """Find the cycle by remembering every key, recording observe(state) (the state itself by default) per step
+
+    Returns None if the states end, or if no state repeats within limit steps.
+    """
+    observe = _identity if observe is None else observe
+    seen = {}
+    observed = []
+    state, steps = start, 0
+    while (k := key(state)) not in seen:
+        if limit is not None and steps > limit:
+            counters.add('cycles.steps', steps)
+            return None
+        seen[k] = steps
+        observed.append(observe(state))
+        if (state := step(state)) is None:
+            counters.add('cycles.steps', steps + 1)
+            return None
+        steps += 1
+    counters.add('cycles.steps', steps)
+    return Cycle(seen[k], steps - seen[k], observed)
+
+
+def after(start, step: Callable[[Any], Any], n: int, key: Callable[[Any], Hashable] = _identity):
+    """The state after n steps, simulating at most a few times lead + period steps whatever n is"""
+    found = brent(start, step, key)
+    if found is not None:
+        n = Cycle(*found).index(n)
+    state = start
+    for _ in range(n):
+        if (state := step(state)) is None:
+            return None
+    return state
@@ -0,0 +1,136 @@
+from __future__ import annotations
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Callable
+
+ROOT = Path(__file__).resolve().parent.parent
+SOURCE = ROOT.joinpath('src')
+
+
+def first_line(lines: list[str]) -> str:
+    return lines[0]
+
+
+def integer_rows(lines: list[str]) -> list[list[int]]:
+    from aoc.parse import ragged, rows
+    return rows(*ragged(lines))
+
+
+# Days whose part functions do not take the raw puzzle lines, keyed by (year, day) then part
+ADAPTERS: dict[tuple[int, int], dict[int, Callable[[Any, list[str]], Any]]] = {
+    (2015, 1): {1: lambda m, lines: m.find_floor(first_line(lines)),
+                2: lambda m, lines: m.enters_basement_at(first_line(lines))},
+    (2015, 2): {1: lambda m, lines: m.total_paper_required(lines),
+                2: lambda m, lines: m.total_ribbon_required(lines)},
+    (2015, 4): {1: lambda m, lines: m.find_first_hash_with_n_leading_zeros(first_line(lines), 5),
+                2: lambda m, lines: m.find_first_hash_with_n_leading_zeros(first_line(lines), 6)},
+    (2023, 9): {1: lambda m, lines: m.part1(integer_rows(lines)),
+                2: lambda m, lines: m.part2(integer_rows(lines))},
+    (2023, 10): {1: lambda m, lines: m.part1(m.PipeMap.from_strings(lines)),
+                 2: lambda m, lines: m.part2(m.PipeMap.from_strings(lines))},
+    (2023, 13): {1: lambda m, lines: m.part1(m.AshMap.decode_input(lines)),
+                 2: lambda m, lines: m.part2(m.AshMap.decode_input(lines))},
+    (2023, 15): {1: lambda m, lines: m.part1(first_line(lines)),
+                 2: lambda m, lines: m.part2(first_line(lines))},
+}
+
+
+@dataclass(frozen=True, order=True)
+class Day:
+    year: int
+    day: int
+    path: Path
+
+    @property
+    def name(self):
+        return f'y{self.year % 100:02d}d{self.day:02d}'
+
+    def module(self, fresh: bool = False):
+        """Import the solution script by path, once per process unless a fresh copy (with empty caches) is asked for"""
+        import sys
+        from importlib.util import spec_from_file_location, module_from_spec
+        if self.name in sys.modules and not fresh:
+            return sys.modules[self.name]
+        spec = spec_from_file_location(self.name, self.path)
+        module = module_from_spec(spec)
+        # dataclasses look up the defining module while the class body is being processed
+        sys.modules[self.name] = module
+        try:
+            spec.loader.exec_module(module)
+        except BaseException:
+            del sys.modules[self.name]
+            raise
+        return module
+
+    def examples(self) -> list[Path]:
+        """The checked-in example inputs next to the script"""
+        return sorted(self.path.parent.glob('*.test'))
+
+    def cached(self) -> list[Path]:
+        """Puzzle inputs saved next to the script or in the input cache, which are never checked in"""
+        from aoc.inputs import path
+        local = self.path.parent.joinpath(f'{self.name}.txt')
+        return [p for p in (local, path(self.year, self.day)) if p.exists()]
+
+    def solver(self, part: int, fresh: bool = False) -> Callable[[list[str]], Any]:
+        """Find the callable which answers one part of the puzzle from its input lines"""
+        module = self.module(fresh)
+        if part in (adapted := ADAPTERS.get((self.year, self.day), {})):
+            return lambda lines: adapted[part](module, lines)
+        if hasattr(module, f'part{part}'):
+            return getattr(module, f'part{part}')
+        if hasattr(module, 'parts'):
+            return lambda lines: module.parts(lines)[part - 1]
+        if hasattr(module, 'solve'):
+            return lambda lines: module.solve(lines, part)
+        if hasattr(module, 'part'):
+            return lambda lines: module.part(lines, number=part)
+        raise ValueError(f'{self.name} has no entry point for part {part}')
+
+
+def discover(years: list[int] | None = None, days: list[int] | None = None) -> list[Day]:
+    """Find every src/YY/DD/yYYdDD.py solution script, optionally filtered by year and day"""
+    import re
+    pattern = re.compile(r'y(?P<year>\d\d)d(?P<day>\d\d)\.py')
+    found = []
+    for path in SOURCE.glob('*/*/y*d*.py'):
+        if (m := pattern.fullmatch(path.name)) is None:
+            continue
+        year, day = 2000 + int(m['year']), int(m['day'])
+        if years and year not in years and year % 100 not in years:
+            continue
+        if days and day not in days:
+            continue
+        found.append(Day(year, day, path))
+    return sorted(found)
+
+
+def find(year: int, day: int) -> Day:
+    found = discover([year], [day])
+    if len(found) != 1:
+        raise ValueError(f'No solution found for {year} day {day}')
+    return found[0]
+
+
+def deadline(seconds: float | None):
+    """Raise TimeoutError in the current (main) thread if the block runs longer than seconds"""
+    from contextlib import contextmanager
+    import signal
+
+    def expired(signum, frame):
+        raise TimeoutError(f'exceeded {seconds} s')
+
+    @contextmanager
+    def limited():
+        if not seconds:
+            yield
+            return
+        previous = signal.signal(signal.SIGALRM, expired)
+        signal.setitimer(signal.ITIMER_REAL, seconds)
+        try:
+            yield
+        finally:
+            signal.setitimer(signal.ITIMER_REAL, 0)
+            signal.signal(signal.SIGALRM, previous)
+
+    return limited()
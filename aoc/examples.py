@@ -0,0 +1,264 @@
+"""The example asserts of every day's __main__ block, collected as separate cases and run in parallel, offline
+
+    cases = collect(years=[23])             # one Example per assert, with the statements it depends on
+    for result in run(cases):               # in completion order
+        print(result.name, result.status, result.message)
+
+A day's __main__ block mixes asserts on the puzzle examples with fetching and solving the real input, so
+running the script checks nothing without the network. Here only the asserts are taken from the block,
+each with the earlier assignments it reads (`test_values = read_values('y23d11.test')`), the imports
+and the local function definitions; `puzzle = fetch_lines(...)` and the printing are never run.
+
+Cases run in a process pool, grouped per day so that a worker imports the day once, with the working
+directory set to the day's, where relative fixture names point. Fixture loads, calls of get_*, read_*,
+load_*, example* or *.from_* on constant arguments, are parsed once per worker and each case gets a deep copy,
+so a case mutating its grid does not change the next one's. A case whose fixture file is not checked in,
+or which needs a missing OPTIONAL module, is skipped; any other missing file or module fails it.
+
+`python -m pytest tests` runs the same cases as parametrized tests; `python -m aoc.examples` prints them.
+"""
+from __future__ import annotations
+import ast
+from dataclasses import dataclass
+from typing import Iterator
+
+from aoc.days import Day
+
+LOADERS = ('get_', 'read_', 'load_', 'from_', 'example')
+# modules some days import for plots or alternatives, which a case may skip without; any other is an error
+OPTIONAL = {'matplotlib'}
+
+_FIXTURES: dict[tuple[str, str], object] = {}
+
+
+@dataclass(frozen=True, order=True)
+class Example:
+    day: Day
+    line: int
+    text: str
+    code: str
+    fixtures: tuple[str, ...] = ()
+
+    @property
+    def name(self) -> str:
+        return f'{self.day.name}:{self.line}'
+
+    def __str__(self):
+        return self.name
+
+
+@dataclass
+class Outcome:
+    example: Example
+    status: str = 'passed'
+    seconds: float = 0.0
+    message: str = ''
+
+    @property
+    def name(self) -> str:
+        return self.example.name
+
+
+def _main_block(tree: ast.Module) -> list[ast.stmt]:
+    for node in tree.body:
+        if (isinstance(node, ast.If) and isinstance(node.test, ast.Compare)
+                and isinstance(node.test.left, ast.Name) and node.test.left.id == '__name__'):
+            return node.body
+    return []
+
+
+def _names(node: ast.AST) -> set[str]:
+    return {n.id for n in ast.walk(node) if isinstance(n, ast.Name) and isinstance(n.ctx, ast.Load)}
+
+
+def _targets(node: ast.stmt) -> set[str]:
+    targets = node.targets if isinstance(node, ast.Assign) else [node.target]
+    return {n.id for t in targets for n in ast.walk(t) if isinstance(n, ast.Name)}
+
+
+def _loader(node: ast.AST) -> bool:
+    """Whether node loads a fixture: get_lines('y23d17.test'), AshMap.from_file(...), from_lines(get_lines(...))"""
+    if isinstance(node, ast.Constant):
+        return True
+    if not isinstance(node, ast.Call) or node.keywords:
+        return False
+    if isinstance(node.func, ast.Name):
+        name = node.func.id
+    elif isinstance(node.func, ast.Attribute) and isinstance(node.func.value, ast.Name):
+        name = node.func.attr
+    else:
+        return False
+    return name.startswith(LOADERS) and all(_loader(arg) for arg in node.args)
+
+
+class _Fixtures(ast.NodeTransformer):
+    """Replace the outermost fixture loads by __fixture__('<load>'), which parses each load once per worker"""
+    def __init__(self):
+        self.loads = []
+
+    def visit_Call(self, node):
+        if _loader(node):
+            self.loads.append(ast.unparse(node))
+            return ast.Call(ast.Name('__fixture__', ast.Load()), [ast.Constant(self.loads[-1])], [])
+        return self.generic_visit(node)
+
+
+def _check(test: ast.expr) -> list[ast.stmt]:
+    """Statements raising AssertionError with both sides of a failed `a == b` in its message"""
+    if isinstance(test, ast.Compare) and len(test.ops) == 1 and isinstance(test.ops[0], ast.Eq):
+        code = (f'__got__ = {ast.unparse(test.left)}\n__expected__ = {ast.unparse(test.comparators[0])}\n'
+                f'if __got__ != __expected__:\n'
+                f'    raise AssertionError(f"got {{__got__!r}}, expected {{__expected__!r}}")')
+        return ast.parse(code).body
+    return [ast.Assert(test, ast.Constant(f'not {ast.unparse(test)}'))]
+
+
+def examples(day: Day) -> list[Example]:
+    """One Example for each assert at the top level of the day's __main__ block"""
+    source = day.path.read_text()
+    block = _main_block(ast.parse(source))
+    found = []
+    for index, statement in enumerate(block):
+        if not isinstance(statement, ast.Assert):
+            continue
+        needed, wanted = [], _names(statement.test)
+        for earlier in reversed(block[:index]):
+            if isinstance(earlier, (ast.Import, ast.ImportFrom, ast.FunctionDef)):
+                needed.append(earlier)
+            elif isinstance(earlier, (ast.Assign, ast.AnnAssign)) and _targets(earlier) & wanted:
+                needed.append(earlier)
+                wanted |= _names(earlier.value)
+        body = [ast.fix_missing_locations(s) for s in reversed(needed)] + _check(statement.test)
+        transformer = _Fixtures()
+        body = [transformer.visit(s) for s in body]
+        found.append(Example(day, statement.lineno, ast.get_source_segment(source, statement),
+                             ast.unparse(ast.Module(body, [])), tuple(transformer.loads)))
+    return found
+
+
+def collect(years: list[int] | None = None, days: list[int] | None = None) -> list[Example]:
+    from aoc.days import discover
+    return [example for day in discover(years, days) for example in examples(day)]
+
+
+class MissingFixture(Exception):
+    """A fixture file which a load names and which is not checked in next to the day's script"""
+
+
+def _named(load: str) -> list[str]:
+    """The strings and called function names in a load, one of which a fixture file is named after"""
+    nodes = list(ast.walk(ast.parse(load)))
+    return ([node.value for node in nodes if isinstance(node, ast.Constant) and isinstance(node.value, str)]
+            + [node.func.id for node in nodes if isinstance(node, ast.Call) and isinstance(node.func, ast.Name)])
+
+
+def _missing(example: Example) -> list[str]:
+    """Fixture files named by the example's loads which are not next to the script"""
+    names = [name for load in example.fixtures for name in _named(load) if name.endswith('.test')]
+    return [name for name in names if not example.day.path.parent.joinpath(name).exists()]
+
+
+def _fixture(day: Day, namespace: dict, load: str):
+    from copy import deepcopy
+    from pathlib import Path
+    key = (day.name, load)
+    if key not in _FIXTURES:
+        try:
+            _FIXTURES[key] = eval(load, namespace)
+        except FileNotFoundError as error:
+            # load_txt_lines('example') or example() opening example.txt beside the script is a fixture not
+            # checked in; any other missing file is a broken path, and fails the case
+            path = Path(error.filename or '').resolve()
+            if path.parent == day.path.parent and any(path.name.startswith(name) for name in _named(load)):
+                raise MissingFixture(f'no {path}') from error
+            raise
+    return deepcopy(_FIXTURES[key])
+
+
+def _run_one(example: Example, timeout: float | None) -> Outcome:
+    from contextlib import chdir
+    from time import perf_counter
+    from aoc.days import deadline
+    outcome = Outcome(example)
+    if missing := _missing(example):
+        outcome.status, outcome.message = 'skipped', f'no {", ".join(missing)}'
+        return outcome
+    try:
+        module = example.day.module()
+    except Exception as error:
+        missing = isinstance(error, ModuleNotFoundError) and error.name in OPTIONAL
+        outcome.status, outcome.message = 'skipped' if missing else 'error', f'{type(error).__name__}: {error}'
+        return outcome
+    namespace = dict(vars(module))
+    namespace['__fixture__'] = lambda load: _fixture(example.day, namespace, load)
+    start = perf_counter()
+    try:
+        with chdir(example.day.path.parent), deadline(timeout):
+            exec(example.code, namespace)
+    except MissingFixture as error:
+        outcome.status, outcome.message = 'skipped', str(error)
+    except ModuleNotFoundError as error:
+        # an optional dependency imported inside the part, like matplotlib for y23d25
+        status = 'skipped' if error.name in OPTIONAL else 'error'
+        outcome.status, outcome.message = status, f'{type(error).__name__}: {error}'
+    except AssertionError as error:
+        outcome.status, outcome.message = 'failed', str(error)
+    except TimeoutError as error:
+        outcome.status, outcome.message = 'timeout', str(error)
+    except Exception as error:
+        outcome.status, outcome.message = 'error', f'{type(error).__name__}: {error}'
+    outcome.seconds = perf_counter() - start
+    return outcome
+
+
+def _run_chunk(chunk: list[Example], timeout: float | None) -> list[Outcome]:
+    from contextlib import redirect_stdout
+    from os import devnull
+    with open(devnull, 'w') as sink, redirect_stdout(sink):
+        return [_run_one(example, timeout) for example in chunk]
+
+
+def run(cases: list[Example], workers: int | None = None, timeout: float | None = 60) -> Iterator[Outcome]:
+    """An Outcome for every case, as soon as its day's cases are done; workers=0 runs them in this process"""
+    import os
+    per_day: dict[str, list[Example]] = {}
+    for case in cases:
+        per_day.setdefault(case.day.name, []).append(case)
+    # the slowest days first, roughly, by how many cases they hold, so that the pool empties together
+    chunks = sorted(per_day.values(), key=len, reverse=True)
+    if workers == 0:
+        for chunk in chunks:
+            yield from _run_chunk(chunk, timeout)
+        return
+
+    from concurrent.futures import ProcessPoolExecutor, as_completed
+    workers = workers or os.cpu_count() or 1
+    with ProcessPoolExecutor(max_workers=min(workers, max(len(chunks), 1))) as pool:
+        futures = [pool.submit(_run_chunk, chunk, timeout) for chunk in chunks]
+        for future in as_completed(futures):
+            yield from future.result()
+
+
+if __name__ == '__main__':
+    from argparse import ArgumentParser
+    from time import perf_counter
+    parser = ArgumentParser(description="Check the example asserts of the days' __main__ blocks, offline")
+    parser.add_argument('-y', '--year', type=int, nargs='*', help='the year(s) to check', default=None)
+    parser.add_argument('-d', '--day', type=int, nargs='*', help='the day(s) of advent to check', default=None)
+    parser.add_argument('-j', '--workers', type=int, help='worker processes, default one per CPU, 0 for none',
+                        default=None)
+    parser.add_argument('-t', '--timeout', type=float, help='per-case time limit in seconds', default=60)
+    parser.add_argument('-v', '--verbose', action='store_true', help='list passed and skipped cases too')
+    args = parser.parse_args()
+
+    wall = perf_counter()
+    collected = collect(args.year, args.day)
+    counts = {}
+    for result in sorted(run(collected, args.workers, args.timeout), key=lambda r: r.example):
+        counts[result.status] = counts.get(result.status, 0) + 1
+        if args.verbose or result.status not in ('passed', 'skipped'):
+            print(f'{result.name:12s} {result.status:8s} {result.seconds:8.3f}  {result.message}')
+    print(f'{len(collected)} examples in {perf_counter() - wall:0.3f} s: '
+          + ', '.join(f'{n} {status}' for status, n in sorted(counts.items())))
+    if any(status not in ('passed', 'skipped') for status in counts):
+        raise SystemExit(1)
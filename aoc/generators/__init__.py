@@ -0,0 +1,109 @@
+"""Seeded generators of valid puzzle inputs of any size, in each day's own text format
+
+Each generator takes a random.Random and a size, the natural scale of that puzzle: the side of a
+grid, or the number of bricks, hailstones, lines and so on. It returns the input lines.
+Any hidden structure a solution relies on is planted, such as a single loop, a rock which hits
+every hailstone, or counters feeding rx, so both parts stay well defined at every size.
+"""
+from __future__ import annotations
+from typing import Callable
+
+GENERATORS: dict[tuple[int, int], Callable] = {}
+SIZES: dict[tuple[int, int], int] = {}
+
+
+def generator(year: int, day: int, size: int):
+    """Register a generator along with the size of the real puzzle input"""
+    def register(function):
+        GENERATORS[(year, day)] = function
+        SIZES[(year, day)] = size
+        return function
+    return register
+
+
+def generate(year: int, day: int, size: int | None = None, seed: int = 0) -> list[str]:
+    from random import Random
+    if (year, day) not in GENERATORS:
+        raise ValueError(f'No input generator for {year} day {day}')
+    return GENERATORS[(year, day)](Random(seed), SIZES[(year, day)] if size is None else size)
+
+
+def grid(rng, rows: int, cols: int, weights: dict[str, float], fill: str = '.') -> list[list[str]]:
+    """A rows x cols character grid, each cell independently one of weights' keys or fill"""
+    chars, cumulative, total = list(weights), [], 0.0
+    for c in chars:
+        total += weights[c]
+        cumulative.append(total)
+    from bisect import bisect
+    return [[fill if (r := rng.random()) >= total else chars[bisect(cumulative, r)] for _ in range(cols)]
+            for _ in range(rows)]
+
+
+def names(rng, count: int, length: int, alphabet: str = 'abcdefghijklmnopqrstuvwxyz', avoid=()) -> list[str]:
+    """Distinct random identifiers"""
+    found, avoid = [], set(avoid)
+    while len(found) < count:
+        name = ''.join(rng.choice(alphabet) for _ in range(length))
+        if name not in avoid:
+            avoid.add(name)
+            found.append(name)
+    return found
+
+
+def loop(rng, k: int) -> list[tuple[int, int]]:
+    """The (row, column) cells, in order, of a random closed loop which never touches itself
+
+    The loop traces around a random spanning tree of a k x k lattice, a Hamiltonian cycle of the
+    2k x 2k cells, stretched by two so that cells are only next to their neighbours along it.
+    All coordinates lie in [1, 4k - 1].
+    """
+    # randomised depth-first spanning tree, which has long winding corridors
+    tree = {(0, 0): set()}
+    stack = [(0, 0)]
+    while stack:
+        i, j = stack[-1]
+        options = [(a, b) for a, b in ((i - 1, j), (i + 1, j), (i, j - 1), (i, j + 1))
+                   if 0 <= a < k and 0 <= b < k and (a, b) not in tree]
+        if not options:
+            stack.pop()
+            continue
+        n = rng.choice(options)
+        tree[n] = {(i, j)}
+        tree[(i, j)].add(n)
+        stack.append(n)
+
+    links = {}
+
+    def link(a, b):
+        links.setdefault(a, []).append(b)
+        links.setdefault(b, []).append(a)
+
+    for (i, j), near in tree.items():
+        tl, tr, bl, br = (2 * i, 2 * j), (2 * i, 2 * j + 1), (2 * i + 1, 2 * j), (2 * i + 1, 2 * j + 1)
+        if (i - 1, j) not in near:
+            link(tl, tr)
+        if (i, j - 1) not in near:
+            link(tl, bl)
+        if (i + 1, j) in near:
+            link(bl, (2 * i + 2, 2 * j))
+            link(br, (2 * i + 2, 2 * j + 1))
+        else:
+            link(bl, br)
+        if (i, j + 1) in near:
+            link(tr, (2 * i, 2 * j + 2))
+            link(br, (2 * i + 1, 2 * j + 2))
+        else:
+            link(tr, br)
+
+    cycle, previous, cell = [(0, 0)], (0, 0), links[(0, 0)][0]
+    while cell != (0, 0):
+        cycle.append(cell)
+        previous, cell = cell, next(c for c in links[cell] if c != previous)
+    stretched = []
+    for (r, c), (s, d) in zip(cycle, cycle[1:] + cycle[:1]):
+        stretched.extend(((2 * r + 1, 2 * c + 1), (r + s + 1, c + d + 1)))
+    return stretched
+
+
+# importing the per-year modules fills GENERATORS
+from aoc.generators import y15, y23, y24  # noqa: E402
@@ -0,0 +1,28 @@
+from argparse import ArgumentParser
+from pathlib import Path
+
+from aoc.generators import GENERATORS, SIZES, generate
+
+parser = ArgumentParser(description='Write synthetic Advent of Code inputs of any size')
+parser.add_argument('-y', '--year', type=int, nargs='*', help='the year(s) to generate for', default=None)
+parser.add_argument('-d', '--day', type=int, nargs='*', help='the day(s) of advent to generate for', default=None)
+parser.add_argument('-n', '--size', type=int, help='input size, the real puzzle size by default', default=None)
+parser.add_argument('-s', '--seed', type=int, help='random seed', default=0)
+parser.add_argument('-o', '--output', type=str, help='directory for yYYdDD.N.txt files, stdout if not given')
+args = parser.parse_args()
+
+for year, day in sorted(GENERATORS):
+    if args.year and year not in args.year and year % 100 not in args.year:
+        continue
+    if args.day and day not in args.day:
+        continue
+    lines = generate(year, day, args.size, args.seed)
+    if args.output is None:
+        print('\n'.join(lines))
+        continue
+    size = SIZES[(year, day)] if args.size is None else args.size
+    path = Path(args.output).joinpath(f'y{year % 100:02d}d{day:02d}.{size}.txt')
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with path.open('w') as file:
+        file.write('\n'.join(lines) + '\n')
+    print(f'wrote {path}')
@@ -0,0 +1,27 @@
+from aoc.generators import generator
+
+
+@generator(2015, 1, 7000)
+def y15d01(rng, size: int):
+    return [''.join(rng.choice('()') for _ in range(size))]
+
+
+@generator(2015, 2, 1000)
+def y15d02(rng, size: int):
+    return [f'{rng.randint(1, 30)}x{rng.randint(1, 30)}x{rng.randint(1, 30)}' for _ in range(size)]
+
+
+@generator(2015, 3, 8192)
+def y15d03(rng, size: int):
+    return [''.join(rng.choice('^v<>') for _ in range(size))]
+
+
+@generator(2015, 4, 8)
+def y15d04(rng, size: int):
+    """The secret key, size is its length since the search time does not depend on the input size"""
+    return [''.join(rng.choice('abcdefghijklmnopqrstuvwxyz') for _ in range(size))]
+
+
+@generator(2015, 5, 1000)
+def y15d05(rng, size: int):
+    return [''.join(rng.choice('abcdefghijklmnopqrstuvwxyz') for _ in range(16)) for _ in range(size)]
@@ -0,0 +1,301 @@
+from aoc.generators import generator, grid, names, loop
+
+
+@generator(2023, 9, 200)
+def y23d09(rng, size: int):
+    """Each history is a polynomial of low degree sampled at 21 points"""
+    lines = []
+    for _ in range(size):
+        coefficients = [rng.randint(-9, 9) for _ in range(rng.randint(1, 7))]
+        lines.append(' '.join(str(sum(c * x ** i for i, c in enumerate(coefficients))) for x in range(21)))
+    return lines
+
+
+@generator(2023, 10, 140)
+def y23d10(rng, size: int):
+    """A single winding loop through the start, on a field of unconnected junk pipes"""
+    pipes = {frozenset('NS'): '|', frozenset('EW'): '-', frozenset('NE'): 'L', frozenset('NW'): 'J',
+             frozenset('SW'): '7', frozenset('SE'): 'F'}
+
+    def heading(a, b):
+        return {(-1, 0): 'N', (1, 0): 'S', (0, -1): 'W', (0, 1): 'E'}[(b[0] - a[0], b[1] - a[1])]
+
+    cells = loop(rng, max(1, (size - 1) // 4))
+    side = max(size, max(r for r, _ in cells) + 2)
+    rows = [[rng.choice('|-LJ7F.') for _ in range(side)] for _ in range(side)]
+    for before, cell, after in zip(cells[-1:] + cells[:-1], cells, cells[1:] + cells[:1]):
+        rows[cell[0]][cell[1]] = pipes[frozenset((heading(cell, before), heading(cell, after)))]
+    at = 2 * rng.randrange(len(cells) // 2)
+    r, c = cells[at]
+    rows[r][c] = 'S'
+    # nothing off the loop may look connected to the start
+    for a, b in ((r - 1, c), (r + 1, c), (r, c - 1), (r, c + 1)):
+        if (a, b) not in (cells[at - 1], cells[at + 1]):
+            rows[a][b] = '.'
+    return [''.join(row) for row in rows]
+
+
+@generator(2023, 11, 140)
+def y23d11(rng, size: int):
+    rows = grid(rng, size, size, {'#': 0.02})
+    for empty in rng.sample(range(size), size // 20):
+        rows[empty] = ['.'] * size
+    for empty in rng.sample(range(size), size // 20):
+        for row in rows:
+            row[empty] = '.'
+    return [''.join(row) for row in rows]
+
+
+@generator(2023, 12, 1000)
+def y23d12(rng, size: int):
+    """Damaged-spring groups read from a hidden row, which is then partly hidden behind ?"""
+    lines = []
+    for _ in range(size):
+        row = ''.join(rng.choice('.#') for _ in range(rng.randint(4, 20)))
+        if '#' not in row:
+            row = '#' + row[1:]
+        groups = [len(g) for g in row.split('.') if g]
+        masked = ''.join('?' if rng.random() < 0.5 else c for c in row)
+        lines.append(f'{masked} {",".join(map(str, groups))}')
+    return lines
+
+
+def _mirrors(rows: list[str], smudges: int) -> list[int]:
+    """Lines after which rows reflect with exactly this many differing cells"""
+    found = []
+    for line in range(1, len(rows)):
+        pairs = zip(reversed(rows[:line]), rows[line:])
+        if sum(a != b for top, bottom in pairs for a, b in zip(top, bottom)) == smudges:
+            found.append(line)
+    return found
+
+
+@generator(2023, 13, 100)
+def y23d13(rng, size: int):
+    """Patterns with one vertical reflection, and one horizontal reflection hidden by a smudge"""
+    patterns = []
+    while len(patterns) < size:
+        height, width = rng.randint(7, 17), rng.randint(7, 17)
+        across, down = rng.randint(1, width - 1), rng.randint(1, height - 1)
+        cells = [[rng.choice('.#') for _ in range(width)] for _ in range(height)]
+        for r in range(height):
+            for c in range(across, min(width, 2 * across)):
+                cells[r][c] = cells[r][2 * across - 1 - c]
+        for r in range(down, min(height, 2 * down)):
+            cells[r] = list(cells[2 * down - 1 - r])
+        # the smudge breaks the horizontal reflection, but is outside the vertical one
+        reach = min(down, height - down)
+        columns = [c for c in range(width) if not (max(0, 2 * across - width) <= c < min(width, 2 * across))]
+        if not columns:
+            continue
+        r, c = rng.randint(down - reach, down + reach - 1), rng.choice(columns)
+        cells[r][c] = '#' if cells[r][c] == '.' else '.'
+        rows = [''.join(row) for row in cells]
+        columns = [''.join(col) for col in zip(*rows)]
+        if any(len(_mirrors(rows, n) + _mirrors(columns, n)) != 1 for n in (0, 1)):
+            continue
+        patterns.append(rows)
+    return [line for rows in patterns for line in rows + ['']][:-1]
+
+
+@generator(2023, 14, 100)
+def y23d14(rng, size: int):
+    return [''.join(row) for row in grid(rng, size, size, {'O': 0.2, '#': 0.1})]
+
+
+@generator(2023, 15, 4000)
+def y23d15(rng, size: int):
+    labels = names(rng, max(1, size // 8), 3) + names(rng, max(1, size // 8), 2)
+    return [','.join(f'{rng.choice(labels)}-' if rng.random() < 0.3 else f'{rng.choice(labels)}={rng.randint(1, 9)}'
+                     for _ in range(size))]
+
+
+@generator(2023, 16, 110)
+def y23d16(rng, size: int):
+    return [''.join(row) for row in grid(rng, size, size, {'/': 0.03, '\\': 0.03, '|': 0.03, '-': 0.03})]
+
+
+@generator(2023, 17, 141)
+def y23d17(rng, size: int):
+    return [''.join(str(rng.randint(1, 9)) for _ in range(size)) for _ in range(size)]
+
+
+@generator(2023, 18, 700)
+def y23d18(rng, size: int):
+    """A staircase outline, with a second (much larger) staircase hidden in the colours"""
+    steps = max(1, (size - 2) // 2)
+
+    def staircase(largest):
+        moves = []
+        for _ in range(steps):
+            moves.extend((('R', rng.randint(1, largest)), ('D', rng.randint(1, largest))))
+        moves.append(('L', sum(n for d, n in moves if d == 'R')))
+        moves.append(('U', sum(n for d, n in moves if d == 'D')))
+        return moves
+
+    digits = {'R': 0, 'D': 1, 'L': 2, 'U': 3}
+    small, large = staircase(12), staircase(max(1, 0xfffff // steps))
+    return [f'{d} {n} (#{m:05x}{digits[e]})' for (d, n), (e, m) in zip(small, large)]
+
+
+@generator(2023, 19, 550)
+def y23d19(rng, size: int):
+    """A tree of workflows from 'in' with accept or reject leaves, then a third as many parts"""
+    labels = ['in'] + names(rng, size - 1, 3, avoid=('in',))
+    pending, made, workflows = ['in'], 1, []
+    while pending:
+        name = pending.pop()
+        rules = []
+        for _ in range(rng.randint(1, 3) + 1):
+            if made < size and rng.random() < 0.7:
+                target = labels[made]
+                made += 1
+                pending.append(target)
+            else:
+                target = rng.choice('AR')
+            rules.append(target)
+        conditions = [f'{rng.choice("xmas")}{rng.choice("<>")}{rng.randint(2, 3999)}:{t}' for t in rules[:-1]]
+        workflows.append(f'{name}{{{",".join(conditions + rules[-1:])}}}')
+    rng.shuffle(workflows)
+    parts = [f'{{x={rng.randint(1, 4000)},m={rng.randint(1, 4000)},a={rng.randint(1, 4000)},s={rng.randint(1, 4000)}}}'
+             for _ in range(max(1, size // 3))]
+    return workflows + [''] + parts
+
+
+@generator(2023, 20, 12)
+def y23d20(rng, size: int):
+    """Four size-bit flip-flop counters, each resetting at an odd period, all feeding rx
+
+    Each counter's hub conjunction listens to the flip-flops set in its period and pulses
+    the others, so rx first sees a low pulse after the least common multiple of the periods.
+    Below five bits there are not four pairwise coprime odd periods to choose.
+    """
+    from math import gcd
+    if size < 5:
+        raise ValueError(f'y23d20 needs counters of at least 5 bits, not {size}')
+    periods = []
+    while len(periods) < 4:
+        period = rng.randrange(1 << (size - 1), 1 << size) | 1
+        if all(gcd(period, p) == 1 for p in periods):
+            periods.append(period)
+    labels = names(rng, 4 * size + 9, 2 if size < 64 else 3, avoid=('rx',))
+    final, lines, starts = labels.pop(), [], []
+    for period in periods:
+        bits = [labels.pop() for _ in range(size)]
+        hub, inverter = labels.pop(), labels.pop()
+        starts.append(bits[0])
+        to_hub = [(period >> i) & 1 for i in range(size)]
+        hub_outputs = [inverter] + [b for b, one in zip(bits, to_hub) if not one or b == bits[0]]
+        for i, b in enumerate(bits):
+            outputs = ([bits[i + 1]] if i + 1 < size else []) + ([hub] if to_hub[i] else [])
+            lines.append(f'%{b} -> {", ".join(outputs)}')
+        lines.append(f'&{hub} -> {", ".join(hub_outputs)}')
+        lines.append(f'&{inverter} -> {final}')
+    lines.append(f'&{final} -> rx')
+    rng.shuffle(lines)
+    return [f'broadcaster -> {", ".join(starts)}'] + lines
+
+
+@generator(2023, 21, 131)
+def y23d21(rng, size: int):
+    """An odd square garden with the start in the middle of a clear row, column and border"""
+    side = size | 1
+    rows = grid(rng, side, side, {'#': 0.12})
+    middle = side // 2
+    for i in range(side):
+        for r, c in ((middle, i), (i, middle), (0, i), (side - 1, i), (i, 0), (i, side - 1)):
+            rows[r][c] = '.'
+    rows[middle][middle] = 'S'
+    return [''.join(row) for row in rows]
+
+
+@generator(2023, 22, 1200)
+def y23d22(rng, size: int):
+    """Bricks on a 10 x 10 footprint, snapshot at separate heights so none overlap"""
+    bricks, z = [], 1
+    for _ in range(size):
+        x, y, length = rng.randint(0, 9), rng.randint(0, 9), rng.randint(0, 4)
+        axis = rng.randrange(3)
+        if axis == 0:
+            x = min(x, 9 - length)
+            end = (x + length, y, z)
+        elif axis == 1:
+            y = min(y, 9 - length)
+            end = (x, y + length, z)
+        else:
+            end = (x, y, z + length)
+        bricks.append(f'{x},{y},{z}~{end[0]},{end[1]},{end[2]}')
+        z = end[2] + rng.randint(1, 3)
+    rng.shuffle(bricks)
+    return bricks
+
+
+@generator(2023, 23, 141)
+def y23d23(rng, size: int):
+    """A 6 x 6 lattice of junctions joined by straight slopes, which point right and down"""
+    k = 6
+    spacing = max(2, (size - 5) // (k - 1))
+    side = spacing * (k - 1) + 5
+    rows = [['#'] * side for _ in range(side)]
+    at = [2 + spacing * i for i in range(k)]
+    for r in at:
+        for c in range(at[0], at[-1] + 1):
+            rows[r][c] = rows[c][r] = '.'
+    for r in at:
+        for c in at[:-1]:
+            rows[r][c + 1] = rows[r][c + spacing - 1] = '>'
+            rows[c + 1][r] = rows[c + spacing - 1][r] = 'v'
+    for r, c in ((0, 1), (1, 1), (1, 2), (side - 2, side - 3), (side - 2, side - 2), (side - 1, side - 2)):
+        rows[r][c] = '.'
+    return [''.join(row) for row in rows]
+
+
+@generator(2023, 24, 300)
+def y23d24(rng, size: int):
+    """Hailstones which one thrown rock hits, each at its own time
+
+    Pairs of stones share a fast velocity component, as the real inputs do, which pins down the rock's velocity.
+    """
+    rock = [rng.randint(150, 350) * 10 ** 12 for _ in range(3)]
+    speed = [rng.randint(-250, 250) for _ in range(3)]
+    # three pairs of stones for each axis sharing a component faster than 100
+    shared = [rng.sample([n for n in range(-400, 401) if abs(n) > 100 and n != s], 3) for s in speed]
+    times = rng.sample(range(10 ** 10, 10 ** 12), size)
+    lines = []
+    for i, t in enumerate(times):
+        v = []
+        for s in speed:
+            while (u := rng.randint(-400, 400)) == s:
+                pass
+            v.append(u)
+        if i < 18:
+            axis, pair = divmod(i // 2, 3)
+            v[axis] = shared[axis][pair]
+        p = [r + (s - u) * t for r, s, u in zip(rock, speed, v)]
+        lines.append(f'{p[0]}, {p[1]}, {p[2]} @ {v[0]}, {v[1]}, {v[2]}')
+    return lines
+
+
+@generator(2023, 25, 1500)
+def y23d25(rng, size: int):
+    """Two well connected halves of the wiring, joined by exactly three wires"""
+    labels = names(rng, size, 3)
+    halves = labels[:size // 2], labels[size // 2:]
+    wires = set()
+    for half in halves:
+        n = len(half)
+        for i, a in enumerate(half):
+            # a ring with chords, which takes at least four cuts to split
+            for b in (half[(i + 1) % n], half[(i + 2) % n], rng.choice(half)):
+                if a != b:
+                    wires.add(tuple(sorted((a, b))))
+    for a, b in zip(rng.sample(halves[0], 3), rng.sample(halves[1], 3)):
+        wires.add((a, b))
+    connected = {}
+    for a, b in wires:
+        if rng.random() < 0.5:
+            a, b = b, a
+        connected.setdefault(a, []).append(b)
+    lines = [f'{a}: {" ".join(bs)}' for a, bs in connected.items()]
+    rng.shuffle(lines)
+    return lines
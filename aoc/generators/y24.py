@@ -0,0 +1,278 @@
+from aoc.generators import generator, grid, names, loop
+
+
+@generator(2024, 1, 1000)
+def y24d01(rng, size: int):
+    return [f'{rng.randint(10000, 99999)}   {rng.randint(10000, 99999)}' for _ in range(size)]
+
+
+@generator(2024, 2, 1000)
+def y24d02(rng, size: int):
+    """Mostly monotonic reports, some with one bad level"""
+    lines = []
+    for _ in range(size):
+        sign = rng.choice((-1, 1))
+        levels = [rng.randint(10, 90)]
+        for _ in range(rng.randint(4, 7)):
+            levels.append(levels[-1] + sign * rng.randint(1, 3))
+        if rng.random() < 0.5:
+            levels[rng.randrange(len(levels))] += rng.randint(-4, 4)
+        lines.append(' '.join(map(str, levels)))
+    return lines
+
+
+@generator(2024, 3, 6)
+def y24d03(rng, size: int):
+    """Lines of about 3000 characters of noise, with valid and broken instructions mixed in"""
+    noise = 'abcdefghijklmnopqrstuvwxyz()[]{}<>,;:!@#$%^&*+-\'"?/ 0123456789'
+    pieces = (lambda: f'mul({rng.randint(1, 999)},{rng.randint(1, 999)})', lambda: 'do()', lambda: "don't()",
+              lambda: f'mul({rng.randint(1, 999)}, {rng.randint(1, 999)})', lambda: f'mul[{rng.randint(1, 99)},3]',
+              lambda: f'mul({rng.randint(1, 9999)},{rng.randint(1, 99)}')
+    lines = []
+    for _ in range(size):
+        line = []
+        while sum(map(len, line)) < 3000:
+            line.append(''.join(rng.choice(noise) for _ in range(rng.randint(0, 8))))
+            line.append(rng.choices(pieces, weights=(12, 1, 1, 1, 1, 1))[0]())
+        lines.append(''.join(line))
+    return lines
+
+
+@generator(2024, 4, 140)
+def y24d04(rng, size: int):
+    return [''.join(rng.choice('XMAS') for _ in range(size)) for _ in range(size)]
+
+
+@generator(2024, 5, 200)
+def y24d05(rng, size: int):
+    """Rules for every pair of 49 pages, from one random order, then odd length updates"""
+    pages = rng.sample(range(11, 100), 49)
+    rules = [f'{a}|{b}' for i, a in enumerate(pages) for b in pages[i + 1:]]
+    rng.shuffle(rules)
+    updates = []
+    for _ in range(size):
+        update = rng.sample(pages, 2 * rng.randint(2, 11) + 1)
+        if rng.random() < 0.5:
+            update.sort(key=pages.index)
+        updates.append(','.join(map(str, update)))
+    return rules + [''] + updates
+
+
+@generator(2024, 6, 130)
+def y24d06(rng, size: int):
+    rows = grid(rng, size, size, {'#': 0.045})
+    r, c = rng.randint(size // 4, 3 * size // 4), rng.randint(size // 4, 3 * size // 4)
+    rows[r][c] = '^'
+    if r:
+        rows[r - 1][c] = '.'
+    return [''.join(row) for row in rows]
+
+
+@generator(2024, 7, 850)
+def y24d07(rng, size: int):
+    """Equations, about half of which some choice of +, * and || makes true"""
+    lines = []
+    for _ in range(size):
+        numbers = [rng.randint(1, 99) for _ in range(rng.randint(2, 12))]
+        total = numbers[0]
+        for n in numbers[1:]:
+            total = rng.choice((total + n, total * n, int(f'{total}{n}')))
+        if rng.random() < 0.5:
+            total += rng.randint(1, 9)
+        lines.append(f'{total}: {" ".join(map(str, numbers))}')
+    return lines
+
+
+@generator(2024, 8, 50)
+def y24d08(rng, size: int):
+    frequencies = 'abcdefghijklmnopqrstuvwxyzABCDEFGHIJKLMNOPQRSTUVWXYZ0123456789'
+    rows = [['.'] * size for _ in range(size)]
+    for cell in rng.sample(range(size * size), max(2, size * size // 12)):
+        rows[cell // size][cell % size] = rng.choice(frequencies)
+    return [''.join(row) for row in rows]
+
+
+@generator(2024, 9, 19999)
+def y24d09(rng, size: int):
+    """An odd length disk map, alternating file and free-space lengths"""
+    return [''.join(str(rng.randint(1, 9) if i % 2 == 0 else rng.randint(0, 9)) for i in range(size | 1))]
+
+
+@generator(2024, 10, 50)
+def y24d10(rng, size: int):
+    """Diagonal ramps from 0 to 9 broken up by random heights, so trails branch and end"""
+    return [''.join(str((x + y) % 10 if rng.random() < 0.7 else rng.randint(0, 9)) for x in range(size))
+            for y in range(size)]
+
+
+@generator(2024, 11, 8)
+def y24d11(rng, size: int):
+    return [' '.join(str(rng.choice((rng.randint(0, 9), rng.randint(10, 9999), rng.randint(10000, 999999))))
+                     for _ in range(size))]
+
+
+@generator(2024, 12, 140)
+def y24d12(rng, size: int):
+    """Blocks of plants with ragged edges, where neighbouring blocks sometimes share a plant"""
+    block = 4
+    coarse = [[rng.choice('ABCDEFGHIJKLMNOPQRSTUVWXYZ') for _ in range(size // block + 1)] for _ in range(size // block + 1)]
+    rows = [[coarse[y // block][x // block] for x in range(size)] for y in range(size)]
+    for _ in range(size * size // 4):
+        y, x = rng.randrange(size), rng.randrange(size)
+        dy, dx = rng.choice(((0, 1), (1, 0), (0, -1), (-1, 0)))
+        if 0 <= y + dy < size and 0 <= x + dx < size:
+            rows[y][x] = rows[y + dy][x + dx]
+    return [''.join(row) for row in rows]
+
+
+@generator(2024, 13, 320)
+def y24d13(rng, size: int):
+    """Claw machines, about half of which can win their prize in at most 100 presses of each button"""
+    lines = []
+    for _ in range(size):
+        ax, ay, bx, by = (rng.randint(10, 99) for _ in range(4))
+        if rng.random() < 0.5:
+            a, b = rng.randint(0, 100), rng.randint(0, 100)
+            px, py = a * ax + b * bx, a * ay + b * by
+        else:
+            px, py = rng.randint(1000, 20000), rng.randint(1000, 20000)
+        lines.extend((f'Button A: X+{ax}, Y+{ay}', f'Button B: X+{bx}, Y+{by}', f'Prize: X={px}, Y={py}', ''))
+    return lines[:-1]
+
+
+@generator(2024, 14, 500)
+def y24d14(rng, size: int):
+    """Robots in the 101 x 103 room, all on different tiles, with vertical lines of them, only at one time"""
+    nx, ny = 101, 103
+    size = min(size, nx * ny)
+    when = rng.randrange(1000, nx * ny)
+    # a tree of a trunk and branches, each column at least five robots long
+    tree = {(50, y) for y in range(40, 70)} | {(x, y) for x in range(40, 61) for y in range(45, 65) if abs(x - 50) <= (y - 45) // 2}
+    others = [(cell % nx, cell // nx) for cell in rng.sample(range(nx * ny), size)]
+    places = (sorted(tree) + [cell for cell in others if cell not in tree])[:size]
+    lines = []
+    for x, y in places:
+        vx, vy = rng.choice((-1, 1)) * rng.randint(1, nx - 1), rng.choice((-1, 1)) * rng.randint(1, ny - 1)
+        lines.append(f'p={(x - vx * when) % nx},{(y - vy * when) % ny} v={vx},{vy}')
+    rng.shuffle(lines)
+    return lines
+
+
+@generator(2024, 15, 50)
+def y24d15(rng, size: int):
+    """A walled warehouse of boxes, and eight moves per square of it split over lines of 1000"""
+    rows = grid(rng, size, size, {'O': 0.25, '#': 0.05})
+    for i in range(size):
+        rows[0][i] = rows[-1][i] = rows[i][0] = rows[i][-1] = '#'
+    rows[size // 2][size // 2] = '@'
+    moves = ''.join(rng.choice('<>^v') for _ in range(8 * size * size))
+    return [''.join(row) for row in rows] + [''] + [moves[i:i + 1000] for i in range(0, len(moves), 1000)]
+
+
+@generator(2024, 16, 141)
+def y24d16(rng, size: int):
+    """A depth-first maze with some extra walls knocked through, from S bottom left to E top right"""
+    side = size | 1
+    rows = [['#'] * side for _ in range(side)]
+    start = (side - 2, 1)
+    rows[start[0]][start[1]] = '.'
+    stack = [start]
+    while stack:
+        r, c = stack[-1]
+        options = [(r + dr, c + dc) for dr, dc in ((-2, 0), (2, 0), (0, -2), (0, 2))
+                   if 0 < r + dr < side - 1 and 0 < c + dc < side - 1 and rows[r + dr][c + dc] == '#']
+        if not options:
+            stack.pop()
+            continue
+        a, b = rng.choice(options)
+        rows[(r + a) // 2][(c + b) // 2] = rows[a][b] = '.'
+        stack.append((a, b))
+    for _ in range(side * side // 40):
+        r, c = rng.randrange(1, side - 1), rng.randrange(1, side - 1)
+        if (r + c) % 2:
+            rows[r][c] = '.'
+    rows[side - 2][1], rows[1][side - 2] = 'S', 'E'
+    return [''.join(row) for row in rows]
+
+
+@generator(2024, 17, 48)
+def y24d17(rng, size: int):
+    """A looping program which is a quine for some A, run on an A of size bits
+
+    Only register A's length varies, since the program and the search for its quine are fixed size.
+    """
+    def output(a, x, y):
+        b = (a % 8) ^ x
+        return ((b ^ y) ^ (a >> b)) % 8
+
+    def quine(program, x, y):
+        candidates = [0]
+        for digit in reversed(program):
+            candidates = [8 * a + k for a in candidates for k in range(8) if output(8 * a + k, x, y) == digit]
+        return [a for a in candidates if a]
+
+    while True:
+        x, y = rng.randrange(8), rng.randrange(8)
+        program = [2, 4, 1, x, 7, 5, 1, y, 4, rng.randrange(8), 5, 5, 0, 3, 3, 0]
+        if quine(program, x, y):
+            break
+    return [f'Register A: {rng.getrandbits(size) | 1 << (size - 1)}', 'Register B: 0', 'Register C: 0', '',
+            f'Program: {",".join(map(str, program))}']
+
+
+@generator(2024, 18, 3450)
+def y24d18(rng, size: int):
+    """Bytes falling on distinct cells of the 71 x 71 memory space, except the two corners"""
+    cells = rng.sample(range(1, 71 * 71 - 1), min(size, 71 * 71 - 2))
+    return [f'{cell % 71},{cell // 71}' for cell in cells]
+
+
+@generator(2024, 19, 400)
+def y24d19(rng, size: int):
+    """Towel patterns, then designs of which about half are made from them
+
+    No towel ends in one of the colours, so the other designs, which end in it, take a full search to rule out.
+    """
+    last = rng.choice('wubrg')
+    towels = sorted({t for t in (''.join(rng.choice('wubrg') for _ in range(rng.randint(1, 8))) for _ in range(450))
+                     if t[-1] != last})
+    designs = []
+    for _ in range(size):
+        length = rng.randint(40, 60)
+        if rng.random() < 0.5:
+            design = ''
+            while len(design) < length:
+                design += rng.choice(towels)
+        else:
+            design = ''.join(rng.choice('wubrg') for _ in range(length - 1)) + last
+        designs.append(design)
+    return [', '.join(towels), ''] + designs
+
+
+@generator(2024, 20, 141)
+def y24d20(rng, size: int):
+    """A single winding track through walls, from S to the E next to it behind one wall"""
+    cells = loop(rng, max(1, (size - 1) // 4))
+    side = max(size, max(r for r, _ in cells) + 2)
+    rows = [['#'] * side for _ in range(side)]
+    for r, c in cells[:-1]:
+        rows[r][c] = '.'
+    rows[cells[0][0]][cells[0][1]] = 'S'
+    rows[cells[-2][0]][cells[-2][1]] = 'E'
+    return [''.join(row) for row in rows]
+
+
+@generator(2024, 23, 520)
+def y24d23(rng, size: int):
+    """A sparse random network of computers with one planted set of 13 all connected to each other"""
+    from itertools import combinations
+    size = min(size, 26 * 26)
+    computers = names(rng, size, 2)
+    party = rng.sample(computers, min(13, size))
+    links = {tuple(sorted(pair)) for pair in combinations(party, 2)}
+    while len(links) < 13 * size // 2:
+        a, b = rng.sample(computers, 2)
+        links.add(tuple(sorted((a, b))))
+    lines = [f'{a}-{b}' if rng.random() < 0.5 else f'{b}-{a}' for a, b in links]
+    rng.shuffle(lines)
+    return lines
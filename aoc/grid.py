@@ -0,0 +1,117 @@
+"""Character grids as 2-D uint8 NumPy arrays, one byte per cell
+
+Positions are (row, column) pairs, matching grid[row, column] indexing.
+"""
+from __future__ import annotations
+from pathlib import Path
+
+from aoc.lazy import module
+
+np = module('numpy')
+
+
+def _first_newline(data) -> int:
+    """The index of the first '\\n', or -1, read in doubling chunks so a short first line costs one small scan"""
+    start, chunk = 0, 1 << 16
+    while start < len(data):
+        found = np.flatnonzero(data[start:start + chunk] == ord('\n'))
+        if len(found):
+            return start + int(found[0])
+        start += chunk
+        chunk *= 2
+    return -1
+
+
+def load(path) -> np.ndarray:
+    """Memory-map a grid file and return a read-only (rows, cols) view which skips the line endings
+
+    No per-cell objects are created: row r starts at byte r * stride, with stride the line length
+    plus its '\\n' (or '\\r\\n'). A missing final newline is fine.
+    """
+    path = Path(path)
+    size = path.stat().st_size
+    if size == 0:
+        return np.zeros((0, 0), dtype=np.uint8)
+    data = np.memmap(path, dtype=np.uint8, mode='r')
+    cols = _first_newline(data)
+    if cols < 0:
+        # the whole file is a single line
+        return data.reshape(1, size)
+    ending = 2 if cols and data[cols - 1] == ord('\r') else 1
+    cols -= ending - 1
+    stride = cols + ending
+    terminated = data[-1] == ord('\n')
+    rows = (size if terminated else size + ending) // stride
+    # every line ending must sit exactly one stride after the previous one
+    if rows * stride != (size if terminated else size + ending) or np.any(data[stride - 1::stride] != ord('\n')):
+        raise ValueError(f'{path} is not a rectangular grid')
+    return np.lib.stride_tricks.as_strided(data, shape=(rows, cols), strides=(stride, 1), writeable=False)
+
+
+def from_lines(lines: list[str]) -> np.ndarray:
+    """Copy equal-length lines into a (rows, cols) array with a single allocation"""
+    if not len(lines):
+        return np.zeros((0, 0), dtype=np.uint8)
+    cols = len(lines[0])
+    if any(len(line) != cols for line in lines):
+        raise ValueError('Lines of a grid must all have the same length')
+    return np.frombuffer(''.join(lines).encode('latin-1'), dtype=np.uint8).reshape(len(lines), cols)
+
+
+def to_lines(grid: np.ndarray) -> list[str]:
+    return [row.tobytes().decode('latin-1') for row in grid]
+
+
+def lookup(mapping: dict[str, int], default: int = 0, dtype='uint8') -> np.ndarray:
+    """A 256-entry table so that lookup(mapping)[grid] translates every character at once"""
+    table = np.full(256, default, dtype=dtype)
+    for c, value in mapping.items():
+        table[ord(c)] = value
+    return table
+
+
+def codes(grid: np.ndarray, mapping: dict[str, int], default: int = 0, dtype='uint8') -> np.ndarray:
+    return lookup(mapping, default, dtype)[grid]
+
+
+def find(grid: np.ndarray, char: str) -> list[tuple[int, int]]:
+    """Every (row, column) holding char, in reading order"""
+    return [(int(r), int(c)) for r, c in zip(*np.nonzero(grid == ord(char)))]
+
+
+def find_one(grid: np.ndarray, char: str) -> tuple[int, int]:
+    """The single (row, column) of a marker such as 'S' or 'E'"""
+    flat = np.flatnonzero(grid == ord(char))
+    if len(flat) != 1:
+        raise ValueError(f'Expected exactly one {char!r} in the grid, found {len(flat)}')
+    return divmod(int(flat[0]), grid.shape[1])
+
+
+def markers(grid: np.ndarray, chars: str = 'SE') -> dict[str, tuple[int, int]]:
+    return {c: find_one(grid, c) for c in chars}
+
+
+def pad(grid: np.ndarray, width: int = 1, value: str | int = '#') -> np.ndarray:
+    """Surround the grid with a border so neighbour lookups never leave the array"""
+    fill = ord(value) if isinstance(value, str) else value
+    return np.pad(grid, width, mode='constant', constant_values=fill)
+
+
+if __name__ == '__main__':
+    from tempfile import TemporaryDirectory
+    from time import perf_counter
+    n = 10_000
+    with TemporaryDirectory() as directory:
+        synthetic = Path(directory).joinpath('grid.txt')
+        rng = np.random.default_rng(1)
+        cells = np.where(rng.random((n, n)) < 0.3, ord('#'), ord('.')).astype(np.uint8)
+        cells[0, 0], cells[-1, -1] = ord('S'), ord('E')
+        with synthetic.open('wb') as file:
+            file.write(np.hstack((cells, np.full((n, 1), ord('\n'), dtype=np.uint8))).tobytes())
+        start = perf_counter()
+        loaded = load(synthetic)
+        loading = perf_counter() - start
+        found = markers(loaded)
+        searching = perf_counter() - start - loading
+        print(f'{n}x{n} grid mapped in {1000 * loading:0.1f} ms, markers {found} found in {1000 * searching:0.1f} ms')
+        assert np.array_equal(loaded, cells)
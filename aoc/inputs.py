@@ -0,0 +1,98 @@
+"""Puzzle inputs cached on disk and in memory in front of faoci.interface.fetch_lines
+
+Inputs are stored as CACHE/YYYY/yYYdDD.txt, where CACHE is $AOC_CACHE or ~/.cache/advent-of-python.
+Setting $AOC_OFFLINE (or calling set_offline) guarantees the network is never touched: a missing
+input raises OfflineError instead of being downloaded.
+"""
+from __future__ import annotations
+import os
+from pathlib import Path
+
+CACHE = Path(os.environ.get('AOC_CACHE', Path.home().joinpath('.cache', 'advent-of-python')))
+OFFLINE = os.environ.get('AOC_OFFLINE', '') not in ('', '0')
+
+_memory: dict[tuple[int, int], tuple[str, ...]] = {}
+
+
+class OfflineError(FileNotFoundError):
+    """A puzzle input is not cached and offline mode forbids fetching it"""
+
+
+def set_offline(offline: bool = True):
+    global OFFLINE
+    OFFLINE = offline
+
+
+def path(year: int, day: int) -> Path:
+    return CACHE.joinpath(f'{year}', f'y{year % 100:02d}d{day:02d}.txt')
+
+
+def store(year: int, day: int, lines: list[str]) -> Path:
+    """Write an input into the cache atomically, so concurrent readers never see a partial file"""
+    target = path(year, day)
+    target.parent.mkdir(parents=True, exist_ok=True)
+    temporary = target.with_name(f'.{target.name}.{os.getpid()}')
+    with temporary.open('w') as file:
+        file.write('\n'.join(lines) + '\n')
+    os.replace(temporary, target)
+    _memory[(year, day)] = tuple(lines)
+    return target
+
+
+def seed(year: int, day: int, source) -> Path:
+    """Fill the cache from a local copy of the puzzle input"""
+    with Path(source).open('r') as file:
+        return store(year, day, file.read().splitlines())
+
+
+def fetch_lines(*, year: int, day: int, offline: bool | None = None) -> list[str]:
+    """Drop-in replacement for faoci.interface.fetch_lines which only goes to the network once per input"""
+    key = year, day
+    if key not in _memory:
+        if (cached := path(year, day)).exists():
+            with cached.open('r') as file:
+                _memory[key] = tuple(file.read().splitlines())
+        elif OFFLINE if offline is None else offline:
+            raise OfflineError(f'No cached input for {year} day {day} at {cached}')
+        else:
+            from faoci.interface import fetch_lines as remote
+            store(year, day, remote(year=year, day=day))
+    # a fresh list each call, since a solution is free to modify its input
+    return list(_memory[key])
+
+
+def forget():
+    """Drop the in-process copies, the files on disk are kept"""
+    _memory.clear()
+
+
+if __name__ == '__main__':
+    from argparse import ArgumentParser
+    parser = ArgumentParser(description='Manage the local puzzle input cache')
+    commands = parser.add_subparsers(dest='command', required=True)
+    seeding = commands.add_parser('seed', help='copy a local input file into the cache')
+    seeding.add_argument('year', type=int)
+    seeding.add_argument('day', type=int)
+    seeding.add_argument('file', type=str)
+    commands.add_parser('seed-tree', help='copy every src/YY/DD/yYYdDD.txt into the cache')
+    fetching = commands.add_parser('fetch', help='download inputs which are not cached yet')
+    fetching.add_argument('-y', '--year', type=int, nargs='*', default=None)
+    fetching.add_argument('-d', '--day', type=int, nargs='*', default=None)
+    commands.add_parser('list', help='show the cached inputs')
+    args = parser.parse_args()
+
+    if args.command == 'seed':
+        print(seed(args.year, args.day, args.file))
+    elif args.command == 'seed-tree':
+        from aoc.days import discover
+        for d in discover():
+            if (local := d.path.parent.joinpath(f'{d.name}.txt')).exists():
+                print(seed(d.year, d.day, local))
+    elif args.command == 'fetch':
+        from aoc.days import discover
+        for d in discover(args.year, args.day):
+            fetch_lines(year=d.year, day=d.day)
+            print(path(d.year, d.day))
+    else:
+        for cached in sorted(CACHE.glob('*/y*d*.txt')):
+            print(cached)
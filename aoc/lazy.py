@@ -0,0 +1,91 @@
+"""Heavy modules which are only imported when one of their attributes is first used
+
+    np = module('numpy')    # nothing is imported yet
+    np.zeros(3)             # numpy is imported here, once
+
+Shared helpers bind their heavy dependencies this way, so a day which imports a helper but never
+calls into NumPy does not pay for importing it. Run as a script, this checks the import time of every
+day module against a budget, from the interpreter's own -X importtime report.
+"""
+from __future__ import annotations
+
+
+def module(name: str):
+    """A module object which finishes importing on first attribute access, or the module itself if already imported"""
+    import sys
+    from importlib.util import find_spec, module_from_spec, LazyLoader
+    if name in sys.modules:
+        return sys.modules[name]
+    spec = find_spec(name)
+    if spec is None:
+        raise ModuleNotFoundError(f'No module named {name!r}', name=name)
+    spec.loader = LazyLoader(spec.loader)
+    lazy = module_from_spec(spec)
+    sys.modules[name] = lazy
+    spec.loader.exec_module(lazy)
+    return lazy
+
+
+_MARKER = 'aoc.lazy: importing days'
+
+# run with -X importtime in a fresh interpreter, so the report only covers importing the day modules
+_PROBE = """
+import sys
+from aoc.days import discover
+found = discover({years}, {days})
+print({marker!r}, file=sys.stderr, flush=True)
+for day in found:
+    try:
+        day.module()
+    except Exception as error:
+        print(day.name, 'failed to import:', repr(error))
+"""
+
+
+def importtime(years: list[int] | None = None, days: list[int] | None = None) -> tuple[dict[str, int], list[str]]:
+    """Cumulative microseconds per top-level import made while importing the day modules, and any failures"""
+    import subprocess
+    import sys
+    from aoc.days import ROOT
+    probe = _PROBE.format(years=years, days=days, marker=_MARKER)
+    done = subprocess.run([sys.executable, '-X', 'importtime', '-c', probe], cwd=ROOT, capture_output=True,
+                          text=True, env=_environment(ROOT))
+    if done.returncode:
+        raise RuntimeError(done.stderr)
+    report = done.stderr.split(_MARKER, 1)[-1]
+    costs = {}
+    for line in report.splitlines():
+        if not line.startswith('import time:') or 'cumulative' in line:
+            continue
+        _, cumulative, name = line.split(':', 1)[1].split('|')
+        # nested imports are indented below the one which caused them, and already counted in it
+        if not name.startswith('  ', 1):
+            costs[name.strip()] = costs.get(name.strip(), 0) + int(cumulative)
+    return costs, done.stdout.splitlines()
+
+
+def _environment(root):
+    import os
+    env = dict(os.environ)
+    env['PYTHONPATH'] = os.pathsep.join(p for p in (str(root), env.get('PYTHONPATH')) if p)
+    return env
+
+
+if __name__ == '__main__':
+    from argparse import ArgumentParser
+    parser = ArgumentParser(description='Check the time taken to import every day module against a budget')
+    parser.add_argument('-y', '--year', type=int, nargs='*', help='the year(s) to import', default=None)
+    parser.add_argument('-d', '--day', type=int, nargs='*', help='the day(s) of advent to import', default=None)
+    parser.add_argument('-b', '--budget', type=float, help='allowed total import time in milliseconds', default=150)
+    parser.add_argument('-n', '--top', type=int, help='slowest imports to list', default=10)
+    args = parser.parse_args()
+
+    costs, failures = importtime(args.year, args.day)
+    total = sum(costs.values()) / 1000
+    for name, micro in sorted(costs.items(), key=lambda item: -item[1])[:args.top]:
+        print(f'{micro / 1000:10.1f} ms  {name}')
+    for failure in failures:
+        print(failure)
+    print(f'{total:10.1f} ms  total, budget {args.budget:0.1f} ms')
+    if total > args.budget:
+        raise SystemExit(1)
@@ -0,0 +1,168 @@
+"""Bounded memoisation with per-call-site counters and explicit scopes
+
+    @memo(maxsize=1 << 16)
+    def count(line: str, groups: tuple[int, ...]) -> int: ...
+
+    class Supply:
+        @memo_method
+        def count(self, design: str) -> int: ...
+
+    with scope(count):      # entries live for one solve, not for the life of the process
+        ...
+
+The caches are functools' least-recently-used caches, so a hit costs no Python-level call, and a
+bounded one evicts the oldest entries once full. Each call site counts its hits, misses and evictions.
+A method gets a separate cache per instance, stored on the instance itself, so it is collected along
+with the instance rather than keeping every instance it has seen alive the way lru_cache on a method does.
+The cache holds its instance weakly, so when the instance is collected its counts are added to the call
+site's before the cache goes too; a method's counters cover every instance it was called on.
+"""
+from __future__ import annotations
+from dataclasses import dataclass
+from typing import Callable
+
+_MEMOS = None
+
+
+def _live():
+    """Every call site still in use, weakly held so reloading a day module does not keep the old ones"""
+    global _MEMOS
+    if _MEMOS is None:
+        from weakref import WeakSet
+        _MEMOS = WeakSet()
+    return _MEMOS
+
+
+@dataclass
+class Stats:
+    name: str
+    hits: int
+    misses: int
+    evictions: int
+    size: int
+    maxsize: int | None
+
+    @property
+    def rate(self):
+        calls = self.hits + self.misses
+        return self.hits / calls if calls else 0.0
+
+
+class CallSite:
+    """The caches made for one decorated function, one per instance for a method"""
+    def __init__(self, name: str, maxsize: int | None):
+        from weakref import WeakSet
+        self.name = name
+        self.maxsize = maxsize
+        self.caches = WeakSet()
+        # counts from caches since cleared
+        self.hits = self.misses = self.dropped = 0
+        _live().add(self)
+
+    def cache(self, function: Callable, owner: object | None = None):
+        """A new cache of function, whose counts are kept by the call site once owner is collected"""
+        from functools import lru_cache
+        from weakref import finalize
+        cached = lru_cache(maxsize=self.maxsize)(function)
+        self.caches.add(cached)
+        if owner is not None:
+            # the finalizer holds the cache, so it must not hold the owner or the owner is never collected
+            finalize(owner, self._fold, cached)
+        return cached
+
+    def _count(self, cached):
+        info = cached.cache_info()
+        self.hits += info.hits
+        self.misses += info.misses
+        self.dropped += info.currsize
+
+    def _fold(self, cached):
+        self._count(cached)
+        self.caches.discard(cached)
+
+    def clear(self):
+        for cached in list(self.caches):
+            self._count(cached)
+            cached.cache_clear()
+
+    def stats(self) -> Stats:
+        infos = [cached.cache_info() for cached in list(self.caches)]
+        hits = self.hits + sum(i.hits for i in infos)
+        misses = self.misses + sum(i.misses for i in infos)
+        size = sum(i.currsize for i in infos)
+        # every miss stores an entry, which is still there, was cleared or was evicted
+        return Stats(self.name, hits, misses, max(0, misses - size - self.dropped), size, self.maxsize)
+
+
+def memo(function: Callable | None = None, *, maxsize: int | None = None):
+    """Memoise a function of hashable positional arguments, as @memo or @memo(maxsize=...)"""
+    def decorate(f):
+        site = CallSite(f.__qualname__, maxsize)
+        cached = site.cache(f)
+        cached.site = site
+        return cached
+    return decorate if function is None else decorate(function)
+
+
+class MethodMemo:
+    """A method cache per instance, kept in the instance's __dict__ so later lookups skip this descriptor"""
+    def __init__(self, function: Callable, maxsize: int | None = None):
+        from functools import update_wrapper
+        update_wrapper(self, function)
+        self.function = function
+        self.name = function.__name__
+        self.site = CallSite(function.__qualname__, maxsize)
+
+    def __set_name__(self, owner, name):
+        self.name = name
+
+    def __get__(self, instance, owner=None):
+        from types import MethodType
+        from weakref import ref
+        if instance is None:
+            return self
+        try:
+            weak, function = ref(instance), self.function
+        except TypeError:
+            # no weak references (a tuple subclass, say): the cache holds its instance, and its counts go with it
+            cached = self.site.cache(MethodType(self.function, instance))
+        else:
+            cached = self.site.cache(lambda *args: function(weak(), *args), instance)
+        try:
+            instance.__dict__[self.name] = cached
+        except AttributeError:
+            raise TypeError(f'{type(instance).__name__} has no __dict__ to hold a cache for {self.name}') from None
+        return cached
+
+
+def memo_method(function: Callable | None = None, *, maxsize: int | None = None):
+    """Memoise a method per instance, as @memo_method or @memo_method(maxsize=...)"""
+    def decorate(f):
+        return MethodMemo(f, maxsize)
+    return decorate if function is None else decorate(function)
+
+
+def scope(*memos):
+    """Empty these memoised functions' caches, or every cache if none are given, when the with block ends"""
+    from contextlib import contextmanager
+
+    @contextmanager
+    def scoped():
+        try:
+            yield
+        finally:
+            for site in [m.site for m in memos] or list(_live()):
+                site.clear()
+
+    return scoped()
+
+
+def stats() -> list[Stats]:
+    return sorted((site.stats() for site in list(_live())), key=lambda s: s.name)
+
+
+def report() -> str:
+    lines = [f'{"memo":30s} {"hits":>10s} {"misses":>10s} {"rate":>6s} {"size":>8s} {"evicted":>8s}']
+    for s in stats():
+        lines.append(f'{s.name:30s} {s.hits:10d} {s.misses:10d} {s.rate:6.1%} {s.size:8d} {s.evictions:8d}')
+    return '\n'.join(lines)
@@ -0,0 +1,116 @@
+"""Every integer in an input at once, as int64 NumPy arrays
+
+    records(lines, 4)           # 'p=0,4 v=3,-3' lines as a (n, 4) array
+    values, offsets = ragged(lines)
+    values[offsets[i]:offsets[i + 1]]       # the integers on the i-th line holding any
+
+The input, given as lines, text, bytes or a path, is passed over as one buffer: a byte table turns
+everything but digits, minus signs and newlines into spaces, and NumPy's C text parser reads the
+integers that are left, so no Python object is made per number and 100 MB parse in under a second.
+A minus sign counts only directly before a digit and not directly after one, so '3-5' is 3 and 5
+while '-5' and 'x=-5' are -5; with signed=False every minus sign is a separator.
+
+Importing NumPy takes about 80 ms, which str.split and int only catch up with at around a megabyte of
+input, so a day keeps its own per-line parsing and switches to these when bulk(lines) says it is worth it.
+"""
+from __future__ import annotations
+import os
+
+from aoc.lazy import module
+
+np = module('numpy')
+
+# characters of input above which importing NumPy is repaid
+BULK = 1 << 20
+
+_SIGNED = bytes(c if c in b'0123456789-\n' else 32 for c in range(256))
+_UNSIGNED = bytes(c if c in b'0123456789\n' else 32 for c in range(256))
+
+
+def bulk(lines: list[str]) -> bool:
+    """Whether the lines are long enough for the array parsers to beat per-line parsing, NumPy's import included"""
+    return sum(map(len, lines)) >= BULK
+
+
+def _buffer(source) -> bytes:
+    if isinstance(source, (bytes, bytearray, memoryview)):
+        return bytes(source)
+    if isinstance(source, str):
+        return source.encode()
+    if isinstance(source, os.PathLike):
+        with open(source, 'rb') as file:
+            return file.read()
+    return '\n'.join(source).encode()
+
+
+def _clean(source, signed: bool):
+    """The input as uint8 with only digits, sign characters, newlines and spaces left"""
+    data = np.frombuffer(_buffer(source).translate(_SIGNED if signed else _UNSIGNED), dtype=np.uint8)
+    if signed:
+        minus = np.flatnonzero(data == ord('-'))
+        if len(minus):
+            data = data.copy()
+            after = data[np.minimum(minus + 1, len(data) - 1)]
+            before = data[np.maximum(minus - 1, 0)]
+            lone = ((after - ord('0')) > 9) | (minus == len(data) - 1)
+            lone |= (minus > 0) & ((before - ord('0')) <= 9)
+            data[minus[lone]] = 32
+    return data
+
+
+def _first_line(data: bytes) -> bytes:
+    start = 0
+    while start < len(data):
+        end = data.find(b'\n', start)
+        end = len(data) if end < 0 else end
+        if data[start:end].strip():
+            return data[start:end]
+        start = end + 1
+    return b''
+
+
+def _values(data) -> np.ndarray:
+    values = np.fromstring(data.tobytes(), dtype=np.int64, sep=' ')
+    # fromstring reads a buffer of nothing but separators as a single 0
+    if len(values) == 1 and values[0] == 0 and not np.any((data - ord('0')) <= 9):
+        return values[:0]
+    return values
+
+
+def integers(source, signed: bool = True) -> np.ndarray:
+    """Every integer in reading order"""
+    return _values(_clean(source, signed))
+
+
+def records(source, width: int | None = None, signed: bool = True) -> np.ndarray:
+    """The integers as rows of width values, by default as many as are on the first non-blank line
+
+    A record may span several lines, as long as every record holds the same number of integers.
+    """
+    values = integers(source, signed)
+    if width is None:
+        width = len(integers(_first_line(_buffer(source)), signed))
+    if not width or len(values) % width:
+        raise ValueError(f'{len(values)} integers do not make records of {width}')
+    return values.reshape(-1, width)
+
+
+def ragged(source, signed: bool = True) -> tuple[np.ndarray, np.ndarray]:
+    """Every integer, and the offsets of the integers of each line holding any"""
+    data = _clean(source, signed)
+    values = _values(data)
+    token = (data != 32) & (data != 10)
+    starts = np.flatnonzero(token & ~np.concatenate(([False], token[:-1])))
+    lines = np.searchsorted(np.flatnonzero(data == 10), starts)
+    counts = np.bincount(lines)
+    counts = counts[counts > 0]
+    offsets = np.zeros(len(counts) + 1, dtype=np.int64)
+    np.cumsum(counts, out=offsets[1:])
+    return values, offsets
+
+
+def rows(values: np.ndarray, offsets: np.ndarray) -> list[list[int]]:
+    """A ragged parse as lists of Python integers, one per line"""
+    flat = values.tolist()
+    bounds = offsets.tolist()
+    return [flat[a:b] for a, b in zip(bounds, bounds[1:])]
@@ -0,0 +1,294 @@
+"""Memoised results kept on disk between runs, behind the in-memory caches of aoc.memo
+
+    @persistent(maxsize=1 << 19)
+    def follow(stone: S, count: int) -> int: ...
+
+Persistence is opt-in: with $AOC_MEMO unset (or '0') the decorator is exactly aoc.memo.memo. Set it to '1'
+for CACHE/memo.sqlite, or to the path of another database. The decorator has to see the setting when
+the day module is imported.
+
+A result is keyed by the function's module and name, a sha256 of its source, and the repr of its
+arguments, so arguments need a repr which identifies them. Editing the function starts a new version;
+editing something it calls does not, so clear the store after such a change. Results a run computes are
+buffered and written in batches when the buffer fills, when a scope ends and when the process exits.
+Writers take turns through SQLite's write-ahead log, and rows are only ever inserted, so concurrent runs
+computing the same result store it once. A function whose store holds nothing for its version skips the
+lookups entirely, so a cold run pays for writing its results but not for reading.
+Each run records how long its outermost calls took and whether it was cold (nothing found on disk) or
+warm, which `python -m aoc.persist stats` compares.
+"""
+from __future__ import annotations
+import os
+from dataclasses import dataclass
+from pathlib import Path
+from time import perf_counter, time
+from typing import Callable
+
+from aoc.inputs import CACHE
+from aoc.memo import CallSite, memo, _live
+
+DATABASE = CACHE.joinpath('memo.sqlite')
+
+_SCHEMA = (
+    'CREATE TABLE IF NOT EXISTS functions (id INTEGER PRIMARY KEY, name TEXT, version TEXT, seen REAL, '
+    'UNIQUE (name, version))',
+    'CREATE TABLE IF NOT EXISTS entries (function INTEGER, key TEXT, value, PRIMARY KEY (function, key)) '
+    'WITHOUT ROWID',
+    'CREATE TABLE IF NOT EXISTS runs (function INTEGER, created REAL, warm INTEGER, seconds REAL, '
+    'loaded INTEGER, computed INTEGER)',
+)
+
+_MISSING = object()
+_STORES: dict[str, MemoStore] = {}
+
+
+def location() -> Path | None:
+    """The database named by $AOC_MEMO, or None if persistence is off"""
+    setting = os.environ.get('AOC_MEMO', '')
+    if setting in ('', '0'):
+        return None
+    return DATABASE if setting == '1' else Path(setting)
+
+
+def _encode(value):
+    # integers which fit are stored as SQLite integers, anything else pickled
+    if type(value) is int and -(1 << 63) <= value < (1 << 63):
+        return value
+    from pickle import dumps
+    return dumps(value)
+
+
+def _decode(value):
+    if isinstance(value, bytes):
+        from pickle import loads
+        return loads(value)
+    return value
+
+
+class MemoStore:
+    def __init__(self, path: Path | str = DATABASE, timeout: float = 30):
+        self.path = Path(path)
+        self.timeout = timeout
+        self._connection = None
+        self._pid = None
+
+    def connection(self):
+        """One connection per process, since SQLite connections must not be shared across a fork"""
+        import sqlite3
+        if self._connection is None or self._pid != os.getpid():
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            self._connection = sqlite3.connect(self.path, timeout=self.timeout, isolation_level=None)
+            self._connection.execute('PRAGMA journal_mode=WAL')
+            self._connection.execute('PRAGMA synchronous=NORMAL')
+            for table in _SCHEMA:
+                self._connection.execute(table)
+            self._pid = os.getpid()
+        return self._connection
+
+    def function(self, name: str, version: str) -> tuple[int, bool]:
+        """The id of this version of a function, marked as just used, and whether any of its results are stored"""
+        connection = self.connection()
+        connection.execute('INSERT INTO functions (name, version, seen) VALUES (?, ?, ?) '
+                           'ON CONFLICT (name, version) DO UPDATE SET seen = excluded.seen', (name, version, time()))
+        number, = connection.execute('SELECT id FROM functions WHERE name=? AND version=?', (name, version)).fetchone()
+        stored = connection.execute('SELECT 1 FROM entries WHERE function=? LIMIT 1', (number,)).fetchone()
+        return number, stored is not None
+
+    def get(self, function: int, key: str):
+        row = self.connection().execute('SELECT value FROM entries WHERE function=? AND key=?',
+                                        (function, key)).fetchone()
+        return _MISSING if row is None else _decode(row[0])
+
+    def put(self, function: int, entries: dict[str, object]):
+        rows = [(function, key, _encode(value)) for key, value in entries.items()]
+        connection = self.connection()
+        # an immediate transaction waits its turn to write instead of failing part way through
+        connection.execute('BEGIN IMMEDIATE')
+        try:
+            connection.executemany('INSERT OR IGNORE INTO entries VALUES (?, ?, ?)', rows)
+            connection.execute('COMMIT')
+        except BaseException:
+            connection.execute('ROLLBACK')
+            raise
+
+    def record(self, function: int, warm: bool, seconds: float, loaded: int, computed: int):
+        self.connection().execute('INSERT INTO runs VALUES (?, ?, ?, ?, ?, ?)',
+                                  (function, time(), int(warm), seconds, loaded, computed))
+
+    def compact(self) -> int:
+        """Drop every version but the one most recently used per function, then reclaim the space"""
+        connection = self.connection()
+        stale = [number for number, in connection.execute(
+            'SELECT id FROM functions AS f WHERE EXISTS '
+            '(SELECT 1 FROM functions AS g WHERE g.name = f.name AND g.seen > f.seen)')]
+        removed = 0
+        for number in stale:
+            removed += connection.execute('DELETE FROM entries WHERE function=?', (number,)).rowcount
+            connection.execute('DELETE FROM runs WHERE function=?', (number,))
+            connection.execute('DELETE FROM functions WHERE id=?', (number,))
+        connection.execute('VACUUM')
+        connection.execute('PRAGMA wal_checkpoint(TRUNCATE)')
+        return removed
+
+    def summary(self) -> list[tuple]:
+        """Per function version: stored results, then the count and mean seconds of its cold and of its warm runs"""
+        return self.connection().execute("""
+            SELECT f.name, f.version,
+                   (SELECT COUNT(*) FROM entries AS e WHERE e.function = f.id),
+                   SUM(r.warm = 0), AVG(CASE WHEN r.warm = 0 THEN r.seconds END),
+                   SUM(r.warm = 1), AVG(CASE WHEN r.warm = 1 THEN r.seconds END)
+            FROM functions AS f LEFT JOIN runs AS r ON r.function = f.id
+            GROUP BY f.id ORDER BY f.name, f.seen""").fetchall()
+
+
+def store(path: Path | str) -> MemoStore:
+    """The store for a database, shared by every persistent function in the process"""
+    path = str(path)
+    if path not in _STORES:
+        _STORES[path] = MemoStore(path)
+    return _STORES[path]
+
+
+def _version(function: Callable) -> str:
+    from hashlib import sha256
+    from inspect import getsource
+    try:
+        source = getsource(function).encode()
+    except (OSError, TypeError):
+        source = function.__code__.co_code
+    return sha256(source).hexdigest()
+
+
+@dataclass
+class Run:
+    name: str
+    warm: bool
+    seconds: float
+    loaded: int
+    computed: int
+
+
+class PersistentSite(CallSite):
+    """A call site whose cache misses are looked up in, or added to, a MemoStore"""
+    def __init__(self, function: Callable, store: MemoStore, maxsize: int | None, depth: int | None, batch: int):
+        from inspect import getfile
+        super().__init__(function.__qualname__, maxsize)
+        self.function = function
+        self.store = store
+        self.key = f'{Path(getfile(function)).stem}.{function.__qualname__}'
+        self.version = _version(function)
+        self.number = None
+        self.depth = depth
+        self.batch = batch
+        self.pending = {}
+        self.warm = None
+        self.level = 0
+        self.seconds = 0.0
+        self.loaded = self.computed = 0
+
+    def miss(self, *args):
+        """Find a result not in the memory cache on disk, or compute it, timing the outermost calls"""
+        if self.warm is None:
+            self.number, self.warm = self.store.function(self.key, self.version)
+        started = perf_counter() if self.level == 0 else None
+        try:
+            key = repr(args) if self.depth is None or self.level <= self.depth else None
+            if key is not None:
+                if (value := self.pending.get(key, _MISSING)) is not _MISSING:
+                    return value
+                if self.warm and (value := self.store.get(self.number, key)) is not _MISSING:
+                    self.loaded += 1
+                    return value
+            self.level += 1
+            try:
+                value = self.function(*args)
+            finally:
+                self.level -= 1
+            self.computed += 1
+            if key is not None:
+                self.pending[key] = value
+                if len(self.pending) >= self.batch:
+                    self.flush()
+            return value
+        finally:
+            if started is not None:
+                self.seconds += perf_counter() - started
+
+    def flush(self):
+        if self.pending:
+            self.store.put(self.number, self.pending)
+            self.pending = {}
+
+    def finish(self) -> Run | None:
+        """Write out pending results and record the run so far, starting a new one"""
+        self.flush()
+        if not self.loaded and not self.computed:
+            return None
+        run = Run(self.key, self.loaded > 0, self.seconds, self.loaded, self.computed)
+        self.store.record(self.number, run.warm, run.seconds, run.loaded, run.computed)
+        self.seconds = 0.0
+        self.loaded = self.computed = 0
+        # anything stored by this run makes the next one worth looking up
+        self.warm = None
+        return run
+
+    def clear(self):
+        self.finish()
+        super().clear()
+
+
+def persistent(function: Callable | None = None, *, maxsize: int | None = None, depth: int | None = None,
+               batch: int = 1 << 14):
+    """Memoise as aoc.memo.memo does, and if $AOC_MEMO is set keep the results on disk too
+
+    depth limits which results are stored to calls at most that many levels below the outermost call,
+    for recursions whose inner results are too many, or too specific, to be worth keeping.
+    """
+    def decorate(f):
+        if (path := location()) is None:
+            return memo(f, maxsize=maxsize)
+        site = PersistentSite(f, store(path), maxsize, depth, batch)
+        cached = site.cache(site.miss)
+        cached.site = site
+        return cached
+    return decorate if function is None else decorate(function)
+
+
+def sites() -> list[PersistentSite]:
+    return [site for site in list(_live()) if isinstance(site, PersistentSite)]
+
+
+def _finish_all():
+    for site in sites():
+        try:
+            site.finish()
+        except Exception:
+            pass
+
+
+if location() is not None:
+    import atexit
+    atexit.register(_finish_all)
+
+
+if __name__ == '__main__':
+    from argparse import ArgumentParser
+    parser = ArgumentParser(description='Inspect or tidy the memoised results kept between runs')
+    parser.add_argument('command', choices=('stats', 'compact', 'clear'))
+    parser.add_argument('--database', type=str, help='the memo database', default=str(location() or DATABASE))
+    args = parser.parse_args()
+
+    memos = MemoStore(args.database)
+    if args.command == 'stats':
+        def mean(seconds):
+            return f'{seconds:9.3f}s' if seconds is not None else f'{"-":>10s}'
+        print(f'{"function":30s} {"version":8s} {"stored":>9s} {"cold":>5s} {"mean":>10s} {"warm":>5s} {"mean":>10s}')
+        for name, version, stored, cold, cold_mean, warm, warm_mean in memos.summary():
+            print(f'{name:30s} {version[:8]:8s} {stored:9d} {cold or 0:5d} {mean(cold_mean)} '
+                  f'{warm or 0:5d} {mean(warm_mean)}')
+    elif args.command == 'compact':
+        print(f'removed {memos.compact()} results of superseded versions')
+    else:
+        memos.path.unlink(missing_ok=True)
+        for suffix in ('-wal', '-shm'):
+            memos.path.with_name(memos.path.name + suffix).unlink(missing_ok=True)
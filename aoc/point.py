@@ -0,0 +1,143 @@
+"""An immutable 2-D integer point (or vector) for the grid puzzles
+
+Point is a slotted tuple subclass: construction, equality and hashing all run in C and
+no per-instance __dict__ is allocated. Arithmetic keeps the subclass of the left operand,
+so day-specific subclasses (with extra methods) survive addition. A plain tuple on the left is
+taken as a vector too, so (1, 0) + Point(2, 3) is Point(3, 3) rather than a four-tuple.
+"""
+from __future__ import annotations
+from operator import itemgetter
+
+_new = tuple.__new__
+
+
+class Point(tuple):
+    __slots__ = ()
+
+    def __new__(cls, x: int, y: int):
+        return _new(cls, (x, y))
+
+    x = property(itemgetter(0))
+    y = property(itemgetter(1))
+
+    def __add__(self, other):
+        if isinstance(other, tuple):
+            return _new(self.__class__, (self[0] + other[0], self[1] + other[1]))
+        return _new(self.__class__, (self[0] + other, self[1] + other))
+
+    def __radd__(self, other):
+        # tried before tuple concatenation, since Point subclasses tuple
+        if isinstance(other, tuple):
+            return _new(self.__class__, (other[0] + self[0], other[1] + self[1]))
+        return _new(self.__class__, (other + self[0], other + self[1]))
+
+    def __sub__(self, other):
+        if isinstance(other, tuple):
+            return _new(self.__class__, (self[0] - other[0], self[1] - other[1]))
+        return _new(self.__class__, (self[0] - other, self[1] - other))
+
+    def __rsub__(self, other):
+        if isinstance(other, tuple):
+            return _new(self.__class__, (other[0] - self[0], other[1] - self[1]))
+        return _new(self.__class__, (other - self[0], other - self[1]))
+
+    def __mul__(self, other):
+        """Scale by an integer, or the dot product with another Point"""
+        if isinstance(other, tuple):
+            return self[0] * other[0] + self[1] * other[1]
+        return _new(self.__class__, (self[0] * other, self[1] * other))
+
+    def __rmul__(self, other):
+        if isinstance(other, tuple):
+            return other[0] * self[0] + other[1] * self[1]
+        return _new(self.__class__, (other * self[0], other * self[1]))
+
+    def __floordiv__(self, other):
+        if isinstance(other, tuple):
+            return _new(self.__class__, (self[0] // other[0], self[1] // other[1]))
+        return _new(self.__class__, (self[0] // other, self[1] // other))
+
+    def __mod__(self, other):
+        if isinstance(other, tuple):
+            return _new(self.__class__, (self[0] % other[0], self[1] % other[1]))
+        return _new(self.__class__, (self[0] % other, self[1] % other))
+
+    def __neg__(self):
+        return _new(self.__class__, (-self[0], -self[1]))
+
+    def dot(self, other) -> int:
+        return self[0] * other[0] + self[1] * other[1]
+
+    def manhattan(self, other=None) -> int:
+        if other is None:
+            return abs(self[0]) + abs(self[1])
+        return abs(self[0] - other[0]) + abs(self[1] - other[1])
+
+    def key(self, width: int) -> int:
+        """The flat index of this point in a row-major grid with the given width"""
+        return self[1] * width + self[0]
+
+    @classmethod
+    def from_key(cls, key: int, width: int):
+        y, x = divmod(key, width)
+        return _new(cls, (x, y))
+
+    @classmethod
+    def from_str(cls, s: str):
+        x, y = s.split(',')
+        return _new(cls, (int(x), int(y)))
+
+    @classmethod
+    def from_chr(cls, c: str):
+        """The unit step for an arrow character, with y increasing down the screen"""
+        x, y = {'<': (-1, 0), '^': (0, -1), '>': (1, 0), 'v': (0, 1)}[c]
+        return _new(cls, (x, y))
+
+    def __str__(self):
+        return f'({self[0]}, {self[1]})'
+
+    def __repr__(self):
+        return f'{self.__class__.__name__}({self[0]}, {self[1]})'
+
+    def __getnewargs__(self):
+        return self[0], self[1]
+
+
+def flat(points, width: int):
+    """Row-major flat indices for a batch of points (or an (n, 2) array of x, y) as an int64 array"""
+    import numpy as np
+    xy = np.asarray(points, dtype=np.int64).reshape(-1, 2)
+    return xy[:, 1] * width + xy[:, 0]
+
+
+def unflat(indices, width: int):
+    """The (n, 2) array of x, y for a batch of row-major flat indices"""
+    import numpy as np
+    y, x = np.divmod(np.asarray(indices, dtype=np.int64), width)
+    return np.stack((x, y), axis=-1)
+
+
+if __name__ == '__main__':
+    from dataclasses import dataclass
+    from timeit import timeit
+
+    @dataclass
+    class Copied:
+        """The dataclass which used to be copied into each day"""
+        x: int
+        y: int
+
+        def __hash__(self):
+            return hash((self.x, self.y))
+
+        def __add__(self, other):
+            return Copied(self.x + other.x, self.y + other.y)
+
+    def perimeter(kind, points):
+        directions = kind(0, 1), kind(1, 0), kind(0, -1), kind(-1, 0)
+        return sum(p + d not in points for p in points for d in directions)
+
+    for kind in (Copied, Point):
+        region = {kind(x, y) for x in range(60) for y in range(60) if (x * y) % 7}
+        seconds = timeit(lambda: perimeter(kind, region), number=20) / 20
+        print(f'{kind.__name__:>6s}: perimeter of {len(region)} points in {1000 * seconds:0.2f} ms')
@@ -0,0 +1,221 @@
+"""Profile one part of any day with cProfile and/or tracemalloc, without editing its script
+
+Capture covers the whole part, or only the time spent inside named functions such as
+'RockBoard.column_rock_groups'. Those are wrapped in place on the imported module for the length
+of the run and restored afterwards. Each part writes yYYdDD.partN.prof (for pstats or snakeviz)
+and/or yYYdDD.partN.memory.txt, which lists the top allocation sites.
+"""
+from __future__ import annotations
+from dataclasses import dataclass, field
+from pathlib import Path
+
+from aoc.days import Day, discover
+
+
+@dataclass
+class Capture:
+    """Switches the profilers on while any captured call is active; nested or recursive calls are counted once"""
+    cpu: bool = True
+    memory: bool = False
+    frames: int = 1
+    profiler: object = None
+    allocations: dict[tuple[str, int], list[int]] = field(default_factory=dict)
+    peak: int = 0
+    calls: int = 0
+    _depth: int = 0
+    _tracing: bool = False
+
+    def __post_init__(self):
+        if self.cpu and self.profiler is None:
+            from cProfile import Profile
+            self.profiler = Profile()
+
+    def enter(self):
+        self._depth += 1
+        if self._depth > 1:
+            return
+        self.calls += 1
+        if self.memory:
+            import tracemalloc
+            self._tracing = not tracemalloc.is_tracing()
+            if self._tracing:
+                tracemalloc.start(self.frames)
+            tracemalloc.reset_peak()
+            # with tracing just started every trace is new, so there is nothing to compare against
+            self._before = None if self._tracing else self._snapshot()
+        if self.cpu:
+            self.profiler.enable()
+
+    def exit(self):
+        self._depth -= 1
+        if self._depth:
+            return
+        if self.cpu:
+            self.profiler.disable()
+        if self.memory:
+            import tracemalloc
+            self.peak = max(self.peak, tracemalloc.get_traced_memory()[1])
+            # what this call allocated and still holds on return
+            snapshot = self._snapshot()
+            if self._before is None:
+                held = ((s.traceback[0], s.size, s.count) for s in snapshot.statistics('lineno'))
+            else:
+                held = ((s.traceback[0], s.size_diff, s.count_diff) for s in snapshot.compare_to(self._before, 'lineno'))
+            for frame, size, count in held:
+                if size > 0:
+                    totals = self.allocations.setdefault((frame.filename, frame.lineno), [0, 0])
+                    totals[0] += size
+                    totals[1] += max(count, 0)
+            self._before = None
+            if self._tracing:
+                tracemalloc.stop()
+
+    @staticmethod
+    def _snapshot():
+        """The traced allocations, without those made by the capture itself"""
+        import tracemalloc
+        return tracemalloc.take_snapshot().filter_traces((tracemalloc.Filter(False, __file__),
+                                                         tracemalloc.Filter(False, tracemalloc.__file__)))
+
+    def wrap(self, function):
+        from functools import wraps
+
+        @wraps(function)
+        def captured(*args, **kwargs):
+            self.enter()
+            try:
+                return function(*args, **kwargs)
+            finally:
+                self.exit()
+        return captured
+
+    def memory_report(self, top: int = 20) -> str:
+        import linecache
+        ranked = sorted(self.allocations.items(), key=lambda item: -item[1][0])[:top]
+        lines = [f'{self.calls} captured call(s), largest traced peak of one call {self.peak / 1024:0.1f} kB',
+                 f'{"kB":>10s} {"blocks":>8s}  site']
+        for (filename, lineno), (size, count) in ranked:
+            source = linecache.getline(filename, lineno).strip()
+            lines.append(f'{size / 1024:10.1f} {count:8d}  {Path(filename).name}:{lineno}  {source}')
+        return '\n'.join(lines)
+
+    def cpu_report(self, top: int = 20, sort: str = 'cumulative') -> str:
+        from io import StringIO
+        import pstats
+        if not self.calls:
+            # a profiler which was never enabled has no stats for pstats to load
+            return 'no captured calls'
+        stream = StringIO()
+        pstats.Stats(self.profiler, stream=stream).strip_dirs().sort_stats(sort).print_stats(top)
+        return stream.getvalue()
+
+
+def _patched(module, names: list[str], capture: Capture):
+    """Wrap module attributes, given as dotted paths like 'Class.method', for the duration of a with block"""
+    from contextlib import contextmanager
+    from inspect import getattr_static
+
+    def wrapped(raw):
+        if isinstance(raw, staticmethod):
+            return staticmethod(capture.wrap(raw.__func__))
+        if isinstance(raw, classmethod):
+            return classmethod(capture.wrap(raw.__func__))
+        if isinstance(raw, property):
+            return property(capture.wrap(raw.fget), raw.fset, raw.fdel, raw.__doc__)
+        if callable(raw):
+            return capture.wrap(raw)
+        raise TypeError(f'{raw!r} can not be captured')
+
+    @contextmanager
+    def patching():
+        originals = []
+        try:
+            for name in names:
+                *path, last = name.split('.')
+                owner = module
+                for part in path:
+                    owner = getattr(owner, part)
+                try:
+                    raw = getattr_static(owner, last)
+                except AttributeError:
+                    raise ValueError(f'{module.__name__} has no function {name}') from None
+                setattr(owner, last, wrapped(raw))
+                originals.append((owner, last, raw))
+            yield
+        finally:
+            for owner, last, raw in reversed(originals):
+                setattr(owner, last, raw)
+
+    return patching()
+
+
+def profile(day: Day, part: int, lines: list[str], cpu: bool = True, memory: bool = False,
+            only: list[str] | None = None, frames: int = 1, quiet: bool = True, warmup: int = 0):
+    """Answer one part under capture, returning (answer, capture)
+
+    Warm-up runs happen first, uncaptured, so that lazy imports and first-call costs are left out;
+    module-level caches they fill are kept though.
+    """
+    from contextlib import redirect_stdout, nullcontext
+    from os import devnull
+    capture = Capture(cpu=cpu, memory=memory, frames=frames)
+    module = day.module(fresh=True)
+    with open(devnull, 'w') as sink, redirect_stdout(sink) if quiet else nullcontext():
+        for _ in range(warmup):
+            day.solver(part)(list(lines))
+        with _patched(module, only or [], capture):
+            # resolved after patching, so a captured module-level entry point such as part1 is the wrapped one
+            solver = day.solver(part)
+            answer = (solver if only else capture.wrap(solver))(lines)
+    return answer, capture
+
+
+def write(day: Day, part: int, capture: Capture, directory: Path, top: int = 20) -> list[Path]:
+    directory.mkdir(parents=True, exist_ok=True)
+    written = []
+    if capture.cpu and capture.calls:
+        written.append(directory.joinpath(f'{day.name}.part{part}.prof'))
+        capture.profiler.dump_stats(written[-1])
+    if capture.memory:
+        written.append(directory.joinpath(f'{day.name}.part{part}.memory.txt'))
+        with written[-1].open('w') as file:
+            file.write(capture.memory_report(top) + '\n')
+    return written
+
+
+if __name__ == '__main__':
+    from argparse import ArgumentParser
+    parser = ArgumentParser(description='Profile parts of Advent of Code solutions without modifying them')
+    parser.add_argument('-y', '--year', type=int, nargs='*', help='the year(s) to profile', default=None)
+    parser.add_argument('-d', '--day', type=int, nargs='*', help='the day(s) of advent to profile', default=None)
+    parser.add_argument('-p', '--part', type=int, nargs='*', help='the part(s) to profile', default=[1, 2])
+    parser.add_argument('--cpu', action='store_true', help='capture with cProfile (the default)')
+    parser.add_argument('--memory', action='store_true', help='capture allocations with tracemalloc')
+    parser.add_argument('--only', type=str, nargs='*', help='only capture inside these functions, e.g. Class.method')
+    parser.add_argument('--frames', type=int, help='tracemalloc traceback depth', default=1)
+    parser.add_argument('-n', '--top', type=int, help='entries shown per report', default=20)
+    parser.add_argument('-s', '--sort', type=str, help='pstats sort key', default='cumulative')
+    parser.add_argument('-o', '--output', type=str, help='directory for .prof and memory reports', default='profiles')
+    parser.add_argument('-w', '--warmup', type=int, help='uncaptured runs before the captured one', default=0)
+    parser.add_argument('-i', '--input', type=str, help='profile on this file instead of the puzzle input')
+    parser.add_argument('-v', '--verbose', action='store_true', help='let solutions print to stdout')
+    parser.add_argument('--offline', action='store_true', help='only use cached inputs, never the network')
+    args = parser.parse_args()
+
+    from aoc.inputs import fetch_lines
+    for d in discover(args.year, args.day):
+        if args.input:
+            with open(args.input, 'r') as file:
+                puzzle = file.read().splitlines()
+        else:
+            puzzle = fetch_lines(year=d.year, day=d.day, offline=args.offline or None)
+        for p in args.part:
+            result, captured = profile(d, p, puzzle, args.cpu or not args.memory, args.memory, args.only,
+                                       args.frames, not args.verbose, args.warmup)
+            print(f'{d.name} part {p}: {result}')
+            if captured.cpu:
+                print(captured.cpu_report(args.top, args.sort))
+            if captured.memory:
+                print(captured.memory_report(args.top))
+            for path in write(d, p, captured, Path(args.output), args.top):
+                print(f'wrote {path}')
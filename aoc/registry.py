@@ -0,0 +1,125 @@
+"""Every day's solution behind one call, solve(year, day, part, lines), for long-lived workers
+
+The solution scripts are found once, each module is imported on first use and kept, and each part's
+entry point (part1/part2, parts, solve or part, or an adapter from aoc.days) is resolved once. So a
+worker answering many requests only pays for startup and imports the first time.
+Installing SolutionFinder also makes every script importable by name, e.g. `import y23d17`, although
+src/YY/DD are not packages.
+"""
+from __future__ import annotations
+from dataclasses import dataclass, field
+from importlib.abc import MetaPathFinder
+from typing import Any, Callable
+
+from aoc.days import Day, discover
+
+
+class SolutionFinder(MetaPathFinder):
+    """Find top-level yYYdDD modules in src/YY/DD/yYYdDD.py"""
+    def find_spec(self, fullname, path=None, target=None):
+        import re
+        from importlib.util import spec_from_file_location
+        from aoc.days import SOURCE
+        if path is not None or (m := re.fullmatch(r'y(\d\d)d(\d\d)', fullname)) is None:
+            return None
+        script = SOURCE.joinpath(m[1], m[2], f'{fullname}.py')
+        return spec_from_file_location(fullname, script) if script.exists() else None
+
+
+def install():
+    """Let import statements find the solution scripts, idempotent"""
+    import sys
+    if not any(isinstance(finder, SolutionFinder) for finder in sys.meta_path):
+        sys.meta_path.append(SolutionFinder())
+
+
+@dataclass
+class SolutionRegistry:
+    days: dict[tuple[int, int], Day] = field(default_factory=dict)
+    solvers: dict[tuple[int, int, int], Callable[[list[str]], Any]] = field(default_factory=dict)
+
+    @classmethod
+    def discover(cls, years: list[int] | None = None, days: list[int] | None = None):
+        return cls({(d.year, d.day): d for d in discover(years, days)})
+
+    def day(self, year: int, day: int) -> Day:
+        year = year if year >= 2000 else 2000 + year
+        if (year, day) not in self.days:
+            raise ValueError(f'No solution found for {year} day {day}')
+        return self.days[(year, day)]
+
+    def select(self, years: list[int] | None = None, days: list[int] | None = None) -> list[Day]:
+        """The registered days, filtered by year (four or two digits) and day as discover does"""
+        return sorted(d for d in self.days.values()
+                      if (not years or d.year in years or d.year % 100 in years) and (not days or d.day in days))
+
+    def solver(self, year: int, day: int, part: int) -> Callable[[list[str]], Any]:
+        key = year if year >= 2000 else 2000 + year, day, part
+        if key not in self.solvers:
+            self.solvers[key] = self.day(year, day).solver(part)
+        return self.solvers[key]
+
+    def solve(self, year: int, day: int, part: int, lines: list[str]):
+        return self.solver(year, day, part)(lines)
+
+    def example(self, year: int, day: int, name: str | None = None) -> list[str]:
+        """The lines of a checked-in example, the only one if no name is given"""
+        found = {p.stem: p for p in self.day(year, day).examples()}
+        if name is None and len(found) == 1:
+            name = next(iter(found))
+        if name not in found:
+            raise ValueError(f'{year} day {day} has examples {sorted(found)}, not {name}')
+        with found[name].open('r') as file:
+            return file.read().splitlines()
+
+    def clear(self):
+        """Forget resolved entry points and imported modules, so the next solve re-imports with empty caches"""
+        import sys
+        for year, day in {key[:2] for key in self.solvers}:
+            sys.modules.pop(self.days[(year, day)].name, None)
+        self.solvers.clear()
+
+
+_REGISTRY: SolutionRegistry | None = None
+
+
+def registry() -> SolutionRegistry:
+    """The registry of every solution, shared by the whole process"""
+    global _REGISTRY
+    if _REGISTRY is None:
+        _REGISTRY = SolutionRegistry.discover()
+    return _REGISTRY
+
+
+def solve(year: int, day: int, part: int, lines: list[str]):
+    return registry().solve(year, day, part, lines)
+
+
+if __name__ == '__main__':
+    from argparse import ArgumentParser
+    from contextlib import redirect_stdout
+    import sys
+    from time import perf_counter
+    parser = ArgumentParser(description='Answer "year day part [input file]" requests read from stdin, one per line')
+    parser.add_argument('--offline', action='store_true', help='only use cached inputs, never the network')
+    args = parser.parse_args()
+
+    from aoc.inputs import fetch_lines
+    for request in sys.stdin:
+        if not request.strip():
+            continue
+        try:
+            y, d, p, *source = request.split()
+            y, d, p = int(y), int(d), int(p)
+            if source:
+                with open(source[0], 'r') as f:
+                    puzzle = f.read().splitlines()
+            else:
+                puzzle = fetch_lines(year=y, day=d, offline=args.offline or None)
+            start = perf_counter()
+            # keep anything the solution prints out of the answers
+            with redirect_stdout(sys.stderr):
+                answer = solve(y, d, p, puzzle)
+            print(f'{request.strip()}\t{answer}\t{perf_counter() - start:0.6f}', flush=True)
+        except Exception as error:
+            print(f'{request.strip()}\t{type(error).__name__}: {error}', flush=True)
@@ -0,0 +1,130 @@
+from __future__ import annotations
+from dataclasses import dataclass, field
+
+from aoc.days import Day, discover, deadline
+from aoc.counters import COUNTERS, collect
+from aoc.timer import REGISTRY
+
+
+@dataclass(order=True)
+class Result:
+    year: int
+    day: int
+    part: int
+    answer: str = ''
+    seconds: float = 0.0
+    status: str = 'ok'
+    cached: bool = False
+    timers: dict[str, list[float]] = field(default_factory=dict, compare=False, repr=False)
+    counters: dict[str, int] = field(default_factory=dict, compare=False, repr=False)
+
+
+_STORE = None
+
+
+def _store():
+    """This process's answer store, opened on first use and kept for every later part"""
+    global _STORE
+    if _STORE is None:
+        from aoc.answers import AnswerStore
+        _STORE = AnswerStore()
+    return _STORE
+
+
+def solve_part(year: int, day: int, part: int, timeout: float | None = None, quiet: bool = True,
+               offline: bool | None = None, cache: bool = True, force: bool = False, store=None) -> Result:
+    """Answer one part of one day, intended to run inside a worker process which keeps its imported days
+
+    With the cache on, a stored answer for the same input and source is returned without solving,
+    unless force asks for it to be recomputed (and stored again). Without a store, the process's own
+    is used, so a worker keeps one database connection for all the parts it is sent.
+    """
+    from contextlib import redirect_stdout, nullcontext
+    from os import devnull
+    from time import perf_counter
+    from aoc.inputs import fetch_lines
+    from aoc.registry import registry
+    result = Result(year, day, part)
+    start = None
+    REGISTRY.clear()
+    try:
+        solver = registry().solver(year, day, part)
+        lines = fetch_lines(year=year, day=day, offline=offline)
+        with open(devnull, 'w') as sink, redirect_stdout(sink) if quiet else nullcontext(), deadline(timeout), \
+                collect() as result.counters:
+            start = perf_counter()
+            if cache:
+                from aoc.answers import solve
+                answer, result.seconds, result.cached = solve(registry().day(year, day), part, lines,
+                                                              _store() if store is None else store, force, solver)
+            else:
+                answer = solver(lines)
+                result.seconds = perf_counter() - start
+        result.answer = str(answer)
+    except TimeoutError:
+        result.status = 'timeout'
+        result.seconds = timeout
+    except Exception as error:
+        result.status = f'{type(error).__name__}: {error}'
+        result.seconds = 0.0 if start is None else perf_counter() - start
+    result.timers = REGISTRY.samples()
+    return result
+
+
+def run(days: list[Day], parts: tuple[int, ...] = (1, 2), workers: int | None = None,
+        timeout: float | None = None, quiet: bool = True, offline: bool | None = None,
+        cache: bool = True, force: bool = False) -> list[Result]:
+    """Spread every (day, part) over a process pool so the sweep takes about as long as its slowest part"""
+    from concurrent.futures import ProcessPoolExecutor, as_completed
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        futures = [pool.submit(solve_part, d.year, d.day, p, timeout, quiet, offline, cache, force)
+                   for d in days for p in parts]
+        results = [future.result() for future in as_completed(futures)]
+    for result in results:
+        REGISTRY.merge(result.timers)
+        COUNTERS.merge({f'y{result.year % 100:02d}d{result.day:02d}.{result.part} {name}': n
+                        for name, n in result.counters.items()})
+    return sorted(results)
+
+
+def table(results: list[Result]) -> str:
+    width = max([len(r.answer) for r in results] + [6])
+    lines = [f'{"year":>4s} {"day":>3s} {"part":>4s}  {"answer":>{width}s}  {"time":>9s}  status']
+    for r in results:
+        status = f'{r.status} (cached)' if r.cached else r.status
+        lines.append(f'{r.year:4d} {r.day:3d} {r.part:4d}  {r.answer:>{width}s}  {r.seconds:8.3f}s  {status}')
+    return '\n'.join(lines)
+
+
+if __name__ == '__main__':
+    from argparse import ArgumentParser
+    from time import perf_counter
+    parser = ArgumentParser(description='Run Advent of Code solutions in parallel')
+    parser.add_argument('-y', '--year', type=int, nargs='*', help='the year(s) to run', default=None)
+    parser.add_argument('-d', '--day', type=int, nargs='*', help='the day(s) of advent to run', default=None)
+    parser.add_argument('-p', '--part', type=int, nargs='*', help='the part(s) to run', default=[1, 2])
+    parser.add_argument('-j', '--workers', type=int, help='worker processes, default one per CPU', default=None)
+    parser.add_argument('-t', '--timeout', type=float, help='per-part time limit in seconds', default=None)
+    parser.add_argument('-v', '--verbose', action='store_true', help='let solutions print to stdout')
+    parser.add_argument('--offline', action='store_true', help='only use cached inputs, never the network')
+    parser.add_argument('--no-cache', action='store_true', help='always solve, without reading or storing answers')
+    parser.add_argument('--force', action='store_true', help='solve again and replace the stored answers')
+    parser.add_argument('--timers', type=str, help='write named Timer samples to this JSON file', default=None)
+    args = parser.parse_args()
+
+    selected = discover(args.year, args.day)
+    wall = perf_counter()
+    outcome = run(selected, tuple(args.part), args.workers, args.timeout, not args.verbose, args.offline or None,
+                  not args.no_cache, args.force)
+    wall = perf_counter() - wall
+    print(table(outcome))
+    print(f'{len(outcome)} parts in {wall:0.3f} s wall time, {sum(r.seconds for r in outcome):0.3f} s summed'
+          f'{f", {sum(r.cached for r in outcome)} from stored answers" if any(r.cached for r in outcome) else ""}')
+    if len(REGISTRY.samples()):
+        print(REGISTRY.report())
+    if len(COUNTERS.counts()):
+        print(COUNTERS.report())
+    if args.timers:
+        REGISTRY.to_json(args.timers)
+    if any(r.status != 'ok' for r in outcome):
+        raise SystemExit(1)
@@ -0,0 +1,240 @@
+"""A sampling profiler: a signal timer interrupts the part every interval and the interrupted stack is counted
+
+    with Sampler(interval=0.001) as sampler:
+        solver(lines)
+    sampler.collapsed()         # 'y23d12:part1;y23d12:check;y23d12:check 412' lines, for speedscope or flamegraph.pl
+    sampler.svg()               # a self-contained flame graph
+
+Nothing runs on calls and returns, as it does under cProfile, so deep recursions keep their own pace and
+the profile their proportions. Each sample costs one Python-level signal handler walking the stack, up to
+a quarter of a microsecond a frame, and the sampler times its handler, so the overhead of a run is
+reported rather than guessed. Only the innermost limit (128) frames are walked, which keeps a tick
+within a few percent of a millisecond; a deeper stack is recorded under a '...' frame standing for
+everything further out.
+
+By default the timer counts process CPU time (ITIMER_PROF, SIGPROF), which leaves ITIMER_REAL and SIGALRM
+to aoc.days.deadline, so a part can be sampled under a time limit. Many kernels only advance the CPU timer
+once per scheduler tick, every 4 ms at 250 Hz, whatever the interval asked for; cpu=False counts wall time
+(ITIMER_REAL) at the asked-for pace instead, but must not be combined with a deadline.
+
+Signals are handled in the main thread between bytecodes, so only the main thread is sampled, and a
+long call into C (a NumPy kernel, a SciPy search) is charged to the Python line which made it.
+setitimer is Unix only.
+"""
+from __future__ import annotations
+from dataclasses import dataclass, field
+from pathlib import Path
+from time import perf_counter
+
+
+_TRUNCATED = None
+
+
+def _name(code) -> str:
+    if code is _TRUNCATED:
+        return '...'
+    return f'{Path(code.co_filename).stem}:{code.co_qualname}'
+
+
+@dataclass
+class Sampler:
+    interval: float = 0.001
+    cpu: bool = True
+    limit: int = 128
+    stacks: dict[tuple, int] = field(default_factory=dict)
+    overhead: float = 0.0
+    elapsed: float = 0.0
+    truncated: int = 0
+    _root: object = None
+    _previous: object = None
+    _started: float = 0.0
+    _busy: bool = False
+
+    def _sample(self, signum, frame):
+        if self._busy:
+            # a tick which lands inside the handler, when a walk takes longer than the interval
+            return
+        self._busy = True
+        started = perf_counter()
+        stack = []
+        root, limit = self._root, self.limit
+        while frame is not None and frame is not root:
+            if len(stack) == limit:
+                stack.append(_TRUNCATED)
+                self.truncated += 1
+                break
+            stack.append(frame.f_code)
+            frame = frame.f_back
+        key = tuple(stack)
+        self.stacks[key] = self.stacks.get(key, 0) + 1
+        self.overhead += perf_counter() - started
+        self._busy = False
+
+    def __enter__(self):
+        import signal
+        import sys
+        if not hasattr(signal, 'setitimer'):
+            raise RuntimeError('Sampling needs signal.setitimer, which this platform lacks')
+        # frames from the one holding the with block outwards are the same in every sample
+        self._root = sys._getframe(1)
+        which, number = (signal.ITIMER_PROF, signal.SIGPROF) if self.cpu else (signal.ITIMER_REAL, signal.SIGALRM)
+        self._previous = signal.signal(number, self._sample)
+        self._started = perf_counter()
+        signal.setitimer(which, self.interval, self.interval)
+        return self
+
+    def __exit__(self, *exc_info):
+        import signal
+        which, number = (signal.ITIMER_PROF, signal.SIGPROF) if self.cpu else (signal.ITIMER_REAL, signal.SIGALRM)
+        signal.setitimer(which, 0)
+        signal.signal(number, self._previous)
+        self.elapsed += perf_counter() - self._started
+        self._root = None
+        return False
+
+    @property
+    def samples(self) -> int:
+        return sum(self.stacks.values())
+
+    def named(self) -> dict[tuple[str, ...], int]:
+        """The sample count of every stack of function names, outermost first"""
+        named = {}
+        for stack, count in self.stacks.items():
+            key = tuple(_name(code) for code in reversed(stack))
+            named[key] = named.get(key, 0) + count
+        return named
+
+    def collapsed(self) -> str:
+        """One 'outer;inner;innermost count' line per distinct stack, the flame graph tools' input format"""
+        return '\n'.join(f'{";".join(stack)} {count}' for stack, count in sorted(self.named().items()))
+
+    def report(self, top: int = 20) -> str:
+        """The functions most often on the stack, and most often at its top"""
+        total, own, anywhere = self.samples, {}, {}
+        for stack, count in self.named().items():
+            if stack:
+                own[stack[-1]] = own.get(stack[-1], 0) + count
+            for name in set(stack):
+                anywhere[name] = anywhere.get(name, 0) + count
+        lines = [f'{total} samples every {self.interval * 1000:g} ms over {self.elapsed:0.3f} s, '
+                 f'{self.overhead / max(self.elapsed, 1e-9):0.1%} spent sampling',
+                 f'{"self":>7s} {"total":>7s}  function']
+        for name, count in sorted(anywhere.items(), key=lambda item: (-own.get(item[0], 0), -item[1]))[:top]:
+            lines.append(f'{own.get(name, 0) / total:7.1%} {count / total:7.1%}  {name}')
+        return '\n'.join(lines)
+
+    def svg(self, title: str = 'Flame graph', width: int = 1200, row: int = 16) -> str:
+        return flamegraph(self.named(), title, width, row)
+
+
+def _tree(stacks: dict[tuple[str, ...], int]) -> dict:
+    root = {'name': 'all', 'count': 0, 'children': {}}
+    for stack, count in stacks.items():
+        node = root
+        node['count'] += count
+        for name in stack:
+            node = node['children'].setdefault(name, {'name': name, 'count': 0, 'children': {}})
+            node['count'] += count
+    return root
+
+
+def _colour(name: str) -> str:
+    from zlib import crc32
+    h = crc32(name.encode())
+    return f'rgb({205 + h % 50},{(h >> 8) % 180 + 30},{(h >> 16) % 55})'
+
+
+def flamegraph(stacks: dict[tuple[str, ...], int], title: str = 'Flame graph', width: int = 1200,
+               row: int = 16) -> str:
+    """A self-contained SVG flame graph: outermost calls at the bottom, widths proportional to samples
+
+    Hovering over a frame shows its name and share of the samples; nothing outside the file is needed.
+    """
+    from html import escape
+    root = _tree(stacks)
+    total = max(root['count'], 1)
+
+    rows = 1 + max((len(stack) for stack in stacks), default=0)
+    height = (rows + 2) * row
+    scale = (width - 20) / total
+    boxes = []
+    # an explicit stack, since recursions profiled here can be deeper than Python's own limit
+    pending = [(root, 10.0, 0)]
+    while pending:
+        node, x, level = pending.pop()
+        w = node['count'] * scale
+        if w < 0.1:
+            continue
+        y = height - (level + 2) * row
+        label = f'{node["name"]} ({node["count"]} samples, {node["count"] / total:0.2%})'
+        text = node['name'][:int(w / 7)]
+        boxes.append(f'<g><title>{escape(label)}</title><rect x="{x:0.2f}" y="{y}" width="{w:0.2f}" '
+                     f'height="{row - 1}" fill="{_colour(node["name"])}" rx="2"/>'
+                     + (f'<text x="{x + 3:0.2f}" y="{y + row - 4}">{escape(text)}</text>' if len(text) > 2 else '')
+                     + '</g>')
+        for child in sorted(node['children'].values(), key=lambda c: c['name']):
+            pending.append((child, x, level + 1))
+            x += child['count'] * scale
+    return '\n'.join([
+        f'<svg xmlns="http://www.w3.org/2000/svg" width="{width}" height="{height}" '
+        f'viewBox="0 0 {width} {height}" font-family="monospace" font-size="11">',
+        f'<rect width="100%" height="100%" fill="#f8f8f0"/>',
+        f'<text x="{width / 2}" y="{row}" text-anchor="middle" font-size="14">{escape(title)}</text>',
+        *boxes,
+        '</svg>'])
+
+
+def sample(day, part: int, lines: list[str], interval: float = 0.001, cpu: bool = True, quiet: bool = True,
+           warmup: int = 0):
+    """Answer one part of a day under the sampler, returning (answer, sampler)"""
+    from contextlib import redirect_stdout, nullcontext
+    from os import devnull
+    solver = day.solver(part, fresh=True)
+    sampler = Sampler(interval, cpu)
+    with open(devnull, 'w') as sink, redirect_stdout(sink) if quiet else nullcontext():
+        for _ in range(warmup):
+            solver(list(lines))
+        with sampler:
+            answer = solver(lines)
+    return answer, sampler
+
+
+def write(day, part: int, sampler: Sampler, directory: Path) -> list[Path]:
+    directory.mkdir(parents=True, exist_ok=True)
+    collapsed = directory.joinpath(f'{day.name}.part{part}.collapsed')
+    collapsed.write_text(sampler.collapsed() + '\n')
+    svg = directory.joinpath(f'{day.name}.part{part}.svg')
+    svg.write_text(sampler.svg(f'{day.name} part {part}, {sampler.samples} samples') + '\n')
+    return [collapsed, svg]
+
+
+if __name__ == '__main__':
+    from argparse import ArgumentParser
+    from aoc.registry import registry
+    parser = ArgumentParser(description='Sample the stacks of Advent of Code solutions and draw flame graphs')
+    parser.add_argument('-y', '--year', type=int, nargs='*', help='the year(s) to sample', default=None)
+    parser.add_argument('-d', '--day', type=int, nargs='*', help='the day(s) of advent to sample', default=None)
+    parser.add_argument('-p', '--part', type=int, nargs='*', help='the part(s) to sample', default=[1, 2])
+    parser.add_argument('-r', '--rate', type=float, help='milliseconds between samples', default=1.0)
+    parser.add_argument('--wall', action='store_true', help='sample wall time rather than CPU time')
+    parser.add_argument('-n', '--top', type=int, help='functions shown per report', default=20)
+    parser.add_argument('-o', '--output', type=str, help='directory for .collapsed and .svg files', default='profiles')
+    parser.add_argument('-w', '--warmup', type=int, help='unsampled runs before the sampled one', default=0)
+    parser.add_argument('-i', '--input', type=str, help='sample on this file instead of the puzzle input')
+    parser.add_argument('-v', '--verbose', action='store_true', help='let solutions print to stdout')
+    parser.add_argument('--offline', action='store_true', help='only use cached inputs, never the network')
+    args = parser.parse_args()
+
+    from aoc.inputs import fetch_lines
+    for d in registry().select(args.year, args.day):
+        if args.input:
+            with open(args.input, 'r') as file:
+                puzzle = file.read().splitlines()
+        else:
+            puzzle = fetch_lines(year=d.year, day=d.day, offline=args.offline or None)
+        for p in args.part:
+            result, sampled = sample(d, p, puzzle, args.rate / 1000, not args.wall, not args.verbose, args.warmup)
+            print(f'{d.name} part {p}: {result}')
+            print(sampled.report(args.top))
+            for path in write(d, p, sampled, Path(args.output)):
+                print(f'wrote {path}')
@@ -0,0 +1,121 @@
+"""Measure how each part's run time grows with input size, on generated inputs beyond the puzzle size
+
+Sizes climb a geometric ladder. The exponent k in time ~ characters ** k is fitted by least squares
+in log-log space, against the input length in characters so grids and lists compare directly.
+A ladder stops at the first size which exceeds the time limit or fails; sizes too small for a
+generator are skipped.
+"""
+from __future__ import annotations
+from dataclasses import dataclass, field
+
+from aoc.days import Day, discover, deadline
+
+
+@dataclass
+class Sample:
+    size: int
+    characters: int
+    seconds: float
+
+
+@dataclass
+class Scaling:
+    key: str
+    samples: list[Sample] = field(default_factory=list)
+    status: str = 'ok'
+
+    def exponent(self, floor: float = 1e-4) -> float | None:
+        """The fitted power of the input length, ignoring runs too quick to time reliably"""
+        import numpy as np
+        timed = [s for s in self.samples if s.seconds > floor]
+        if len({s.characters for s in timed}) < 2:
+            return None
+        slope, _ = np.polyfit(np.log([s.characters for s in timed]), np.log([s.seconds for s in timed]), 1)
+        return float(slope)
+
+
+def ladder(start: int, factor: float, steps: int) -> list[int]:
+    sizes = []
+    for i in range(steps):
+        size = max(1, round(start * factor ** i))
+        if not sizes or size > sizes[-1]:
+            sizes.append(size)
+    return sizes
+
+
+def scale(day: Day, part: int, sizes: list[int], seed: int = 0, runs: int = 3, timeout: float | None = 10):
+    """Time one part at each size, keeping the fastest of several freshly imported runs"""
+    from contextlib import redirect_stdout
+    from os import devnull
+    from time import perf_counter
+    from aoc.generators import generate
+    result = Scaling(f'{day.name}:{part}')
+    with open(devnull, 'w') as sink, redirect_stdout(sink):
+        for size in sizes:
+            try:
+                with deadline(timeout):
+                    lines = generate(day.year, day.day, size, seed)
+            except ValueError:
+                # smaller than the generator can plant the puzzle's structure in
+                continue
+            except TimeoutError:
+                result.status = f'generator timeout at {size}'
+                break
+            best = None
+            try:
+                with deadline(timeout):
+                    for _ in range(runs):
+                        solver = day.solver(part, fresh=True)
+                        start = perf_counter()
+                        solver(list(lines))
+                        elapsed = perf_counter() - start
+                        best = elapsed if best is None else min(best, elapsed)
+            except TimeoutError:
+                result.status = f'timeout at {size}'
+            except Exception as error:
+                result.status = f'{type(error).__name__} at {size}: {error}'
+            if best is not None:
+                result.samples.append(Sample(size, sum(len(line) + 1 for line in lines), best))
+            if result.status != 'ok':
+                break
+    return result
+
+
+def report(results: list[Scaling]) -> str:
+    width = max([len(r.key) for r in results] + [4])
+    lines = [f'{"case":{width}s} {"exponent":>8s}  sizes (seconds)']
+    for r in results:
+        k = r.exponent()
+        fitted = f'{k:8.2f}' if k is not None else f'{"-":>8s}'
+        timings = ' '.join(f'{s.size}({s.seconds:0.3g})' for s in r.samples)
+        lines.append(f'{r.key:{width}s} {fitted}  {timings}' + ('' if r.status == 'ok' else f'  [{r.status}]'))
+    return '\n'.join(lines)
+
+
+if __name__ == '__main__':
+    from argparse import ArgumentParser
+    from aoc.generators import GENERATORS, SIZES
+    parser = ArgumentParser(description='Fit the empirical complexity of Advent of Code solutions on generated inputs')
+    parser.add_argument('-y', '--year', type=int, nargs='*', help='the year(s) to measure', default=None)
+    parser.add_argument('-d', '--day', type=int, nargs='*', help='the day(s) of advent to measure', default=None)
+    parser.add_argument('-p', '--part', type=int, nargs='*', help='the part(s) to measure', default=[1, 2])
+    parser.add_argument('--start', type=float, help='first size, as a fraction of the puzzle size', default=0.25)
+    parser.add_argument('-f', '--factor', type=float, help='growth of the size per step', default=2)
+    parser.add_argument('-n', '--steps', type=int, help='sizes per ladder', default=5)
+    parser.add_argument('-r', '--runs', type=int, help='runs per size, the fastest is kept', default=3)
+    parser.add_argument('-t', '--timeout', type=float, help='time limit per size in seconds', default=10)
+    parser.add_argument('-s', '--seed', type=int, help='random seed for the generators', default=0)
+    parser.add_argument('--max-exponent', type=float, help='fail if any fitted exponent is larger than this')
+    args = parser.parse_args()
+
+    results = []
+    for d in discover(args.year, args.day):
+        if (d.year, d.day) not in GENERATORS:
+            continue
+        sizes = ladder(max(1, round(SIZES[(d.year, d.day)] * args.start)), args.factor, args.steps)
+        for p in args.part:
+            results.append(scale(d, p, sizes, args.seed, args.runs, args.timeout))
+    print(report(results))
+    if args.max_exponent is not None:
+        if any((k := r.exponent()) is not None and k > args.max_exponent for r in results):
+            raise SystemExit(1)
@@ -0,0 +1,292 @@
+"""Shortest-path searches shared by the grid and graph puzzles
+
+A graph can be given as
+  - an adjacency dict, {node: {neighbour: weight}} or {node: [(neighbour, weight), ...]},
+  - a CSR of integer nodes 0 .. n-1, whose arrays may be lists or NumPy arrays, or
+  - a callable which returns the (neighbour, weight) pairs leaving a node.
+Weights are non-negative integers; bfs ignores them. Every search starts from one source, or from
+several with sources={node: initial distance}. It stops early once a node matching goal (a node, or
+a predicate) is settled. The distances and predecessors of the reached nodes are returned as a Paths.
+For a CSR these are lists indexed by node, holding -1 for unreached nodes; otherwise they are dicts.
+Each search adds the nodes it expanded and pushed to aoc.counters, as '<search>.expanded' and '.pushed'.
+"""
+from __future__ import annotations
+from dataclasses import dataclass
+from typing import Any, Callable, NamedTuple
+
+from aoc import counters
+
+_NONE = object()
+
+
+class CSR(NamedTuple):
+    """Compressed sparse rows: the edges leaving node u are indices[indptr[u]:indptr[u+1]]"""
+    indptr: Any
+    indices: Any
+    weights: Any = None
+
+    @property
+    def size(self) -> int:
+        return len(self.indptr) - 1
+
+
+class _Reached(dict):
+    """A distance dict which reports -1 for nodes not reached yet, like the CSR distance lists"""
+    def __missing__(self, key):
+        return -1
+
+
+@dataclass
+class Paths:
+    distance: dict | list
+    previous: dict | list
+    found: Any = None
+
+    @property
+    def cost(self) -> int:
+        """The distance to the goal which stopped the search, -1 if it was not reached"""
+        return -1 if self.found is None else self.distance[self.found]
+
+    def path(self, node=_NONE) -> list:
+        """The nodes from a source to node, or to the goal which was found"""
+        node = self.found if node is _NONE else node
+        steps = [node]
+        if isinstance(self.previous, list):
+            while (node := self.previous[node]) >= 0:
+                steps.append(node)
+        else:
+            while (node := self.previous.get(node, _NONE)) is not _NONE:
+                steps.append(node)
+        return steps[::-1]
+
+
+def _as_list(values):
+    return values.tolist() if hasattr(values, 'tolist') else list(values)
+
+
+def adjacency(graph) -> tuple[Callable, int | None]:
+    """A (neighbours, size) pair for any supported graph, size is only known for a CSR"""
+    if isinstance(graph, CSR):
+        indptr, indices = _as_list(graph.indptr), _as_list(graph.indices)
+        weights = [1] * len(indices) if graph.weights is None else _as_list(graph.weights)
+
+        def neighbours(u):
+            lo, hi = indptr[u], indptr[u + 1]
+            return zip(indices[lo:hi], weights[lo:hi])
+        return neighbours, graph.size
+    if isinstance(graph, dict):
+        empty = {}
+
+        def neighbours(u):
+            edges = graph.get(u, empty)
+            return edges.items() if isinstance(edges, dict) else edges
+        return neighbours, None
+    if callable(graph):
+        return graph, None
+    raise TypeError(f'Unsupported graph type {type(graph).__name__}')
+
+
+def _start(size: int | None, source, sources):
+    if sources is None:
+        sources = {source: 0}
+    elif not isinstance(sources, dict):
+        sources = {s: 0 for s in sources}
+    if size is None:
+        return _Reached(sources), {}, sources
+    distance, previous = [-1] * size, [-1] * size
+    for s, d in sources.items():
+        distance[s] = d
+    return distance, previous, sources
+
+
+def _counted(search: str, paths: Paths, expanded: int, pushed: int) -> Paths:
+    counters.add(f'{search}.expanded', expanded)
+    counters.add(f'{search}.pushed', pushed)
+    return paths
+
+
+def _is_goal(goal) -> Callable:
+    if goal is None:
+        return lambda node: False
+    if callable(goal):
+        return goal
+    return lambda node: node == goal
+
+
+def dijkstra(graph, source=None, goal=None, *, sources=None) -> Paths:
+    """Shortest distances with a binary heap of plain (distance, order, node) tuples
+
+    The nodes of a CSR are integers, so their heap entries are packed into single integers instead.
+    Other nodes are never compared: equal distances are ordered by when they were pushed.
+    """
+    from heapq import heappush, heappop, heapify
+    from itertools import count
+    neighbours, size = adjacency(graph)
+    distance, previous, sources = _start(size, source, sources)
+    is_goal = _is_goal(goal)
+    found = None
+    expanded = pushed = 0
+    if size is None:
+        order = count()
+        queue = [(d, next(order), s) for s, d in sources.items()]
+        heapify(queue)
+        while queue:
+            d, _, u = heappop(queue)
+            if d > distance[u]:
+                continue
+            expanded += 1
+            if is_goal(u):
+                found = u
+                break
+            for v, w in neighbours(u):
+                dv = distance[v]
+                if dv < 0 or d + w < dv:
+                    distance[v] = d + w
+                    previous[v] = u
+                    heappush(queue, (d + w, next(order), v))
+                    pushed += 1
+    else:
+        queue = [d * size + s for s, d in sources.items()]
+        heapify(queue)
+        while queue:
+            d, u = divmod(heappop(queue), size)
+            if d > distance[u]:
+                continue
+            expanded += 1
+            if is_goal(u):
+                found = u
+                break
+            for v, w in neighbours(u):
+                dv = distance[v]
+                if dv < 0 or d + w < dv:
+                    distance[v] = d + w
+                    previous[v] = u
+                    heappush(queue, (d + w) * size + v)
+                    pushed += 1
+    return _counted('dijkstra', Paths(distance, previous, found), expanded, pushed)
+
+
+def bfs(graph, source=None, goal=None, *, sources=None) -> Paths:
+    """Fewest edges from the sources, every weight is treated as one"""
+    from collections import deque
+    neighbours, size = adjacency(graph)
+    distance, previous, sources = _start(size, source, sources)
+    is_goal = _is_goal(goal)
+    queue = deque(sorted(sources, key=sources.get))
+    expanded = pushed = 0
+    while queue:
+        u = queue.popleft()
+        expanded += 1
+        if is_goal(u):
+            return _counted('bfs', Paths(distance, previous, u), expanded, pushed)
+        d = distance[u] + 1
+        for v, _ in neighbours(u):
+            if distance[v] < 0:
+                distance[v] = d
+                previous[v] = u
+                queue.append(v)
+                pushed += 1
+    return _counted('bfs', Paths(distance, previous), expanded, pushed)
+
+
+def zero_one_bfs(graph, source=None, goal=None, *, sources=None) -> Paths:
+    """Shortest distances when every weight is zero or one, using a double-ended queue"""
+    from collections import deque
+    neighbours, size = adjacency(graph)
+    distance, previous, sources = _start(size, source, sources)
+    is_goal = _is_goal(goal)
+    queue = deque(sorted(((d, s) for s, d in sources.items()), key=lambda ds: ds[0]))
+    expanded = pushed = 0
+    while queue:
+        d, u = queue.popleft()
+        if d > distance[u]:
+            continue
+        expanded += 1
+        if is_goal(u):
+            return _counted('zero_one_bfs', Paths(distance, previous, u), expanded, pushed)
+        for v, w in neighbours(u):
+            dv = distance[v]
+            if dv < 0 or d + w < dv:
+                distance[v] = d + w
+                previous[v] = u
+                if w:
+                    queue.append((d + 1, v))
+                else:
+                    queue.appendleft((d, v))
+                pushed += 1
+    return _counted('zero_one_bfs', Paths(distance, previous), expanded, pushed)
+
+
+def dial(graph, source=None, goal=None, *, sources=None, largest: int = 9) -> Paths:
+    """Shortest distances with a circular bucket queue, for small integer weights up to largest
+
+    Popping is O(1) instead of the O(log n) of a heap, and nodes never need to be compared.
+    A heavier edge would wrap around the buckets and be popped too early, so it raises a ValueError.
+    """
+    neighbours, size = adjacency(graph)
+    distance, previous, sources = _start(size, source, sources)
+    is_goal = _is_goal(goal)
+    span = largest + 1 + max(sources.values())
+    buckets = [[] for _ in range(span)]
+    for s, d in sources.items():
+        buckets[d % span].append(s)
+    queued, d = len(sources), 0
+    expanded = pushed = 0
+    while queued:
+        bucket = buckets[d % span]
+        while bucket:
+            u = bucket.pop()
+            queued -= 1
+            if distance[u] != d:
+                continue
+            expanded += 1
+            if is_goal(u):
+                return _counted('dial', Paths(distance, previous, u), expanded, pushed)
+            for v, w in neighbours(u):
+                if w > largest:
+                    raise ValueError(f'dial was given largest={largest}, but the edge {u} -> {v} weighs {w}')
+                dv = distance[v]
+                if dv < 0 or d + w < dv:
+                    distance[v] = d + w
+                    previous[v] = u
+                    buckets[(d + w) % span].append(v)
+                    queued += 1
+                    pushed += 1
+        d += 1
+    return _counted('dial', Paths(distance, previous), expanded, pushed)
+
+
+def astar(graph, source=None, goal=None, heuristic: Callable[[Any], int] | None = None, *, sources=None) -> Paths:
+    """Dijkstra ordered by distance plus an admissible (never overestimating) heuristic of the distance left"""
+    from heapq import heappush, heappop, heapify
+    from itertools import count
+    if heuristic is None:
+        return dijkstra(graph, source, goal, sources=sources)
+    neighbours, size = adjacency(graph)
+    distance, previous, sources = _start(size, source, sources)
+    is_goal = _is_goal(goal)
+    order = count()
+    queue = [(d + heuristic(s), d, next(order), s) for s, d in sources.items()]
+    heapify(queue)
+    expanded = pushed = 0
+    while queue:
+        _, d, _, u = heappop(queue)
+        if d > distance[u]:
+            continue
+        expanded += 1
+        if is_goal(u):
+            return _counted('astar', Paths(distance, previous, u), expanded, pushed)
+        for v, w in neighbours(u):
+            dv = distance[v]
+            if dv < 0 or d + w < dv:
+                distance[v] = d + w
+                previous[v] = u
+                heappush(queue, (d + w + heuristic(v), d + w, next(order), v))
+                pushed += 1
+    return _counted('astar', Paths(distance, previous), expanded, pushed)
+
+
+def manhattan(goal) -> Callable:
+    """An A* heuristic for unit steps on a grid, with nodes given as (x, y) pairs"""
+    gx, gy = goal
+    return lambda node: abs(node[0] - gx) + abs(node[1] - gy)
@@ -0,0 +1,126 @@
+from contextlib import ContextDecorator
+from dataclasses import dataclass, field, replace
+import os
+import time
+from typing import Any, Callable, ClassVar, Optional
+
+
+class TimerError(Exception):
+    """A custom exception used to report errors in use of Timer class"""
+
+
+class Registry:
+    """Every timing sample recorded per name, safe to share between threads
+
+    A forked child process starts with an empty registry; send its samples() back to the
+    parent and merge() them there to combine measurements from worker processes.
+    """
+
+    def __init__(self):
+        from threading import Lock
+        self._lock = Lock()
+        self._samples: dict[str, list[float]] = {}
+
+    def _after_fork(self):
+        from threading import Lock
+        self._lock = Lock()
+        self._samples = {}
+
+    def add(self, name: str, seconds: float) -> None:
+        with self._lock:
+            self._samples.setdefault(name, []).append(seconds)
+
+    def merge(self, samples: dict[str, list[float]]) -> None:
+        with self._lock:
+            for name, values in samples.items():
+                self._samples.setdefault(name, []).extend(values)
+
+    def samples(self) -> dict[str, list[float]]:
+        with self._lock:
+            return {name: list(values) for name, values in self._samples.items()}
+
+    def clear(self) -> None:
+        with self._lock:
+            self._samples.clear()
+
+    def summary(self) -> dict[str, dict[str, float]]:
+        return {name: distribution(values) for name, values in sorted(self.samples().items())}
+
+    def to_json(self, path=None) -> str:
+        import json
+        text = json.dumps({'summary': self.summary(), 'samples': self.samples()}, indent=1)
+        if path is not None:
+            with open(path, 'w') as file:
+                file.write(text)
+        return text
+
+    def report(self) -> str:
+        summary = self.summary()
+        width = max([len(name) for name in summary] + [4])
+        lines = [f'{"name":{width}s} {"count":>6s} {"min":>9s} {"median":>9s} {"p95":>9s} {"max":>9s}']
+        for name, d in summary.items():
+            lines.append(f'{name:{width}s} {d["count"]:6d} {d["min"]:9.4f} {d["median"]:9.4f} '
+                         f'{d["p95"]:9.4f} {d["max"]:9.4f}')
+        return '\n'.join(lines)
+
+
+def distribution(values: list[float]) -> dict[str, float]:
+    from math import ceil
+    from statistics import median
+    ordered = sorted(values)
+    n = len(ordered)
+    return {'count': n, 'min': ordered[0], 'median': median(ordered), 'p95': ordered[max(ceil(0.95 * n) - 1, 0)],
+            'max': ordered[-1], 'total': sum(ordered)}
+
+
+REGISTRY = Registry()
+if hasattr(os, 'register_at_fork'):
+    os.register_at_fork(after_in_child=REGISTRY._after_fork)
+
+
+@dataclass
+class Timer(ContextDecorator):
+    """Time your code using a class, context manager, or decorator"""
+
+    registry: ClassVar[Registry] = REGISTRY
+    name: Optional[str] = None
+    text: str = "Elapsed time: {:0.4f} seconds"
+    logger: Optional[Callable[[str], None]] = print
+    _start_time: Optional[float] = field(default=None, init=False, repr=False)
+
+    def start(self) -> None:
+        """Start a new timer"""
+        if self._start_time is not None:
+            raise TimerError(f"Timer is running. Use .stop() to stop it")
+
+        self._start_time = time.perf_counter()
+
+    def stop(self) -> float:
+        """Stop the timer, and report the elapsed time"""
+        if self._start_time is None:
+            raise TimerError(f"Timer is not running. Use .start() to start it")
+
+        # Calculate elapsed time
+        elapsed_time = time.perf_counter() - self._start_time
+        self._start_time = None
+
+        # Report elapsed time
+        if self.logger:
+            self.logger(self.text.format(elapsed_time))
+        if self.name:
+            self.registry.add(self.name, elapsed_time)
+
+        return elapsed_time
+
+    def _recreate_cm(self) -> "Timer":
+        """Each decorated call gets its own start time, so threads and recursion do not collide"""
+        return replace(self)
+
+    def __enter__(self) -> "Timer":
+        """Start a new timer as a context manager"""
+        self.start()
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        """Stop the context manager timer"""
+        self.stop()
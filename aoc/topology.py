@@ -0,0 +1,118 @@
+"""Character grids framed by one wall cell on every side and held as one flat string, so that a step
+from any grid cell lands on a cell that exists and no neighbour lookup needs a bounds check
+
+Cell (row, column) of the grid is index (row + 1) * width + column + 1 of the framed string, where
+width = cols + 2. A step is adding one of the precomputed offsets, and a step off the grid reads the
+wall character, which the day's own test ("is it open?", "is it an 'M'?") already rejects.
+
+    grid = Topology.from_lines(lines)
+    for d in grid.offsets4:                   # N, E, S, W
+        if grid.cells[i + d] != grid.wall: ...
+
+Headings are 0 .. 3 for N, E, S, W, clockwise, with LEFT, RIGHT and BACK as lookup tables, and a
+(cell, heading) state packs into the single int cell * 4 + heading; see state, advance and turn.
+Steps of more than one cell need the first step's cell to be inside the grid, as it is for any walk
+which stops at the first wall.
+"""
+from __future__ import annotations
+from dataclasses import dataclass
+from functools import cached_property
+
+N, E, S, W = range(4)
+LEFT = (W, N, E, S)
+RIGHT = (E, S, W, N)
+BACK = (S, W, N, E)
+
+
+@dataclass(frozen=True)
+class Topology:
+    rows: int
+    cols: int
+    cells: str
+    wall: str = '#'
+
+    @classmethod
+    def from_lines(cls, lines: list[str], wall: str = '#'):
+        cols = len(lines[0]) if lines else 0
+        if any(len(line) != cols for line in lines):
+            raise ValueError('Lines of a grid must all have the same length')
+        edge = wall * (cols + 2)
+        cells = ''.join([edge, *(f'{wall}{line}{wall}' for line in lines), edge])
+        return cls(len(lines), cols, cells, wall)
+
+    @property
+    def width(self) -> int:
+        return self.cols + 2
+
+    def __len__(self):
+        return len(self.cells)
+
+    @cached_property
+    def offsets4(self) -> tuple[int, int, int, int]:
+        """The flat steps N, E, S, W, indexed by heading"""
+        w = self.width
+        return -w, 1, w, -1
+
+    @cached_property
+    def offsets8(self) -> tuple[int, ...]:
+        """The flat steps N, NE, E, SE, S, SW, W, NW"""
+        w = self.width
+        return -w, 1 - w, 1, w + 1, w, w - 1, -1, -w - 1
+
+    def index(self, row: int, col: int) -> int:
+        return (row + 1) * self.width + col + 1
+
+    def position(self, i: int) -> tuple[int, int]:
+        row, col = divmod(i, self.width)
+        return row - 1, col - 1
+
+    def interior(self) -> list[int]:
+        """The index of every grid cell, in row-major order"""
+        w = self.width
+        return [i for r in range(1, self.rows + 1) for i in range(r * w + 1, r * w + self.cols + 1)]
+
+    def find(self, chars: str) -> list[int]:
+        """The index of every cell holding any of chars"""
+        return [i for i, c in enumerate(self.cells) if c in chars]
+
+    def blocked(self) -> bytearray:
+        """A mutable 1 for every wall cell and 0 for every open one, for grids whose walls change"""
+        wall = self.wall
+        return bytearray(c == wall for c in self.cells)
+
+    def neighbours(self, i: int, diagonal: bool = False) -> list[int]:
+        cells, wall = self.cells, self.wall
+        return [j for d in (self.offsets8 if diagonal else self.offsets4) if cells[j := i + d] != wall]
+
+    def adjacency(self, diagonal: bool = False) -> list[tuple[int, ...]]:
+        """The open neighbours of every cell, looked up by index; walls have none"""
+        cells, wall = self.cells, self.wall
+        offsets = self.offsets8 if diagonal else self.offsets4
+        table = [()] * len(cells)
+        for i in self.interior():
+            if cells[i] != wall:
+                table[i] = tuple(j for d in offsets if cells[j := i + d] != wall)
+        return table
+
+    @cached_property
+    def state_offsets(self) -> tuple[int, int, int, int]:
+        """The change of a packed (cell, heading) state on one step ahead, indexed by heading"""
+        return tuple(4 * d for d in self.offsets4)
+
+    def advance(self, state: int) -> int:
+        """The state one step ahead, keeping the heading"""
+        return state + self.state_offsets[state & 3]
+
+
+def state(i: int, heading: int) -> int:
+    return i << 2 | heading
+
+
+def unstate(packed: int) -> tuple[int, int]:
+    """The (cell, heading) of a packed state"""
+    return packed >> 2, packed & 3
+
+
+def turn(packed: int, table: tuple[int, int, int, int]) -> int:
+    """The state at the same cell with its heading looked up in LEFT, RIGHT or BACK"""
+    return (packed & ~3) | table[packed & 3]
@@ -0,0 +1,108 @@
+"""Disjoint sets over integer ids, and connected components of whole grids at once
+
+UnionFind keeps its parents and sizes in two array('i')s, four bytes per element and no Python object
+per element, with path halving in find and union by size, so any sequence of operations runs in
+nearly linear time. Elements are 0 .. n-1; add() appends one more, for sets which grow as they go.
+
+label(grid, predicate) and regions(grid) find the 4-connected (or 8-connected) components of a whole
+NumPy grid in one call to scipy.ndimage.label, without visiting cells from Python, so grids of 10^8
+cells are labelled in seconds. Both return an int32 label per cell, 0 for cells in no component, and
+the number of components.
+"""
+from __future__ import annotations
+from array import array
+
+from aoc.lazy import module
+
+np = module('numpy')
+
+
+class UnionFind:
+    __slots__ = ('parent', 'size', 'count')
+
+    def __init__(self, n: int = 0):
+        self.parent = array('i', range(n))
+        self.size = array('i', [1]) * n
+        self.count = n
+
+    def __len__(self):
+        return len(self.parent)
+
+    def add(self) -> int:
+        """A new element in a set of its own"""
+        self.parent.append(len(self.parent))
+        self.size.append(1)
+        self.count += 1
+        return len(self.parent) - 1
+
+    def find(self, x: int) -> int:
+        parent = self.parent
+        while (p := parent[x]) != x:
+            # path halving: point every other element on the way at its grandparent
+            parent[x] = x = parent[p]
+        return x
+
+    def union(self, a: int, b: int) -> bool:
+        """Join the sets holding a and b, returning whether they were separate"""
+        a, b = self.find(a), self.find(b)
+        if a == b:
+            return False
+        if self.size[a] < self.size[b]:
+            a, b = b, a
+        self.parent[b] = a
+        self.size[a] += self.size[b]
+        self.count -= 1
+        return True
+
+    def connected(self, a: int, b: int) -> bool:
+        return self.find(a) == self.find(b)
+
+    def set_size(self, x: int) -> int:
+        return self.size[self.find(x)]
+
+    def roots(self) -> list[int]:
+        return [x for x, p in enumerate(self.parent) if x == p]
+
+    def groups(self) -> list[list[int]]:
+        """The members of every set"""
+        members = {}
+        for x in range(len(self.parent)):
+            members.setdefault(self.find(x), []).append(x)
+        return list(members.values())
+
+
+def _structure(diagonal: bool):
+    return np.ones((3, 3), dtype=bool) if diagonal else None
+
+
+def label(grid, predicate=None, diagonal: bool = False):
+    """Components of the cells where predicate(grid) holds, given the whole array, or of nonzero cells"""
+    from scipy.ndimage import label as ndlabel
+    grid = np.asarray(grid)
+    mask = grid != 0 if predicate is None else np.asarray(predicate(grid), dtype=bool)
+    labels = np.zeros(mask.shape, dtype=np.int32)
+    count = ndlabel(mask, structure=_structure(diagonal), output=labels)
+    return labels, count
+
+
+def regions(grid, diagonal: bool = False):
+    """Components of neighbouring cells holding the same value, every cell in one of them"""
+    from scipy.ndimage import label as ndlabel
+    grid = np.asarray(grid)
+    labels = np.zeros(grid.shape, dtype=np.int32)
+    part = np.zeros(grid.shape, dtype=np.int32)
+    total = 0
+    for value in np.unique(grid):
+        mask = grid == value
+        count = ndlabel(mask, structure=_structure(diagonal), output=part)
+        labels[mask] = part[mask] + total
+        total += count
+    return labels, total
+
+
+def members(labels, count: int) -> list:
+    """The flat indices of the cells of each component 1 .. count, in row-major order"""
+    flat = labels.ravel()
+    order = np.argsort(flat, kind='stable')
+    bounds = np.searchsorted(flat[order], np.arange(count + 2))
+    return [order[bounds[i]:bounds[i + 1]] for i in range(1, count + 1)]
@@ -24,7 +24,7 @@ def day_script_with_test(filename, year: int, day: int):
             
     
     if __name__ == '__main__':
-        from faoci.interface import fetch_lines
+        from aoc.inputs import fetch_lines
         
         assert part1(get_lines('y{year % 1000:02d}d{day:02d}.test')) == 1
         
@@ -48,7 +48,7 @@ def day_script_without_test(filename, year: int, day: int):
 
 
     if __name__ == '__main__':
-        from faoci.interface import fetch_lines
+        from aoc.inputs import fetch_lines
 
         print(f'Part 1: {{part1(fetch_lines(year={year}, day={day}))}}')
         print(f'Part 2: {{part2(fetch_lines(year={year}, day={day}))}}')
@@ -56,8 +56,9 @@ def day_script_without_test(filename, year: int, day: int):
 
 
 def setup_day(*, year: int, day: int, root: str, quiet: bool, test: bool):
-    from loguru import logger
     from pathlib import Path
+    if not quiet:
+        from loguru import logger
     root = Path(root).resolve()
     if not root.exists():
         raise RuntimeError(f"Root directory {root} does not exist")
@@ -22,7 +22,7 @@ def part2(values):
 
 
 if __name__ == '__main__':
-    from faoci.interface import fetch_lines
+    from aoc.inputs import fetch_lines
     assert find_floor('(())') == 0
     assert find_floor('()()') == 0
     assert find_floor('(((') == 3
@@ -6,21 +6,26 @@ def ribbon_required(d, w, h):
     return 2 * d + 2 * w + d * w * h
 
 
-def read_lengths(line: str):
-    lengths = tuple(sorted([int(x) for x in line.strip().split('x')]))
-    return lengths
+def read_lengths(lines: list[str]) -> list[list[int]]:
+    """Every box's lengths, each sorted shortest first"""
+    from aoc.parse import bulk, records
+    if not bulk(lines):
+        return [sorted(int(x) for x in line.strip().split('x')) for line in lines]
+    lengths = records(lines, 3, signed=False)
+    lengths.sort(axis=1)
+    return lengths.tolist()
 
 
 def total_paper_required(lines: list[str]):
-    return sum(paper_required(*read_lengths(line)) for line in lines)
+    return sum(paper_required(*lengths) for lengths in read_lengths(lines))
 
 
 def total_ribbon_required(lines: list[str]):
-    return sum(ribbon_required(*read_lengths(line)) for line in lines)
+    return sum(ribbon_required(*lengths) for lengths in read_lengths(lines))
 
 
 if __name__ == '__main__':
-    from faoci.interface import fetch_lines
+    from aoc.inputs import fetch_lines
     assert paper_required(2, 3, 4) == 58
     assert total_paper_required(['2x3x4']) == 58
     assert total_paper_required(['1x1x10']) == 43
@@ -42,7 +42,7 @@ def part2(lines: list[str]) -> int:
 
 
 if __name__ == '__main__':
-    from faoci.interface import fetch_lines
+    from aoc.inputs import fetch_lines
 
     assert part1(['>']) == 2
     assert part1(['^>v<']) == 4
@@ -6,9 +6,14 @@ def md5hashhex(value: str) -> str:
 
 
 def find_first_hash_with_n_leading_zeros(key: str, n) -> int:
-    for i in range(10**7):
-        if md5hashhex(f'{key}{i}').startswith('0'*n):
-            return i
+    from aoc.checkpoint import Checkpoint
+    with Checkpoint('y15d04', key, n) as checkpoint:
+        # a snapshot holds the next value to try; nothing before it matched
+        for i in range(checkpoint.state or 0, 10**7):
+            if md5hashhex(f'{key}{i}').startswith('0'*n):
+                return i
+            if not i & 0xffff and checkpoint.due():
+                checkpoint.save(i)
     return -1
 
 
@@ -20,7 +25,7 @@ def part(key: str, n: int = 5):
 
 
 if __name__ == '__main__':
-    from faoci.interface import fetch_lines
+    from aoc.inputs import fetch_lines
     assert find_first_hash_with_n_leading_zeros('abcdef', 5) == 609043
     assert find_first_hash_with_n_leading_zeros('pqrstuv', 5) == 1048970
     part(fetch_lines(year=2015, day=4)[0])
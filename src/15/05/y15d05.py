@@ -44,7 +44,7 @@ def part2(lines: list[str]) -> int:
 
 
 if __name__ == '__main__':
-    from faoci.interface import fetch_lines
+    from aoc.inputs import fetch_lines
 
     assert str_is_nice('ugknbfddgicrmopn')
     assert str_is_nice('aaa')
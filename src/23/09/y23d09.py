@@ -1,8 +1,10 @@
 def read_input(filename: str) -> list[list[int]]:
-    with open(filename, 'r') as f:
-        lines = f.readlines()
-    lines = [[int(x) for x in line.strip().split()] for line in lines if len(line.strip())]
-    return lines
+    from pathlib import Path
+    from aoc.parse import bulk, ragged, rows
+    lines = Path(filename).read_text().splitlines()
+    if not bulk(lines):
+        return [[int(x) for x in line.split()] for line in lines if len(line.strip())]
+    return rows(*ragged(lines))
 
 
 def listdiff(values: list):
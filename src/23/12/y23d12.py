@@ -1,7 +1,8 @@
-from functools import lru_cache
+from aoc.memo import memo, scope
+from aoc.persist import persistent
 
 
-@lru_cache
+@memo(maxsize=1 << 10)
 def fits(size: int, line: str) -> bool:
     if size > len(line):
         return False
@@ -12,7 +13,7 @@ def fits(size: int, line: str) -> bool:
     return '#' != line[size] if len(line) > size else True
 
 
-@lru_cache
+@persistent(maxsize=1 << 10, depth=0)
 def check(line: str, counts: tuple[int, ...]) -> int:
     if sum(counts) + len(counts) - 1 > len(line):
         # no chance to fit in all the broken springs:
@@ -49,7 +50,8 @@ def read_values(filename) -> list[str]:
 
 
 def part(values: list[str], number: int = 1):
-    return sum(enter(line, repeat=5 if number == 2 else 1) for line in values)
+    with scope(check, fits):
+        return sum(enter(line, repeat=5 if number == 2 else 1) for line in values)
 
 
 if __name__ == '__main__':
@@ -1,7 +1,7 @@
 # Path: /home/gst/PycharmProjects/aoc23/src/23/14/y23d14.py
 # Puzzle Source: https://adventofcode.com/2023/day/14
 from dataclasses import dataclass
-from functools import cache
+
 
 def get_lines(filename):
     from pathlib import Path
@@ -26,9 +26,11 @@ class RockBoard:
         return hash(self) == hash(other)
 
     def __hash__(self):
+        return hash(self.state())
+
+    def state(self) -> tuple[int, ...]:
         # rocks are fungible
-        values = tuple(sorted(r[0]*self.cols + r[1] for r in self._rocks))
-        return hash(values)
+        return tuple(sorted(r[0]*self.cols + r[1] for r in self._rocks))
 
     @property
     def rows(self):
@@ -94,55 +96,17 @@ class RockBoard:
                 rocks.extend(row_rocks)
         return RockBoard(self._board, rocks)
 
-    @cache
     def one_spin(self):
+        # not memoised: every spin makes a new board, and spin_load's cycle finder already stops at the first
+        # repeated state
         return self.tilt_north().tilt_west().tilt_south().tilt_east()
 
     def spin_load(self, n=1):
+        from aoc.cycles import history
         if n < 1:
             return self
-        start = hash(self)
-        spun = self.one_spin()
-        end = hash(spun)
-        seen = {start, end}
-        path = {start: end}
-        loads = {start: self.north_load(), end: spun.north_load()}
-
-        # find the cycle
-        cycle = 0
-        for i in range(1, n):
-            start = end
-            spun = spun.one_spin()
-            end = hash(spun)
-            if end in seen:
-                cycle = i + 1
-                path[start] = end
-                break
-            seen.add(end)
-            path[start] = end
-            loads[end] = spun.north_load()
-
-        print(f'Pattern cycles after {cycle} iterations')
-        lead_in = 0
-        if end != hash(self):
-            count = 0
-            a = end
-            while path[a] != end and count < cycle:
-                a = path[a]
-                count += 1
-            if count >= cycle:
-                raise RuntimeError("How did this happen?")
-            lead_in = cycle - count - 1
-            cycle = count + 1
-            print(f'But it is a lead in of {lead_in} followed by cycles of {cycle}')
-
-        goal = (n - lead_in) % cycle
-        a = hash(self)
-        for _ in range(lead_in):
-            a = path[a]
-        for _ in range(goal):
-            a = path[a]
-        return loads[a]
+        cycle = history(self, lambda board: board.one_spin(), key=RockBoard.state, observe=RockBoard.north_load)
+        return cycle.at(n)
 
     def north_load(self):
         n = self.rows
@@ -150,12 +114,10 @@ class RockBoard:
 
     @classmethod
     def from_map(cls, map_lines: list[str]):
-        for line in map_lines[1:]:
-            if len(line) != len(map_lines[0]):
-                raise ValueError("Inconsistent map data")
-        rocks = [[1 if '#' == c else 0 for c in line] for line in map_lines]
-        rolls = [(r, c) for r, row in enumerate(map_lines) for c, x in enumerate(row) if 'O' == x]
-        return RockBoard(rocks, rolls)
+        from aoc.grid import from_lines, find
+        grid = from_lines(map_lines)
+        rocks = (grid == ord('#')).astype(int).tolist()
+        return RockBoard(rocks, find(grid, 'O'))
 
     def __str__(self):
         rocks = [['#' if c else '.' for c in row] for row in self._board]
@@ -172,15 +134,16 @@ def part1(lines: list[str]) -> int:
     return tilted.north_load()
 
 
-def part2(lines: list[str]) -> int:
-    return RockBoard.from_map(lines).spin_load(1000000000)
+def part2(lines: list[str], spins: int = 1000000000) -> int:
+    return RockBoard.from_map(lines).spin_load(spins)
 
 
 if __name__ == '__main__':
-    from faoci.interface import fetch_lines
+    from aoc.inputs import fetch_lines
 
     assert part1(get_lines('y23d14.test')) == 136
     assert part2(get_lines('y23d14.test')) == 64
+    assert part2(get_lines('y23d14.test'), 10 ** 18) == 63
 
     puzzle = fetch_lines(year=2023, day=14)
     print(f'Part 1: {part1(puzzle)}')
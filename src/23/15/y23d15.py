@@ -43,7 +43,7 @@ def part2(instructions: str) -> int:
 
 
 if __name__ == '__main__':
-    from faoci.interface import fetch_lines
+    from aoc.inputs import fetch_lines
 
     assert box_hash('rn=1') == 30
     assert box_hash('cm-') == 253
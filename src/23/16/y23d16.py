@@ -164,7 +164,7 @@ def part2(lines: list[str]) -> int:
 
 
 if __name__ == '__main__':
-    from faoci.interface import fetch_lines
+    from aoc.inputs import fetch_lines
 
     assert part1(get_lines('y23d16.test')) == 46
     assert part1(get_lines('y23d16a.test')) == 36
@@ -3,81 +3,68 @@
 from __future__ import annotations
 from dataclasses import dataclass
 
-
-@dataclass
-class Crucible:
-    loss: int
-    position: tuple[int, int]
-    previous: tuple[int, int]
-    straights: int
-
-    @property
-    def state(self):
-        return self.position, self.previous, self.straights
-
-    def __lt__(self, other):
-        return (self.loss, self.straights) < (other.loss, other.straights)
+from aoc.topology import Topology, N, E, S, W, LEFT, RIGHT, state, turn
 
 
 @dataclass
 class HeatLossMap:
-    _cost: tuple[tuple[int, ...], ...]
+    grid: Topology
+    _cost: tuple[int, ...]
 
     @classmethod
     def from_lines(cls, map_lines: list[str]):
-        return HeatLossMap(tuple(tuple(int(c) for c in line) for line in map_lines))
+        grid = Topology.from_lines(map_lines)
+        return HeatLossMap(grid, tuple(0 if c == grid.wall else int(c) for c in grid.cells))
 
     @property
     def rows(self):
-        return len(self._cost)
+        return self.grid.rows
 
     @property
     def cols(self):
-        return len(self._cost[0])
+        return self.grid.cols
 
-    def inbound(self, pos: tuple[int, int]):
-        return 0 <= pos[0] < self.rows and 0 <= pos[1] < self.cols
+    def inbound(self, i: int):
+        return self.grid.cells[i] != self.grid.wall
 
-    def lost_at(self, pos: tuple[int, int]):
-        return self._cost[pos[0]][pos[1]]
+    def lost_at(self, i: int):
+        return self._cost[i]
 
-    def possible(self, crucible: Crucible, turn_allowed: bool, straight_allowed: bool):
-        pos, last = crucible.position, crucible.previous
-        d = pos[0] - last[0], pos[1] - last[1]
+    def possible(self, state: tuple[int, int], turn_allowed: bool, straight_allowed: bool):
+        """The (packed cell and heading, straight steps) states reachable from state, with their heat loss"""
+        packed, straights = state
         p = []
-        if turn_allowed and (d == (1, 0) or d == (-1, 0)):
-            p.extend([((0, 1), 1), ((0, -1), 1)])
-        if turn_allowed and (d == (0, 1) or d == (0, -1)):
-            p.extend([((1, 0), 1), ((-1, 0), 1)])
+        if turn_allowed:
+            p.extend([(turn(packed, LEFT), 1), (turn(packed, RIGHT), 1)])
         if straight_allowed:
-            p.append((d, crucible.straights + 1))
-        p = [((pos[0] + x[0], pos[1] + x[1]), c) for x, c in p]
-        return [Crucible(crucible.loss + self.lost_at(x), x, pos, count) for x, count in p if self.inbound(x)]
+            p.append((packed, straights + 1))
+        ahead, cost, cells, wall = self.grid.state_offsets, self._cost, self.grid.cells, self.grid.wall
+        p = [(x + ahead[x & 3], c) for x, c in p]
+        # the frame of walls stops every path at the edge of the map, with no bounds checks
+        return [((x, count), cost[x >> 2]) for x, count in p if cells[x >> 2] != wall]
 
-    def normal_rules(self, crucible: Crucible):
-        return self.possible(crucible, True, crucible.straights < 3)
+    def normal_rules(self, state: tuple):
+        return self.possible(state, True, state[1] < 3)
 
-    def ultra_rules(self, crucible: Crucible):
-        return self.possible(crucible, crucible.straights > 3, crucible.straights < 10)
+    def ultra_rules(self, state: tuple):
+        return self.possible(state, state[1] > 3, state[1] < 10)
 
     def find_path(self, start: tuple[int, int] | None = None, goal: tuple[int, int] | None = None, normal: bool = True):
-        import heapq
+        from aoc.search import dial
         if start is None:
             start = 0, 0
         if goal is None:
             goal = self.rows - 1, self.cols - 1
-        options = [(start[0]+p[0], start[1]+p[1]) for p in [(0, 1), (0, -1), (1, 0), (-1, 0)]]
-        queue = [Crucible(self.lost_at(pos), pos, start, 1) for pos in options if self.inbound(pos)]
-        visited = set()
-        while queue:
-            crucible = heapq.heappop(queue)
-            if crucible.state not in visited:
-                visited.add(crucible.state)
-                # if we're at the goal _and_ allowed to stop:
-                if crucible.position == goal and (normal or crucible.straights > 3):
-                    return crucible.loss
-                for option in self.normal_rules(crucible) if normal else self.ultra_rules(crucible):
-                    heapq.heappush(queue, option)
+        first, last = self.grid.index(*start), self.grid.index(*goal)
+        options = [self.grid.advance(state(first, heading)) for heading in (N, E, S, W)]
+        sources = {(x, 1): self.lost_at(x >> 2) for x in options if self.inbound(x >> 2)}
+
+        def stop(s):
+            # we're at the goal _and_ allowed to stop
+            return s[0] >> 2 == last and (normal or s[1] > 3)
+
+        # heat losses are single digits, so a bucket queue beats a heap
+        return dial(self.normal_rules if normal else self.ultra_rules, sources=sources, goal=stop).cost
 
 
 def get_lines(filename):
@@ -101,7 +88,7 @@ def part2(lines: list[str]) -> int:
 
 
 if __name__ == '__main__':
-    from faoci.interface import fetch_lines
+    from aoc.inputs import fetch_lines
 
     assert part1(get_lines('y23d17.test')) == 102
     assert part2(get_lines('y23d17.test')) == 94
@@ -124,7 +124,7 @@ def part2(lines: list[str]) -> int:
 
 
 if __name__ == '__main__':
-    from faoci.interface import fetch_lines
+    from aoc.inputs import fetch_lines
 
     assert part1(get_lines('y23d18b.test')) == 4
     assert part1(get_lines('y23d18a.test')) == 36
@@ -5,6 +5,8 @@ from dataclasses import dataclass, field
 from enum import Enum, auto
 from typing import TypeVar
 
+from aoc import counters
+
 
 class Pulse(Enum):
     low = auto()
@@ -123,6 +125,7 @@ class Network:
             counts[first.pulse] += 1
             added = self._nodes[first.dest](first.call, first.pulse, push_count)
             to_make.extend(added)
+        counters.add('y23d20.pulses', counts[Pulse.low] + counts[Pulse.high])
         return counts[Pulse.low], counts[Pulse.high]
 
     def pusher(self, times: int):
@@ -192,7 +195,7 @@ def part2(lines: list[str]) -> int:
 
 
 if __name__ == '__main__':
-    from faoci.interface import fetch_lines
+    from aoc.inputs import fetch_lines
 
     assert part1(get_lines('y23d20.test')) == 32000000
     assert Network.from_lines(get_lines('y23d20b.test')).push(1) == (4, 4)
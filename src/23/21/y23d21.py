@@ -2,6 +2,8 @@
 # Puzzle Source: https://adventofcode.com/2023/day/21
 from dataclasses import dataclass
 
+from aoc.bitgrid import BitGrid
+
 def clamp(value, minimum, maximum):
     if value < minimum:
         return minimum
@@ -10,124 +12,81 @@ def clamp(value, minimum, maximum):
     return value
 
 
-@dataclass
-class Mark:
-    pos: tuple[int, int]
-    neighbors: tuple[int, ...]
+def find_start(rows: list[str]) -> tuple[int, int]:
+    return next((i, row.index('S')) for i, row in enumerate(rows) if 'S' in row)
 
 
 @dataclass
 class MarkGrid:
-    _grid: tuple[Mark, ...]
-    start: int
-    rows: int = 0
-    cols: int = 0
+    fields: BitGrid
+    start: tuple[int, int]
 
     @classmethod
     def from_lines(cls, rows: list[str]):
-        from itertools import product
-        is_field = [['.' == x or 'S' == x for x in row] for row in rows]
-        nrs = {}
-        count = 0
-        start = -1, -1
-        for i, j in product(range(len(rows)), range(len(rows[0]))):
-            if is_field[i][j]:
-                nrs[(i, j)] = count
-                count += 1
-            if 'S' == rows[i][j]:
-                start = i, j
-        fields = []
-        for i, row in enumerate(is_field):
-            for j, x in enumerate(row):
-                if x:
-                    neighbors = [nrs[(i+x, j+y)] for x, y in ((1, 0), (0, 1), (-1, 0), (0, -1)) if (i+x, j+y) in nrs]
-                    fields.append(Mark(pos=(i, j), neighbors=tuple(neighbors)))
-        return MarkGrid(tuple(fields), nrs[start], len(rows), len(rows[0]))
+        return MarkGrid(BitGrid.from_lines(rows, '.S'), find_start(rows))
 
-    def pos_is_field(self, pos: tuple[int, int]):
-        for field in self._grid:
-            if pos == field.pos:
-                return True
-        return False
+    @property
+    def rows(self):
+        return self.fields.rows
 
-    def indexes(self):
-        from itertools import product
-        return product(range(self.rows), range(self.cols))
+    @property
+    def cols(self):
+        return self.fields.cols
 
-    def to_char_array(self):
-        return [['.' if self.pos_is_field((i, j)) else '#' for j in range(self.cols)] for i in range(self.rows)]
+    def pos_is_field(self, pos: tuple[int, int]):
+        return pos in self.fields
 
     def __str__(self):
-        return '\n'.join(''.join(row) for row in self.to_char_array())
+        return str(~self.fields)
 
-    def step(self, begin: list[int]) -> list[int]:
-        finish = set()
-        for index in begin:
-            finish.update(self._grid[index].neighbors)
-        return list(finish)
+    def step(self, begin: BitGrid) -> BitGrid:
+        return begin.neighbours() & self.fields
 
     def run(self, n=64):
-        accessible = [self.start]
+        accessible = BitGrid.from_cells(self.rows, self.cols, [self.start])
         for i in range(n):
             accessible = self.step(accessible)
-        return len(accessible)
+        return accessible.count()
 
 
 @dataclass
 class InfiniteMarkGrid:
-    _grid: tuple[tuple[bool, ...], ...]
+    fields: BitGrid
     start: tuple[int, int]
-    rows: int = 0
-    cols: int = 0
 
     @classmethod
     def from_lines(cls, rows: list[str]):
-        from itertools import product
-        is_field = tuple([tuple(['.' == x or 'S' == x for x in row]) for row in rows])
-        start = -1, -1
-        nr = len(rows)
-        nc = len(rows[0])
-        for i, j in product(range(nr), range(nc)):
-            if 'S' == rows[i][j]:
-                start = i, j
-        return InfiniteMarkGrid(is_field, start, nr, nc)
+        return InfiniteMarkGrid(BitGrid.from_lines(rows, '.S'), find_start(rows))
+
+    @property
+    def rows(self):
+        return self.fields.rows
+
+    @property
+    def cols(self):
+        return self.fields.cols
 
     def pos_is_field(self, pos: tuple[int, int]):
-        return self._grid[pos[0] % self.rows][pos[1] % self.cols]
+        return self.field_index(pos) in self.fields
 
     def field_index(self, pos: tuple[int, int]):
         p = pos[0] % self.rows, pos[1] % self.cols
         return p
 
-    def indexes(self):
-        from itertools import product
-        return product(range(self.rows), range(self.cols))
-
-    def to_char_array(self):
-        return [['.' if self.pos_is_field((i, j)) else '#' for j in range(self.cols)] for i in range(self.rows)]
-
     def __str__(self):
-        return '\n'.join(''.join(row) for row in self.to_char_array())
-
-    def neighbors(self, pos: tuple[int, int]):
-        for d in ((0, -1), (0, 1), (1, 0), (-1, 0)):
-            p = pos[0] + d[0], pos[1] + d[1]
-            if self.pos_is_field(p):
-                yield p
-
-    def step(self, begin: list[tuple[int, int]]) -> list[tuple[int, int]]:
-        finish = set()
-        for pos in begin:
-            finish.update(list(self.neighbors(pos)))
-        return list(finish)
+        return str(~self.fields)
 
     def run(self, ns: list[int]):
-        accessible = [self.start]
+        # enough copies of the garden around the start that no walk of max(ns) steps leaves them
+        down, across = max(ns) // self.rows + 1, max(ns) // self.cols + 1
+        fields = self.fields.tile(2 * down + 1, 2 * across + 1)
+        start = self.start[0] + down * self.rows, self.start[1] + across * self.cols
+        accessible = BitGrid.from_cells(fields.rows, fields.cols, [start])
         vals = [0 for _ in ns]
         for i in range(max(ns)):
-            accessible = self.step(accessible)
+            accessible = accessible.neighbours() & fields
             if i + 1 in ns:
-                vals[ns.index(i + 1)] = len(accessible)
+                vals[ns.index(i + 1)] = accessible.count()
         return vals
 
     def estimate(self, n=26501365):
@@ -171,12 +130,13 @@ def part2(lines: list[str]) -> int:
 
 
 if __name__ == '__main__':
-    from faoci.interface import fetch_lines
+    from aoc.inputs import fetch_lines
 
     test_field = MarkGrid.from_lines(get_lines('y23d21.test'))
     assert test_field.run(6) == 16
 
     test_infinite_field = InfiniteMarkGrid.from_lines(get_lines('y23d21.test'))
+    assert test_infinite_field.run([6, 10, 50, 100, 500, 1000]) == [16, 50, 1594, 6536, 167004, 668697]
     # assert test_infinite_field.estimate(6) == 16
     # assert test_infinite_field.estimate(10) == 50
     # assert test_infinite_field.estimate(50) == 1594
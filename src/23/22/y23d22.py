@@ -14,8 +14,10 @@ class Brick:
     @classmethod
     def from_line(cls, line: str):
         mins, maxs = line.split('~')
-        xmin, ymin, zmin = [int(n) for n in mins.split(',')]
-        xmax, ymax, zmax = [int(n) for n in maxs.split(',')]
+        return cls.from_ends(*[int(n) for n in mins.split(',')], *[int(n) for n in maxs.split(',')])
+
+    @classmethod
+    def from_ends(cls, xmin: int, ymin: int, zmin: int, xmax: int, ymax: int, zmax: int):
         if xmin == xmax and ymin == ymax and zmin == zmax:
             return cls(((xmin, ymin, zmin),))
         if xmin == xmax and ymin == ymax:
@@ -104,7 +106,10 @@ class BrickStack:
 
     @classmethod
     def from_lines(cls, lines: list[str]):
-        return cls(tuple(sorted([Brick.from_line(line) for line in lines])))
+        from aoc.parse import bulk, records
+        if not bulk(lines):
+            return cls(tuple(sorted([Brick.from_line(line) for line in lines])))
+        return cls(tuple(sorted([Brick.from_ends(*ends) for ends in records(lines, 6).tolist()])))
 
     def resort(self):
         self.stack = tuple(sorted(self.stack))
@@ -207,7 +212,7 @@ def part2(lines: list[str]) -> int:
 
 
 if __name__ == '__main__':
-    from faoci.interface import fetch_lines
+    from aoc.inputs import fetch_lines
 
     test_stack = BrickNetwork.from_lines(get_lines('y23d22.test'))
     assert test_stack.removable() == [1, 2, 3, 4, 6]
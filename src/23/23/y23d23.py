@@ -4,78 +4,43 @@ from __future__ import annotations
 
 from dataclasses import dataclass, field
 
+from aoc.topology import Topology
 
-def options(key: list[str], rows: int, cols: int, x: int, y: int, allowed: tuple[str, str, str, str]):
-    opts = []
-    if 0 <= x - 1 < rows and 0 <= y <= cols and key[x - 1][y] in allowed[0]:
-        opts.append((x - 1, y))
-    if 0 <= x + 1 < rows and 0 <= y <= cols and key[x + 1][y] in allowed[1]:
-        opts.append((x + 1, y))
-    if 0 <= x < rows and 0 <= y - 1 <= cols and key[x][y - 1] in allowed[2]:
-        opts.append((x, y - 1))
-    if 0 <= x < rows and 0 <= y + 1 <= cols and key[x][y + 1] in allowed[3]:
-        opts.append((x, y + 1))
-    return opts
-
-
-def option_p0(key: list[str], rows: int, cols: int, x: int, y: int, allowed: str):
-    if not (0 <= x + 1 < rows and 0 <= y < cols) or key[x + 1][y] not in allowed:
-        return None
-    n = 1
-    while 0 <= x + n + 1 < rows and key[x + n + 1][y] in allowed:
-        n += 1
-    return x + n, y, n
-
-
-def option_m0(key: list[str], rows: int, cols: int, x: int, y: int, allowed: str):
-    if not (0 <= x - 1 < rows and 0 <= y < cols) or key[x - 1][y] not in allowed:
-        return None
-    n = 1
-    while 0 <= x - n - 1 < rows and key[x - n - 1][y] in allowed:
-        n += 1
-    return x - n, y, n
 
+def options(grid: Topology, i: int, allowed: tuple[str, str, str, str]) -> list[int]:
+    """The neighbours of cell i, N, E, S and W, holding the characters allowed when stepping that way"""
+    cells = grid.cells
+    return [j for d, ok in zip(grid.offsets4, allowed) if cells[j := i + d] in ok]
 
-def option_0p(key: list[str], rows: int, cols: int, x: int, y: int, allowed: str):
-    if not (0 <= x < rows and 0 <= y + 1 < cols) or key[x][y + 1] not in allowed:
-        return None
-    n = 1
-    while 0 <= y + n + 1 < cols and key[x][y + n + 1] in allowed:
-        n += 1
-    return x, y + n, n
 
+def straight(grid: Topology, i: int, d: int, allowed: str) -> tuple[int, int] | None:
+    """The far end of the straight run from cell i in steps of d through cells holding allowed, and its length
 
-def option_0m(key: list[str], rows: int, cols: int, x: int, y: int, allowed: str):
-    if not (0 <= x < rows and 0 <= y - 1 < cols) or key[x][y - 1] not in allowed:
+    The frame's walls are never allowed, so the run stops at the edge of the grid without a bounds check.
+    """
+    cells = grid.cells
+    if cells[i + d] not in allowed:
         return None
     n = 1
-    while 0 <= y - n - 1 < cols and key[x][y - n - 1] in allowed:
+    while cells[i + (n + 1) * d] in allowed:
         n += 1
-    return x, y - n, n
-
+    return i + n * d, n
 
-def extended_options(lines: list[str], rows: int, cols: int, i: int, j: int, spots: str):
-    opts = []
-    if (pz := option_p0(lines, rows, cols, i, j, spots)) is not None:
-        opts.append(pz)
-    if (mz := option_m0(lines, rows, cols, i, j, spots)) is not None:
-        opts.append(mz)
-    if (zp := option_0p(lines, rows, cols, i, j, spots)) is not None:
-        opts.append(zp)
-    if (zm := option_0m(lines, rows, cols, i, j, spots)) is not None:
-        opts.append(zm)
-    return opts
 
+def extended_options(grid: Topology, i: int, spots: str) -> list[tuple[int, int]]:
+    """The straight runs leaving cell i, S, N, E then W"""
+    north, east, south, west = grid.offsets4
+    return [run for d in (south, north, east, west) if (run := straight(grid, i, d, spots)) is not None]
 
 
-def can_skip(lines: list[str], rows: int, cols: int, i: int, j: int, x: int, y: int, spots: str):
-    opts = extended_options(lines, rows, cols, x, y, spots)
+def can_skip(grid: Topology, i: int, x: int, spots: str):
+    """Cell x, the end of the run leaving it away from cell i, and that run's length, if x is a corridor"""
+    opts = extended_options(grid, x, spots)
     if len(opts) == 2:
-        other = [opt for opt in opts if opt[0] != i or opt[1] != j]
+        other = [opt for opt in opts if opt[0] != i]
         if len(other) != 1:
             raise RuntimeError('Unexpected options')
-        opt = other[0]
-        return x, y, opt[0], opt[1], opt[2]
+        return x, *other[0]
     return None
 
 
@@ -85,23 +50,20 @@ class HikingMap:
 
     @classmethod
     def from_lines(cls, lines: list[str]):
-        from itertools import product
+        grid = Topology.from_lines(lines)
+        # a slope may only be left the way it points
+        slopes = dict(zip('^>v<', grid.offsets4))
         po = {}
-        rows, cols = len(lines), len(lines[0])
-        for i, j in product(range(rows), range(cols)):
-            opts = []
-            if lines[i][j] == '.':
-                opts.extend(options(lines, rows, cols, i, j, ('^.', 'v.', '.<', '.>')))
-            elif lines[i][j] == '<':
-                opts.append((i, j-1))
-            elif lines[i][j] == '>':
-                opts.append((i, j+1))
-            elif lines[i][j] == 'v':
-                opts.append((i+1, j))
-            elif lines[i][j] == '^':
-                opts.append((i-1, j))
+        for i in grid.interior():
+            c = grid.cells[i]
+            if c == '.':
+                opts = options(grid, i, ('^.', '.>', 'v.', '.<'))
+            elif c in slopes:
+                opts = [i + slopes[c]]
+            else:
+                continue
             if len(opts):
-                po[(i, j)] = [(x, y, 1) for x, y in opts]
+                po[grid.position(i)] = [(*grid.position(j), 1) for j in opts]
         return cls(po)
 
     def longest_walk(self):
@@ -168,19 +130,11 @@ class HikingNetwork:
             print(f'{ab[0]}->{ab[1]}: {d}')
 
     def neighbors(self, a: tuple[int, int]):
-        rows, cols = len(self._board), len(self._board[0])
-        opts = []
-        if self._board[a[0]][a[1]] == 0:
-            return opts
-        if 0 <= a[0] - 1 < rows and 0 <= a[1] < cols and self._board[a[0] - 1][a[1]] > 0:
-            opts.append((a[0] - 1, a[1]))
-        if 0 <= a[0] + 1 < rows and 0 <= a[1] < cols and self._board[a[0] + 1][a[1]] > 0:
-            opts.append((a[0] + 1, a[1]))
-        if 0 <= a[0] < rows and 0 <= a[1] - 1 < cols and self._board[a[0]][a[1] - 1] > 0:
-            opts.append((a[0], a[1] - 1))
-        if 0 <= a[0] < rows and 0 <= a[1] + 1 < cols and self._board[a[0]][a[1] + 1] > 0:
-            opts.append((a[0], a[1] + 1))
-        return opts
+        # the board is framed by blocked cells, so every open cell's neighbours are on it
+        board, (r, c) = self._board, a
+        if board[r][c] == 0:
+            return []
+        return [n for n in ((r - 1, c), (r + 1, c), (r, c - 1), (r, c + 1)) if board[n[0]][n[1]] > 0]
 
     def amble(self, a: tuple[int, int], b: tuple[int, int]) -> int | None:
         opts = [(a, x, 0) for x in self.neighbors(a)]
@@ -219,16 +173,31 @@ class HikingNetwork:
                 states = list(reversed(sorted(states, key=lambda x: x[2])))
         return max(x[0] for x in dists_paths)
 
-    def search(self, node: tuple[int, int] = None, dist: int = 0, best: int = 0, seen: set = set()):
-        if node is None:
-            node = self._first
-        if node == self._last:
-            return dist
-        if node in seen:
-            return best
-        seen.add(node)
-        best = max(self.search(n, dist + self._direct[(node, n)], best) for n in self.node_neighbors(node))
-        seen.remove(node)
+    def search(self):
+        """The longest walk from first to last visiting no node twice, by an exhaustive depth-first search
+
+        Nodes are numbered and the nodes already on a walk are a bitmask, so a pending walk is three
+        integers; the stack of pending walks and the best length so far are checkpointed as they go.
+        """
+        from aoc.checkpoint import Checkpoint
+        nodes = [self._first, *self._nodes, self._last]
+        number = {node: i for i, node in enumerate(nodes)}
+        ways = [[] for _ in nodes]
+        for (a, b), d in self._direct.items():
+            ways[number[a]].append((number[b], d))
+        goal = number[self._last]
+        with Checkpoint('y23d23', tuple(sorted(self._direct.items()))) as checkpoint:
+            stack, best = checkpoint.state or ([(0, 0, 1)], 0)
+            while stack:
+                node, dist, seen = stack.pop()
+                if node == goal:
+                    best = max(best, dist)
+                    continue
+                for n, d in ways[node]:
+                    if not seen >> n & 1:
+                        stack.append((n, dist + d, seen | 1 << n))
+                if checkpoint.due():
+                    checkpoint.save((stack, best))
         return best
 
     @classmethod
@@ -236,16 +205,17 @@ class HikingNetwork:
         from itertools import product
         rows, cols = len(lines), len(lines[0])
         spots = '.^<>v'
-        board = [[0 for _ in range(cols)] for _ in range(rows)]
+        # one blocked cell around the map, as in aoc.topology, so positions are shifted by (1, 1)
+        board = [[0 for _ in range(cols + 2)] for _ in range(rows + 2)]
         for i, j in product(range(rows), range(cols)):
             if lines[i][j] in spots:
-                board[i][j] = 1
-        first = [j for j, b in enumerate(board[0]) if b]
-        last = [j for j, b in enumerate(board[-1]) if b]
+                board[i + 1][j + 1] = 1
+        first = [j for j, b in enumerate(board[1]) if b]
+        last = [j for j, b in enumerate(board[-2]) if b]
         if len(first) != 1 or len(last) != 1:
             raise ValueError('Error finding entrace or exit')
 
-        return cls(board, (0, first[0]), (rows - 1, last[0]))
+        return cls(board, (1, first[0]), (rows, last[0]))
 
 
 
@@ -272,7 +242,7 @@ def part2(lines: list[str]) -> int:
 
 
 if __name__ == '__main__':
-    from faoci.interface import fetch_lines
+    from aoc.inputs import fetch_lines
 
     assert part1(get_lines('y23d23.test')) == 94
     assert part2(get_lines('y23d23.test')) == 154
@@ -75,7 +75,10 @@ class Hail:
 
     @classmethod
     def from_lines(cls, lines: list[str]):
-        return cls(tuple(HailRay.from_string(line) for line in lines))
+        from aoc.parse import bulk, records
+        if not bulk(lines):
+            return cls(tuple(HailRay.from_string(line) for line in lines))
+        return cls(tuple(HailRay(*ray) for ray in records(lines, 6).tolist()))
 
     def intersection_xy_count(self, x_lims: tuple[int, int] | None = None, y_lims: tuple[int, int] | None = None):
         if x_lims is None:
@@ -136,7 +139,7 @@ def part2(lines: list[str]) -> int:
 
 
 if __name__ == '__main__':
-    from faoci.interface import fetch_lines
+    from aoc.inputs import fetch_lines
 
     def get_lines(filename):
         from pathlib import Path
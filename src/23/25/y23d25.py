@@ -50,12 +50,17 @@ class DoubleGraph:
         nx.draw(g, with_labels=True)
         plt.show()
 
-        sg = [g.subgraph(s) for s in nx.connected_components(g)]
-        if len(sg) != 2:
+        from aoc.unionfind import UnionFind
+        cut = {frozenset(edge) for edge in to_remove}
+        components = UnionFind(len(self.nodes))
+        for i, j in self.edges:
+            if frozenset((self.nodes[i], self.nodes[j])) not in cut:
+                components.union(i, j)
+        if components.count != 2:
             raise RuntimeError('Expected 2 disconnected subgraphs')
         prod = 1
-        for s in sg:
-            prod *= len(s)
+        for root in components.roots():
+            prod *= components.size[root]
         return prod
 
 
@@ -81,7 +86,7 @@ def part2(lines: list[str]) -> int:
 
 
 if __name__ == '__main__':
-    from faoci.interface import fetch_lines
+    from aoc.inputs import fetch_lines
 
     assert part1(get_lines('y23d25.test')) == 54
 
@@ -2,8 +2,11 @@
 # Puzzle Source: https://adventofcode.com/2024/day/1
 
 def id_lists(lines: list[str]):
-    left_right = [[int(n) for n in x.split(maxsplit=1)] for x in lines]
-    left, right = [[x[i] for x in left_right] for i in (0, 1)]
+    from aoc.parse import bulk, records
+    if not bulk(lines):
+        left_right = [[int(n) for n in x.split(maxsplit=1)] for x in lines]
+        return [[x[i] for x in left_right] for i in (0, 1)]
+    left, right = records(lines, 2).T.tolist()
     return left, right
 
 
@@ -21,7 +24,7 @@ def part2(lines: list[str]) -> int:
 
 
 if __name__ == '__main__':
-    from faoci.interface import fetch_lines
+    from aoc.inputs import fetch_lines
 
     print(f'Part 1: {part1(fetch_lines(year=2024, day=1))}')
     print(f'Part 2: {part2(fetch_lines(year=2024, day=1))}')
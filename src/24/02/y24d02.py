@@ -2,8 +2,11 @@
 # Puzzle Source: https://adventofcode.com/2024/day/2
 
 
-def get_levels(line: str) -> list[int]:
-    return [int(x) for x in line.split()]
+def get_reports(lines: list[str]) -> list[list[int]]:
+    from aoc.parse import bulk, ragged, rows
+    if not bulk(lines):
+        return [[int(x) for x in line.split()] for line in lines]
+    return rows(*ragged(lines))
 
 
 def safe_levels(levels: list[int]) -> bool:
@@ -32,15 +35,15 @@ def dampen_levels(levels: list[int]) -> bool:
 
 
 def part1(lines: list[str]) -> int:
-    return sum(safe_levels(get_levels(line)) for line in lines)
+    return sum(safe_levels(levels) for levels in get_reports(lines))
 
 
 def part2(lines: list[str]) -> int:
-    return sum(dampen_levels(get_levels(line)) for line in lines)
+    return sum(dampen_levels(levels) for levels in get_reports(lines))
 
 
 if __name__ == '__main__':
-    from faoci.interface import fetch_lines
+    from aoc.inputs import fetch_lines
 
     print(f'Part 1: {part1(fetch_lines(year=2024, day=2))}')
     print(f'Part 2: {part2(fetch_lines(year=2024, day=2))}')
@@ -1,70 +1,36 @@
 # Path: /home/g/Code/advent-of-python/src/24/04/y24d04.py
 # Puzzle Source: https://adventofcode.com/2024/day/4
+from aoc.topology import Topology
 
-class D:
-    def __init__(self, x, y):
-        self.x = x
-        self.y = y
 
-    def __add__(self, other):
-        return D(self.x + other.x, self.y + other.y)
-    
-    def __sub__(self, other):
-        return D(self.x - other.x, self.y - other.y)
+def xmas_count(board: Topology, i: int) -> int:
+    """The XMAS words starting from the X at i; a word running off the board meets the wall and stops"""
+    cells = board.cells
+    return sum(cells[i + d] == 'M' and cells[i + 2 * d] == 'A' and cells[i + 3 * d] == 'S' for d in board.offsets8)
 
-    def __mul__(self, integer):
-        return D(self.x * integer, self.y * integer)
 
-    def inbound(self, board: list[str]):
-        return self.x >= 0 and self.x < len(board) and self.y >= 0 and self.y < len(board[self.x])
-
-    def is_chr(self, board: list[str], c: chr):
-        return self.inbound(board) and c == board[self.x][self.y]
-
-    def status(self, board: list[str]):
-        return board[self.x][self.y] if self.inbound(board) else '_'
-
-
-def directions():
-    n, e, s, w = D(-1, 0), D(0, 1), D(1, 0), D(0, -1)
-    return n, n+e, e, s+e, s, s+w, w, n+w
-
-
-def is_all(board: list[str], xs: tuple[D], cs: tuple[chr]) -> bool:
-    return all(x.is_chr(board, c) for x, c in zip(xs, cs))
-
-
-def is_xmas(board: list[str], x0: D, d: D):
-    return is_all(board, (x0, x0 + d, x0 + d * 2, x0 + d * 3),  ('X', 'M', 'A', 'S'))
-
-
-def is_x_mas(board: list[str], x0: D, d1: D, d2: D):
-    return is_all(board, (x0 - d1, x0 - d2, x0, x0 + d2, x0 + d1), ('M', 'M', 'A', 'S', 'S'))
-
-
-def xmas_count(board: list[str], v: D):
-    return sum(is_xmas(board, v, d) for d in directions())
-
-
-def x_mas_count(board: list[str], v: D):
-    _, ne, _, se, _, sw, _, nw = directions()
-    return sum(is_x_mas(board, v, a, b) for a, b in ((ne, se), (ne, nw), (nw, sw), (se, sw)))
-
-
-def positions(board: list[str]) -> list[D]:
-    return [D(x, y) for x, line in enumerate(board) for y in range(len(line))]
+def x_mas_count(board: Topology, i: int) -> int:
+    """The pairs of crossing MAS words centred on the A at i"""
+    cells = board.cells
+    _, ne, _, se, _, sw, _, nw = board.offsets8
+    count = 0
+    for a, b in ((ne, se), (ne, nw), (nw, sw), (se, sw)):
+        count += cells[i - a] == 'M' and cells[i - b] == 'M' and cells[i + b] == 'S' and cells[i + a] == 'S'
+    return count
 
 
 def part1(board: list[str]) -> int:
-    return sum(xmas_count(board, v) for v in positions(board))
+    board = Topology.from_lines(board)
+    return sum(xmas_count(board, i) for i in board.find('X'))
 
 
 def part2(board: list[str]) -> int:
-    return sum(x_mas_count(board, v) for v in positions(board))
+    board = Topology.from_lines(board)
+    return sum(x_mas_count(board, i) for i in board.find('A'))
 
 
 if __name__ == '__main__':
-    from faoci.interface import fetch_lines
+    from aoc.inputs import fetch_lines
 
     print(f'Part 1: {part1(fetch_lines(year=2024, day=4))}')
     print(f'Part 2: {part2(fetch_lines(year=2024, day=4))}')
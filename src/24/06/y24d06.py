@@ -1,6 +1,7 @@
 # Path: /home/g/Code/advent-of-python/src/24/06/y24d06.py
 # Puzzle Source: https://adventofcode.com/2024/day/6
-from dataclasses import dataclass
+from aoc import counters
+from aoc.point import Point
 
 def example():
     from pathlib import Path
@@ -8,20 +9,15 @@ def example():
         lines = f.read().split('\n')
     return lines[:-1] if len(lines[-1]) == 0 else lines
 
-@dataclass
-class P:
-    x: int
-    y: int
-    def __add__(self, other):
-        return D(self.x + other.x, self.y + other.y)
-    def __sub__(self, other):
-        return D(self.x - other.x, self.y - other.y)
+class P(Point):
+    __slots__ = ()
+
     def __str__(self):
         return f'P({self.x}, {self.y})'
-    def __hash__(self):
-        return hash((self.x, self.y))
 
-class D(P):
+class D(Point):
+    __slots__ = ()
+
     def __str__(self):
         n, e, s, w = D(0, -1), D(1, 0), D(0, 1), D(-1, 0)
         chrs = {n: '^', e: '>', s: 'v', w: '<'}
@@ -106,13 +102,24 @@ class B:
         steps = 0
         while self.step():
             steps += 1
+        counters.add('y24d06.steps', steps)
         return steps
 
+    def move(self, state: tuple[P, D]) -> tuple[P, D] | None:
+        """The guard's next position and orientation, or None once it steps off the board"""
+        position, d = state
+        for _ in range(4):
+            npos = position + d
+            if npos.y < 0 or npos.y >= len(self.board) or npos.x < 0 or npos.x >= len(self.board[npos.y]):
+                return None
+            if self.board[npos.y][npos.x] >= 0:
+                return npos, d
+            d = d.next()
+        raise RuntimeError("Revolved on the spot!")
+
     def has_loop(self):
-        last = self.step()
-        while last > 0:
-            last = self.step()
-        return last < 0
+        from aoc.cycles import period
+        return period((self.position, self.orientation), self.move) is not None
 
     def visit_count(self):
         return sum(sum(x > 0 for x in row) for row in self.board)
@@ -138,6 +145,7 @@ def part2(lines: list[str]) -> int:
     b0.walk()
     visited = b0.visited()
     to_check = all_empty.intersection(visited)
+    counters.add('y24d06.obstacles', len(to_check))
     for opt in to_check:
         bt = B.from_lines(lines)
         # insert an obstacle
@@ -148,8 +156,8 @@ def part2(lines: list[str]) -> int:
 
 
 if __name__ == '__main__':
-    from faoci.interface import fetch_lines
-    from timer import Timer
+    from aoc.inputs import fetch_lines
+    from aoc.timer import Timer
 
     assert part1(example()) == 41
     assert part2(example()) == 6
@@ -3,6 +3,8 @@
 from dataclasses import dataclass, field
 from typing import TypeVar
 
+from aoc.point import Point
+
 def load_txt_lines(named: str):
     from pathlib import Path
     with Path(__file__).parent.joinpath(f'{named}.txt').open('r') as f:
@@ -10,27 +12,6 @@ def load_txt_lines(named: str):
     return lines[:-1] if len(lines[-1]) == 0 else lines
 
 
-@dataclass
-class Point:
-    x: int
-    y: int
-
-    def __hash__(self):
-        return hash((self.x, self.y))
-
-    def __add__(self, other):
-        return Point(self.x + other.x, self.y + other.y)
-
-    def __sub__(self, other):
-        return Point(self.x - other.x, self.y - other.y)
-
-    def __mul__(self, other):
-        return Point(self.x * other, self.y * other)
-
-    def __str__(self):
-        return f'({self.x}, {self.y})'
-
-
 @dataclass
 class A:
     name: str
@@ -102,7 +83,7 @@ def part2(lines: list[str]) -> int:
 
 
 if __name__ == '__main__':
-    from faoci.interface import fetch_lines
+    from aoc.inputs import fetch_lines
 
     assert part1(load_txt_lines('example')) == 14
     assert part2(load_txt_lines('example')) == 34
@@ -116,8 +116,8 @@ def part2(lines: list[str]) -> int:
 
 
 if __name__ == '__main__':
-    from faoci.interface import fetch_lines
-    from timer import Timer
+    from aoc.inputs import fetch_lines
+    from aoc.timer import Timer
 
     assert part1(load_txt_lines('example')) == 1928
     assert part2(load_txt_lines('example')) == 2858
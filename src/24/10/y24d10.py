@@ -1,8 +1,12 @@
 # Path: /home/g/Code/advent-of-python/src/24/10/y24d10.py
 # Puzzle Source: https://adventofcode.com/2024/day/10
 from dataclasses import dataclass, field
+from functools import cached_property
 from typing import TypeVar
 
+from aoc.bitgrid import BitGrid
+from aoc.point import Point
+
 def load_txt_lines(named: str):
     from pathlib import Path
     with Path(__file__).parent.joinpath(f'{named}.txt').open('r') as f:
@@ -10,27 +14,6 @@ def load_txt_lines(named: str):
     return lines[:-1] if len(lines[-1]) == 0 else lines
 
 
-@dataclass
-class Point:
-    x: int
-    y: int
-
-    def __hash__(self):
-        return hash((self.x, self.y))
-
-    def __add__(self, other):
-        return Point(self.x + other.x, self.y + other.y)
-
-    def __sub__(self, other):
-        return Point(self.x - other.x, self.y - other.y)
-
-    def __mul__(self, other):
-        return Point(self.x * other, self.y * other)
-
-    def __str__(self):
-        return f'({self.x}, {self.y})'
-
-
 @dataclass
 class TopoMap:
     topo: tuple[tuple[int, ...], ...] = field(default_factory=tuple)
@@ -48,10 +31,9 @@ class TopoMap:
 
     @classmethod
     def from_lines(cls, lines: list[str]):
-        nx = len(lines[0])
-        assert all(len(line) == nx for line in lines)
-        topo = tuple(tuple(int(h) for h in line) for line in lines)
-        return cls(topo)
+        from aoc.grid import from_lines
+        heights = (from_lines(lines) - ord('0')).tolist()
+        return cls(tuple(tuple(row) for row in heights))
 
     def trailheads(self) -> list[Point]:
         return [Point(x, y) for y, line in enumerate(self.topo) for x, h in enumerate(line) if h == 0]
@@ -69,18 +51,20 @@ class TopoMap:
 class HikingMap:
     topo: TopoMap
 
+    @cached_property
+    def levels(self) -> list[BitGrid]:
+        cells = [[] for _ in range(10)]
+        for y, line in enumerate(self.topo.topo):
+            for x, h in enumerate(line):
+                cells[h].append((y, x))
+        return [BitGrid.from_cells(self.topo.ny, self.topo.nx, c) for c in cells]
+
     def explore(self, p: Point):
-        from collections import deque
-        up_next = deque([(n, p) for n in self.topo.next(p)])
-        visited = {p: (0, p)}
-        while len(up_next):
-            n, c = up_next.pop()
-            if (s := visited[c][0] + 1) < visited.get(n, (s+1, n))[0]:
-                visited[n] = s, c
-                up_next.extend((nn, n) for nn in self.topo.next(n))
-        ends = [x for x in visited if self.topo.at(x) == 9]
-        # here's where we could walk the paths backwards...
-        return len(ends)
+        # every cell reachable at each height at once, one layer of neighbours per step up
+        reach = BitGrid.from_cells(self.topo.ny, self.topo.nx, [(p.y, p.x)])
+        for level in self.levels[self.topo.at(p) + 1:]:
+            reach = reach.neighbours() & level
+        return reach.count()
 
     def peruse(self, p: Point, history: tuple[Point, ...]):
         if self.topo.at(p) == 9:
@@ -107,8 +91,8 @@ def part2(lines: list[str]) -> int:
 
 
 if __name__ == '__main__':
-    from faoci.interface import fetch_lines
-    from timer import Timer
+    from aoc.inputs import fetch_lines
+    from aoc.timer import Timer
 
     assert part1(load_txt_lines('example')) == 36
     assert part2(load_txt_lines('example')) == 81
@@ -3,6 +3,9 @@
 from dataclasses import dataclass, field
 from typing import TypeVar
 
+from aoc.memo import scope
+from aoc.persist import persistent
+
 @dataclass
 class S:
     value: int
@@ -36,16 +39,7 @@ def part2(lines: list[str]) -> int:
     return n_blinks(stones, 75)
 
 
-def memo(f):
-    knowledge = dict()
-    def inner(stone: S, count: int):
-        if (stone, count) not in knowledge:
-            knowledge[(stone, count)] = f(stone, count)
-        return knowledge[(stone, count)]
-    return inner
-
-
-@memo
+@persistent(maxsize=1 << 19)
 def follow(stone: S, count: int):
     if count == 0:
         return 1
@@ -53,12 +47,13 @@ def follow(stone: S, count: int):
 
 
 def n_blinks(stones: list[S], count: int):
-    return sum(follow(stone, count) for stone in stones)
+    with scope(follow):
+        return sum(follow(stone, count) for stone in stones)
 
 
 if __name__ == '__main__':
-    from faoci.interface import fetch_lines
-    from timer import Timer
+    from aoc.inputs import fetch_lines
+    from aoc.timer import Timer
 
     assert n_blinks([S(125), S(17)], 6) == 22
     assert n_blinks([S(125), S(17)], 25) == 55312
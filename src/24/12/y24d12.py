@@ -3,6 +3,8 @@
 from dataclasses import dataclass, field
 from typing import TypeVar
 
+from aoc.point import Point
+
 def load_txt_lines(named: str):
     from pathlib import Path
     with Path(__file__).parent.joinpath(f'{named}.txt').open('r') as f:
@@ -10,27 +12,6 @@ def load_txt_lines(named: str):
     return lines[:-1] if len(lines[-1]) == 0 else lines
 
 
-@dataclass
-class Point:
-    x: int
-    y: int
-
-    def __hash__(self):
-        return hash((self.x, self.y))
-
-    def __add__(self, other):
-        return Point(self.x + other.x, self.y + other.y)
-
-    def __sub__(self, other):
-        return Point(self.x - other.x, self.y - other.y)
-
-    def __mul__(self, other):
-        return Point(self.x * other, self.y * other)
-
-    def __str__(self):
-        return f'({self.x}, {self.y})'
-
-
 @dataclass
 class Region:
     name: chr
@@ -43,23 +24,20 @@ class Region:
     @property
     def perimeter(self):
         directions = Point(0, 1), Point(1, 0), Point(0, -1), Point(-1, 0)
-        external = 0
-        for p in self.points:
-            for d in directions:
-                if p + d not in self.points:
-                    external += 1
-        return external
+        points = self.points
+        return sum(p + d not in points for p in points for d in directions)
 
     @property
     def sides(self):
         from itertools import product
+        points = self.points
         inner, outer = 0, 0
 
         n, e, s, w = Point(-1, 0), Point(0, 1), Point(1, 0), Point(0, -1)
         # A point is a corner if none of its neighbors in one quadrant are present
         check = (w, w+n, n), (n, n+e, e), (e, s+e, s), (s, s+w, w)
-        for p in self.points:
-            outer += sum(not any(p + x in self.points for x in z) for z in check)
+        for p in points:
+            outer += sum(p + a not in points and p + b not in points and p + c not in points for a, b, c in check)
 
         # A point outside of the area is next to an inner corner the two orthogonal
         # neighbors are present
@@ -67,8 +45,8 @@ class Region:
         xmin, xmax, ymin, ymax = self.limits()
         for x, y in product(range(xmin-1, xmax+2), range(ymin-1, ymax+2)):
             p = Point(x, y)
-            if p not in self.points:
-                inner += sum(all(p + x in self.points for x in z) for z in check)
+            if p not in points:
+                inner += sum(p + a in points and p + b in points for a, b in check)
 
         return inner + outer
 
@@ -121,32 +99,23 @@ class Map:
     def variety(self, x: Point):
         return self.board[x.y][x.x] if 0 <= x.x < self.nx and 0 <= x.y < self.ny else '.'
 
-    def explore_region(self, p: Point):
-        from collections import deque
-        directions = Point(0, 1), Point(1, 0), Point(0, -1), Point(-1, 0)
-        q = deque()
-        q.append(p)
-        v = self.variety(p)
-        inside = {p}
-        while len(q):
-            x = q.popleft()
-            for d in directions:
-                if self.variety(y:=x+d) == v and y not in inside:
-                    inside.add(y)
-                    q.append(y)
-        return Region(v, inside)
-
     def find_regions(self):
-        from itertools import product
-        available = [[True for _ in line] for line in self.board]
+        from aoc.unionfind import UnionFind
+        # a puzzle-sized map is joined faster than scipy.ndimage.label can be imported
+        board, nx = self.board, self.nx
+        cells = UnionFind(nx * self.ny)
+        for y, row in enumerate(board):
+            for x, (a, b) in enumerate(zip(row, row[1:]), start=y * nx):
+                if a == b:
+                    cells.union(x, x + 1)
+        for y, (above, below) in enumerate(zip(board, board[1:])):
+            for x, (a, b) in enumerate(zip(above, below), start=y * nx):
+                if a == b:
+                    cells.union(x, x + nx)
         region_list = []
-        for x, y in product(range(self.nx), range(self.ny)):
-            if not available[y][x]:
-                continue
-            region = self.explore_region(Point(x, y))
-            for p in region.points:
-                available[p.y][p.x] = False
-            region_list.append(region)
+        for group in cells.groups():
+            points = {Point.from_key(i, nx) for i in group}
+            region_list.append(Region(board[group[0] // nx][group[0] % nx], points))
         return tuple(region_list)
 
     def fence_cost(self):
@@ -167,8 +136,8 @@ def part2(lines: list[str]) -> int:
 
 
 if __name__ == '__main__':
-    from faoci.interface import fetch_lines
-    from timer import Timer
+    from aoc.inputs import fetch_lines
+    from aoc.timer import Timer
 
     assert part1(load_txt_lines('example0')) == 140
     assert part1(load_txt_lines('example1')) == 772
@@ -3,6 +3,8 @@
 from dataclasses import dataclass, field
 from typing import TypeVar
 
+from aoc.point import Point
+
 
 def load_txt_lines(named: str):
     from pathlib import Path
@@ -11,30 +13,6 @@ def load_txt_lines(named: str):
     return lines[:-1] if len(lines[-1]) == 0 else lines
 
 
-@dataclass
-class Point:
-    x: int
-    y: int
-
-    def __hash__(self):
-        return hash((self.x, self.y))
-
-    def __add__(self, other):
-        return Point(self.x + other.x, self.y + other.y)
-
-    def __sub__(self, other):
-        return Point(self.x - other.x, self.y - other.y)
-
-    def __mul__(self, other):
-        return Point(self.x * other, self.y * other)
-
-    def dot(self, other):
-        return self.x * other.x + self.y * other.y
-
-    def __str__(self):
-        return f'({self.x}, {self.y})'
-
-
 @dataclass
 class ClawMachine:
     a: Point
@@ -68,8 +46,13 @@ class Arcade:
 
     @classmethod
     def from_lines(cls, lines: list[str]):
-        lines = [line for line in lines if len(line)]
-        machines = [ClawMachine.from_lines(lines[3*n:3*n+3]) for n in range(len(lines)//3)]
+        from aoc.parse import bulk, records
+        if not bulk(lines):
+            lines = [line for line in lines if len(line)]
+            return cls([ClawMachine.from_lines(lines[3*n:3*n+3]) for n in range(len(lines)//3)])
+        # six numbers per machine, whichever lines they are on
+        machines = [ClawMachine(Point(ax, ay), Point(bx, by), Point(x, y))
+                    for ax, ay, bx, by, x, y in records(lines, 6, signed=False).tolist()]
         return cls(machines)
 
     def cost(self, offset=0):
@@ -86,7 +69,7 @@ def part2(lines: list[str]) -> int:
 
 
 if __name__ == '__main__':
-    from faoci.interface import fetch_lines
+    from aoc.inputs import fetch_lines
     assert part1(load_txt_lines('example')) == 480
     print(f'Part 1: {part1(fetch_lines(year=2024, day=13))}')
     print(f'Part 2: {part2(fetch_lines(year=2024, day=13))}')
@@ -3,49 +3,7 @@
 from dataclasses import dataclass, field
 from typing import TypeVar
 
-
-@dataclass
-class Point:
-    x: int
-    y: int
-
-    def __hash__(self):
-        return hash((self.x, self.y))
-
-    def __add__(self, other):
-        if isinstance(other, Point):
-            return Point(self.x + other.x, self.y + other.y)
-        return Point(self.x + other, self.y + other)
-
-    def __sub__(self, other):
-        if isinstance(other, Point):
-            return Point(self.x - other.x, self.y - other.y)
-        return Point(self.x - other, self.y - other)
-
-    def __mul__(self, other):
-        if isinstance(other, Point):
-            return self.x * other.x + self.y * other.y
-        return Point(self.x * other, self.y * other)
-    
-    def __floordiv__(self, other):
-        if isinstance(other, Point):
-            return Point(self.x // other.x, self.y // other.y)
-        return Point(self.x // other, self.y // other)
-
-    def __rmul__(self, other):
-        return Point(other * self.x, other * self.y)
-
-    def __mod__(self, other):
-        if isinstance(other, Point):
-            return Point(self.x % other.x, self.y % other.y)
-        return Point(self.x % other, self.y % other)
-
-    def __str__(self):
-        return f'({self.x}, {self.y})'
-
-    @classmethod
-    def from_str(cls, s: str):
-        return cls(*[int(x) for x in s.split(',')])
+from aoc.point import Point
 
 
 @dataclass
@@ -69,7 +27,10 @@ class Space:
 
     @classmethod
     def from_lines(cls, size: Point, lines: list[str]):
-        return cls(size, tuple(Robot.from_line(line) for line in lines))
+        from aoc.parse import bulk, records
+        if not bulk(lines):
+            return cls(size, tuple(Robot.from_line(line) for line in lines))
+        return cls(size, tuple(Robot(Point(x, y), Point(vx, vy)) for x, y, vx, vy in records(lines, 4).tolist()))
 
     def quadrant_counts(self) -> tuple[int, int, int, int]:
         nw, ne, se, sw = 0, 0, 0, 0
@@ -113,6 +74,9 @@ class Space:
                 return True
         return False
 
+    def positions(self) -> tuple[Point, ...]:
+        return tuple(r.p for r in self.robots)
+
     def after(self, time: int):
         r = tuple(Robot(x.position_at(time, self.size), x.v) for x in self.robots)
         return Space(self.size, r)
@@ -145,19 +109,19 @@ def part1(lines: list[str], size: Point | None = None) -> int:
 
 
 def part2(lines: list[str]) -> int:
+    from aoc.cycles import search
     size = Point(101, 103)
     space = Space.from_lines(size, lines)
-    steps = 0
-    while True:
-        if space.tree_candidate():
-            print(space)
-            return steps
-        steps += 1
-        space = space.after(1)
+    # the robots are back where they started after lcm(101, 103) steps, so the search has to end
+    steps = search(space, lambda s: s.after(1), Space.tree_candidate, key=Space.positions)
+    if steps is None:
+        raise RuntimeError('No tree before the robots repeat their positions')
+    print(space.after(steps))
+    return steps
 
 
 if __name__ == '__main__':
-    from faoci.interface import fetch_lines
+    from aoc.inputs import fetch_lines
 
     assert part1(get_lines('y24d14.test'), size=Point(11, 7)) == 12
 
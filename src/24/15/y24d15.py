@@ -2,58 +2,8 @@
 # Puzzle Source: https://adventofcode.com/2024/day/15
 from dataclasses import dataclass, field
 from typing import TypeVar
- 
-
-@dataclass
-class Point:
-    x: int
-    y: int
-
-    def __hash__(self):
-        return hash((self.x, self.y))
-
-    def __add__(self, other):
-        if isinstance(other, Point):
-            return Point(self.x + other.x, self.y + other.y)
-        return Point(self.x + other, self.y + other)
-
-    def __sub__(self, other):
-        if isinstance(other, Point):
-            return Point(self.x - other.x, self.y - other.y)
-        return Point(self.x - other, self.y - other)
-
-    def __mul__(self, other):
-        if isinstance(other, Point):
-            return self.x * other.x + self.y * other.y
-        return Point(self.x * other, self.y * other)
-    
-    def __floordiv__(self, other):
-        if isinstance(other, Point):
-            return Point(self.x // other.x, self.y // other.y)
-        return Point(self.x // other, self.y // other)
-
-    def __rmul__(self, other):
-        return Point(other * self.x, other * self.y)
-
-    def __mod__(self, other):
-        if isinstance(other, Point):
-            return Point(self.x % other.x, self.y % other.y)
-        return Point(self.x % other, self.y % other)
-
-    def __str__(self):
-        return f'({self.x}, {self.y})'
-    
-    def __repr__(self):
-        return str(self)
-
-    @classmethod
-    def from_str(cls, s: str):
-        return cls(*[int(x) for x in s.split(',')])
-
-    @classmethod
-    def from_chr(cls, c: chr):
-        return {'<': Point(-1, 0), '^': Point(0, -1), '>': Point(1, 0), 'v': Point(0, 1)}[c]
 
+from aoc.point import Point
 
 
 TBox = TypeVar('TBox', bound='Box')
@@ -208,7 +158,7 @@ def solve(lines: list[str], part: int=1) -> int:
 
 
 if __name__ == '__main__':
-    from faoci.interface import fetch_lines
+    from aoc.inputs import fetch_lines
     from pathlib import Path
 
     puzzle = fetch_lines(year=2024, day=15)
@@ -119,23 +119,30 @@ def part1(lines: list[str]) -> int:
 def part2(lines: list[str]) -> int:
     from math import log, floor
 
+    from aoc.checkpoint import Checkpoint
+
     comp = Computer.from_lines(lines)
-    a, b, c = 8**(len(comp.instructions)-1), comp.b, comp.c
-    out = comp.run(a, b, c)
-    while len(out) == len(comp.instructions) and out != comp.instructions and a < (8 ** len(comp.instructions)):
-        n = int(floor(log(a, 8)))
-        for i in range(n):
-            if out[-1-i] == comp.instructions[-1-i]:
-                n -= 1
-            else:
-                break
-        a += 8**n
+    b, c = comp.b, comp.c
+    with Checkpoint('y24d17', tuple(comp.instructions), b, c) as checkpoint:
+        # a snapshot holds the last register value tried, which the search picks up from
+        a = checkpoint.state or 8**(len(comp.instructions)-1)
         out = comp.run(a, b, c)
+        while len(out) == len(comp.instructions) and out != comp.instructions and a < (8 ** len(comp.instructions)):
+            n = int(floor(log(a, 8)))
+            for i in range(n):
+                if out[-1-i] == comp.instructions[-1-i]:
+                    n -= 1
+                else:
+                    break
+            a += 8**n
+            out = comp.run(a, b, c)
+            if checkpoint.due():
+                checkpoint.save(a)
     return a
 
 
 if __name__ == '__main__':
-    from faoci.interface import fetch_lines
+    from aoc.inputs import fetch_lines
 
     assert part1(get_lines('y24d17.test')) == [4,6,3,5,6,3,5,2,1,0]
     assert part2(get_lines('y24d17.b.test')) == 117440
@@ -3,6 +3,8 @@
 from dataclasses import dataclass, field
 from typing import TypeVar, Any
 
+from aoc.point import Point
+
 
 def load_lines(named: str):
     from pathlib import Path
@@ -11,48 +13,6 @@ def load_lines(named: str):
     return lines[:-1] if len(lines[-1]) == 0 else lines
 
 
-@dataclass
-class Point:
-    x: int
-    y: int
-
-    def __hash__(self):
-        return hash((self.x, self.y))
-
-    def __add__(self, other):
-        return Point(self.x + other.x, self.y + other.y)
-
-    def __sub__(self, other):
-        return Point(self.x - other.x, self.y - other.y)
-
-    def __mul__(self, other):
-        return Point(self.x * other, self.y * other)
-
-    def __str__(self):
-        return f'({self.x}, {self.y})'
-
-    def __repr__(self):
-        return str(self)
-
-
-class Heap:
-    @dataclass(order=True)
-    class Item:
-        priority: int
-        item: Any=field(compare=False)
-
-    def __init__(self):
-        self.heap = []
-    def push(self, element: Item):
-        from heapq import heappush
-        heappush(self.heap, element)
-    def pop(self):
-        from heapq import heappop
-        return heappop(self.heap)
-    def __len__(self):
-        return len(self.heap)
-
-
 @dataclass
 class Space:
     bitmap: tuple[tuple[int, ...], ...]
@@ -111,62 +71,72 @@ class Space:
             for n, c in self.ways(p, d):
                 self.forward.setdefault(p, {})[n] = c
                 self.reverse.setdefault(n, {})[p] = c
-    
-    def __post_init__(self):
-        self.build_graphs()
-
-    def djikstra(self, start: Point, graph: dict[Point, dict[Point, int]]):
-        queue = Heap()
-        distances = {}
-        queue.push(Heap.Item(0, start))
-        distances[start] = 0
-        while len(queue):
-            item = queue.pop()
-            score, key = item.priority, item.item
-            if distances[key] < score or key not in graph:
-                continue
-            for node, weight in graph[key].items():
-                new_score = score + weight
-                if distances.get(node, new_score + 1) > new_score:
-                    distances[node] = new_score
-                    queue.push(Heap.Item(new_score, node))
-
-        return distances
 
     def cost(self):
-        distances = self.djikstra(self.start, self.forward)
-        return distances.get(self.goal, -1)
-
-def close_search(space: Space, at_least: int, n: int, at_most: int):
-    cost = space.first(n).cost()
-    if cost < 0:
-        return close_search(space, at_least, at_least + (n - at_least) // 2, n - 1)
-    cost = space.first(n+1).cost()
-    if cost >= 0:
-        return close_search(space, n + 1, at_most - (at_most - n) // 2, at_most)
-    return n
+        from aoc.search import bfs
+        # the graphs are only needed here, so a Space which is never searched never builds them
+        if not self.forward:
+            self.build_graphs()
+        # every step costs one, so a breadth-first search which stops at the goal is enough
+        return bfs(self.forward, self.start, self.goal).cost
+
+def first_blocking(space: Space) -> int | None:
+    """The index of the byte which first cuts the start off from the goal
+
+    Starting from the grid after every byte has fallen, bytes are lifted out again from the last to the
+    first, joining each freed cell to its open neighbours, until start and goal share a component.
+    """
+    from aoc.topology import Topology
+    from aoc.unionfind import UnionFind
+    nx, ny = space.nx, space.ny
+    grid = Topology.from_lines(['.' * nx] * ny)
+    fallen = {space.bitmap[y][x] - 1: grid.index(y, x) for y in range(ny) for x in range(nx) if space.bitmap[y][x]}
+    # the frame around the grid stays blocked, so no freed cell's neighbour needs a bounds check
+    blocked = grid.blocked()
+    for i in fallen.values():
+        blocked[i] = 1
+    cells = UnionFind(len(grid))
+    offsets = grid.offsets4
+
+    def free(i: int):
+        blocked[i] = 0
+        for d in offsets:
+            if not blocked[i + d]:
+                cells.union(i, i + d)
+
+    start, goal = grid.index(space.start.y, space.start.x), grid.index(space.goal.y, space.goal.x)
+    for p in space.spaces():
+        free(grid.index(p.y, p.x))
+    if cells.connected(start, goal):
+        return None
+    for i in sorted(fallen, reverse=True):
+        free(fallen[i])
+        if cells.connected(start, goal):
+            return i
+    return None
 
 
 def part1(lines: list[str], size: int = 71, after: int = 1024) -> int:
-    from timer import Timer
-    with Timer():
+    from aoc.timer import Timer
+    with Timer(name='y24d18.part1'):
         space = Space.from_lines(lines, n=size).first(after)
         return space.cost()
 
 
-def part2(lines: list[str], size: int = 71, after: int = 1024) -> int:
-    from timer import Timer
-    with Timer():
+def part2(lines: list[str], size: int = 71) -> str:
+    from aoc.timer import Timer
+    with Timer(name='y24d18.part2'):
         space = Space.from_lines(lines, n=size)
-        last = close_search(space, after, after + (len(lines) - after) // 2, len(lines))
+        if (last := first_blocking(space)) is None:
+            raise RuntimeError('The fallen bytes never cut off the exit')
         return lines[last]
 
 
 if __name__ == '__main__':
-    from faoci.interface import fetch_lines
+    from aoc.inputs import fetch_lines
 
     assert part1(load_lines('y24d18'), 7, 12) == 22
-    assert part2(load_lines('y24d18'), 7, 12) == '6,1'
+    assert part2(load_lines('y24d18'), 7) == '6,1'
 
     puzzle = fetch_lines(year=2024, day=18)
     print(f'Part 1: {part1(puzzle)}')
@@ -2,7 +2,8 @@
 # Puzzle Source: https://adventofcode.com/2024/day/19
 from dataclasses import dataclass, field
 from typing import TypeVar, Any
-from functools import cache
+
+from aoc.memo import memo_method
 
 
 def load_lines(named: str):
@@ -12,24 +13,6 @@ def load_lines(named: str):
     return lines[:-1] if len(lines[-1]) == 0 else lines
 
 
-class Heap:
-    @dataclass(order=True)
-    class Item:
-        priority: int
-        item: Any=field(compare=False)
-
-    def __init__(self):
-        self.heap = []
-    def push(self, element: Item):
-        from heapq import heappush
-        heappush(self.heap, element)
-    def pop(self):
-        from heapq import heappop
-        return heappop(self.heap)
-    def __len__(self):
-        return len(self.heap)
-
-
 @dataclass
 class Supply:
     towels: tuple[str,...]
@@ -42,21 +25,19 @@ class Supply:
         return cls(tuple(x.strip() for x in line.split(',')))
 
     def match(self, design: str):
-        queue = Heap()
-        queue.push(Heap.Item(len(design), (design, tuple())))
-        while len(queue):
-            work, components = queue.pop().item
-            if len(work):
-                for t in self.towels:
-                    if work.startswith(t):
-                        rem = work[len(t):]
-                        cmp = components + (t,)
-                        queue.push(Heap.Item(len(rem), (rem, cmp)))
-            else:
+        # only reachability matters, so a plain depth-first search will do; each remainder is explored once
+        # however many towel combinations lead to it
+        seen, stack = {design}, [design]
+        while stack:
+            if not (work := stack.pop()):
                 return 1
+            for t in self.towels:
+                if work.startswith(t) and (rest := work[len(t):]) not in seen:
+                    seen.add(rest)
+                    stack.append(rest)
         return 0
 
-    @cache
+    @memo_method
     def count(self, design: str):
         return sum(self.count(design[len(t):]) for t in self.towels if design.startswith(t)) if len(design) else 1
     
@@ -72,7 +53,7 @@ def part2(lines: list[str]) -> int:
 
 
 if __name__ == '__main__':
-    from faoci.interface import fetch_lines
+    from aoc.inputs import fetch_lines
 
     assert part1(load_lines('y24d19')) == 6
 
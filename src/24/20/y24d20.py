@@ -3,6 +3,10 @@
 from dataclasses import dataclass, field
 from typing import TypeVar, Any
 
+from aoc.point import Point
+from aoc.search import CSR
+from aoc.topology import Topology
+
 
 def load_lines(named: str):
     from pathlib import Path
@@ -11,73 +15,14 @@ def load_lines(named: str):
     return lines[:-1] if len(lines[-1]) == 0 else lines
 
 
-@dataclass
-class Point:
-    x: int
-    y: int
-
-    def __hash__(self):
-        return hash((self.x, self.y))
-
-    def __add__(self, other):
-        return Point(self.x + other.x, self.y + other.y)
-
-    def __sub__(self, other):
-        return Point(self.x - other.x, self.y - other.y)
-
-    def __mul__(self, other):
-        return Point(self.x * other, self.y * other)
-
-    def __str__(self):
-        return f'({self.x}, {self.y})'
-
-    def __repr__(self):
-        return str(self)
-
-
-class Heap:
-    @dataclass(order=True)
-    class Item:
-        priority: int
-        item: Any=field(compare=False)
-
-    def __init__(self):
-        self.heap = []
-    def push(self, element: Item):
-        from heapq import heappush
-        heappush(self.heap, element)
-    def pop(self):
-        from heapq import heappop
-        return heappop(self.heap)
-    def __len__(self):
-        return len(self.heap)
-
-
-def djikstra(start: Point, graph: dict[Point, dict[Point, int]]):
-    queue = Heap()
-    distances = {}
-    queue.push(Heap.Item(0, start))
-    distances[start] = 0
-    while len(queue):
-        item = queue.pop()
-        score, key = item.priority, item.item
-        if distances[key] < score or key not in graph:
-            continue
-        for node, weight in graph[key].items():
-            new_score = score + weight
-            if distances.get(node, new_score + 1) > new_score:
-                distances[node] = new_score
-                queue.push(Heap.Item(new_score, node))
-    return distances
-
-
 @dataclass
 class Track:
     bitmap: tuple[tuple[int, ...], ...]
     start: Point
     goal: Point
-    forward: dict[tuple[Point, Point], dict[tuple[Point, Point], int]] = field(default_factory=dict)
-    reverse: dict[tuple[Point, Point], dict[tuple[Point, Point], int]] = field(default_factory=dict)
+    forward: CSR | None = None
+    reverse: CSR | None = None
+    grid: Topology | None = None
 
     @property
     def nx(self):
@@ -91,18 +36,12 @@ class Track:
         return self.bitmap[p.y][p.x]
 
     @classmethod
-    def from_lines(cls, lines: list[str], n: int = 71):
-        from itertools import product
-        n = len(lines[0])
-        assert all(len(line) == n for line in lines)
-        bm = [[1 if '#' == c else 0 for c in line] for line in lines]
-        start, goal = Point(0, 0), Point(n-1, n-1)
-        for i, j in product(range(n), range(len(lines))):
-            if 'S' == lines[j][i]:
-                start = Point(i, j)
-            if 'E' == lines[j][i]:
-                goal = Point(i, j)
-        return cls(tuple(tuple(row) for row in bm), start, goal)
+    def from_lines(cls, lines: list[str]):
+        from aoc.grid import from_lines, find_one
+        grid = from_lines(lines)
+        (sy, sx), (gy, gx) = find_one(grid, 'S'), find_one(grid, 'E')
+        bm = (grid == ord('#')).astype(int).tolist()
+        return cls(tuple(tuple(row) for row in bm), Point(sx, sy), Point(gx, gy), grid=Topology.from_lines(lines))
 
     def dirs(self):
         return Point(0, 1), Point(1, 0), Point(0, -1), Point(-1, 0)
@@ -117,78 +56,92 @@ class Track:
         from itertools import product
         return [Point(x, y) for x, y in product(range(self.nx), range(self.ny)) if self.bitmap[y][x] == 0]
 
-    def ways(self, p: Point, d: Point, value: int = 0):
-        n = p + d
-        if 0 <= n.x < self.nx and 0 <= n.y < self.ny and self.at(n) == value:
-            return ((n, 1), )
-        return tuple()
-
     def build_graphs(self):
-        from itertools import product
-        for p, d in product(self.spaces(), self.dirs()):
-            for n, c in self.ways(p, d):
-                self.forward.setdefault(p, {})[n] = c
-                self.reverse.setdefault(n, {})[p] = c
-    
+        import numpy as np
+        from aoc.csr import cells, transpose
+        self.forward = cells(np.array(self.bitmap) == 0, self.dirs())
+        self.reverse = transpose(self.forward)
+
     def __post_init__(self):
-        if not len(self.forward) and not len(self.reverse):
+        if self.forward is None:
             self.build_graphs()
 
+    def distances(self):
+        """Steps from the start and to the goal, as lists indexed by Point.key(nx)"""
+        from aoc.csr import shortest
+        fwd = shortest(self.forward, self.start.key(self.nx)).distance
+        rev = shortest(self.reverse, self.goal.key(self.nx)).distance
+        return fwd.tolist(), rev.tolist()
+
     def cost(self):
-        distances = djikstra(self.start, self.forward)
-        return distances.get(self.goal, -1)
+        from aoc.csr import shortest
+        return int(shortest(self.forward, self.start.key(self.nx)).distance[self.goal.key(self.nx)])
 
     def old_rule_count(self, save: int):
-        from itertools import product
-        fwd = djikstra(self.start, self.forward)
-        rev = djikstra(self.goal, self.reverse)
+        """Two-step cheats through one wall cell of the grid, from the open cell on one side to the other
+
+        Walking the grid's own walls, both sides of a wall are in the framed grid, so need no bounds check.
+        """
+        fwd, rev = self.distances()
+        grid = self.grid or Topology.from_lines(str(self).splitlines())
+        cells, wall, width, nx = grid.cells, grid.wall, grid.width, self.nx
+        total = fwd[self.goal.key(nx)]
+
+        def key(i):
+            r, c = divmod(i, width)
+            return (r - 1) * nx + c - 1
+
         count = 0
-        for s, d in product(self.spaces(), self.dirs()):
-            n = s + d * 2
-            if 0 <= n.x < self.nx and 0 <= n.y < self.ny and self.at(s+d) != 0 and self.at(n) == 0:
-                if fwd[self.goal] - fwd[s] - rev[n] - 2 >= save:
+        for i in grid.interior():
+            if cells[i] != wall:
+                continue
+            for d in grid.offsets4:
+                s, n = i - d, i + d
+                if cells[s] != wall and cells[n] != wall and total - fwd[key(s)] - rev[key(n)] - 2 >= save:
                     count += 1
         return count
 
-    def metropolis_glitch(self, start: Point, duration: int):
+    @staticmethod
+    def diamond(duration: int) -> tuple[tuple[Point, int], ...]:
+        """Every offset within Manhattan distance duration, with its distance"""
         from itertools import product
-        graph = {}
-        for dx, dy in product(range(-duration, duration+1), range(-duration, duration+1)):
-            p = start + Point(dx, dy)
-            if dx and dy and abs(dx) + abs(dy) > duration or not (0 <= p.x < self.nx and 0 <= p.y < self.nx and self.at(p) == 0):
-                continue
-            graph[p] = abs(dx) + abs(dy)
-        return graph
+        steps = product(range(-duration, duration+1), repeat=2)
+        return tuple((Point(dx, dy), abs(dx) + abs(dy)) for dx, dy in steps if abs(dx) + abs(dy) <= duration)
 
     def glitch_count(self, save: int, duration: int = 20):
-        fwd = djikstra(self.start, self.forward)
-        rev = djikstra(self.goal, self.reverse)
-        counts = {}
-        for start in self.spaces():
-            for til, dist in self.metropolis_glitch(start, duration).items():
-                saved = fwd[self.goal] - fwd[start] - rev[til] - dist
-                if saved >= save:
-                    counts[saved] = counts.get(saved, 0) + 1
-        return counts
-
+        import numpy as np
+        from aoc.csr import shortest, shift
+        shape = self.ny, self.nx
+        fwd = shortest(self.forward, self.start.key(self.nx)).distance.reshape(shape)
+        rev = shortest(self.reverse, self.goal.key(self.nx)).distance.reshape(shape)
+        total = fwd[self.goal.y, self.goal.x]
+        # every glitch of one offset at once: from each reachable cell to the cell offset away
+        savings = []
+        for d, dist in self.diamond(duration):
+            source, target = shift(shape, d.x, d.y)
+            f, r = fwd[source], rev[target]
+            saved = total - f - r - dist
+            savings.append(saved[(f >= 0) & (r >= 0) & (saved >= save)])
+        values, counts = np.unique(np.concatenate(savings), return_counts=True)
+        return dict(zip(values.tolist(), counts.tolist()))
 
 
 def part1(lines: list[str], save: int = 100) -> int:
-    from timer import Timer
-    with Timer():
+    from aoc.timer import Timer
+    with Timer(name='y24d20.part1'):
         track = Track.from_lines(lines)
         return track.old_rule_count(save)
 
 
 def part2(lines: list[str], save: int = 100) -> int:
-    from timer import Timer
-    with Timer():
+    from aoc.timer import Timer
+    with Timer(name='y24d20.part2'):
         track = Track.from_lines(lines)
         return sum(track.glitch_count(save).values())
 
 
 if __name__ == '__main__':
-    from faoci.interface import fetch_lines
+    from aoc.inputs import fetch_lines
 
     lines = load_lines('y24d20')
     assert Track.from_lines(lines).cost() == 84
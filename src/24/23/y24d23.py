@@ -1,9 +1,9 @@
 # Path: /home/g/Code/advent-of-python/src/24/23/y24d23.py
 # Puzzle Source: https://adventofcode.com/2024/day/23
+from __future__ import annotations
 from dataclasses import dataclass, field
 from typing import TypeVar, Any
 from functools import cache
-from networkx import Graph
 
 
 def load_lines(named: str):
@@ -14,6 +14,7 @@ def load_lines(named: str):
 
 
 def build_network(lines: list[str]):
+    from networkx import Graph
     g = Graph()
     g.add_edges_from([line.split('-') for line in lines])
     return g
@@ -50,7 +51,7 @@ def part2(lines: list[str]) -> int:
 
 
 if __name__ == '__main__':
-    from faoci.interface import fetch_lines
+    from aoc.inputs import fetch_lines
 
     assert part1(load_lines('y24d23')) == 7
 
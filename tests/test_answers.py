@@ -0,0 +1,29 @@
+import aoc.answers
+from aoc.answers import AnswerStore, solve, source_digest
+from aoc.days import discover
+
+
+def test_stored_answers_are_returned_until_forced(tmp_path):
+    day = discover([23], [17])[0]
+    store = AnswerStore(tmp_path / 'answers.sqlite')
+    calls = []
+
+    def solver(lines):
+        calls.append(lines)
+        return len(lines)
+
+    assert solve(day, 1, ['a', 'b'], store, solver=solver)[::2] == ('2', False)
+    assert solve(day, 1, ['a', 'b'], store, solver=solver)[::2] == ('2', True)
+    assert solve(day, 1, ['a', 'b', 'c'], store, solver=solver)[::2] == ('3', False)
+    assert solve(day, 1, ['a', 'b'], store, force=True, solver=solver)[::2] == ('2', False)
+    assert len(calls) == 3
+
+
+def test_editing_the_aoc_package_invalidates_stored_answers(tmp_path, monkeypatch):
+    day = discover([23], [17])[0]
+    store = AnswerStore(tmp_path / 'answers.sqlite')
+    before = source_digest(day)
+    solve(day, 1, ['a'], store, solver=len)
+    monkeypatch.setattr(aoc.answers, 'package_digest', lambda: 'an edited helper')
+    assert source_digest(day) != before
+    assert solve(day, 1, ['a'], store, solver=len)[2] is False
@@ -0,0 +1,37 @@
+from pathlib import Path
+
+import pytest
+
+from aoc.batch import chunked, solve
+from aoc.days import SOURCE
+
+EXAMPLE = SOURCE.joinpath('23', '09', 'y23d09.test')
+
+
+def test_inputs_as_lines_text_and_paths_give_one_answer_each():
+    lines = EXAMPLE.read_text().splitlines()
+    corpus = [lines, '\n'.join(lines), EXAMPLE, ['1 2 3']]
+    outcomes = solve(2023, 9, 1, corpus, workers=0)
+    assert [o.index for o in outcomes] == [0, 1, 2, 3]
+    assert [o.answer for o in outcomes] == ['114', '114', '114', '4']
+    assert [o.duplicate for o in outcomes] == [False, True, True, False]
+    assert all(o.status == 'ok' for o in outcomes)
+
+
+def test_a_str_naming_a_file_is_refused():
+    with pytest.raises(ValueError, match='Path'):
+        solve(2023, 9, 1, [str(EXAMPLE)], workers=0)
+
+
+def test_a_pool_returns_outcomes_in_input_order():
+    corpus = [[f'{i} {2 * i} {3 * i}'] for i in range(12)] + [Path(EXAMPLE)]
+    outcomes = solve(2023, 9, 2, corpus, workers=2, chunksize=3)
+    assert [o.index for o in outcomes] == list(range(13))
+    assert [o.answer for o in outcomes] == [str(0)] * 12 + ['2']
+
+
+def test_chunks_cover_every_item_about_four_per_worker():
+    items = list(range(37))
+    chunks = chunked(items, 3)
+    assert sum(chunks, []) == items
+    assert len(chunks) in range(10, 14)
@@ -0,0 +1,32 @@
+import pytest
+
+from aoc.bitgrid import BitGrid
+
+
+@pytest.mark.parametrize('dc', [1, 2, 3, 7])
+def test_shift_east_drops_cells_leaving_the_row(dc):
+    grid = BitGrid.from_cells(3, 3, [(0, 2), (1, 0)])
+    expected = sorted((r, c + dc) for r, c in grid.cells() if c + dc < 3)
+    assert sorted(grid.shift(0, dc).cells()) == expected
+
+
+@pytest.mark.parametrize('dc', [1, 2, 3, 7])
+def test_shift_west_drops_cells_leaving_the_row(dc):
+    grid = BitGrid.from_cells(3, 3, [(1, 0), (2, 2)])
+    expected = sorted((r, c - dc) for r, c in grid.cells() if c - dc >= 0)
+    assert sorted(grid.shift(0, -dc).cells()) == expected
+
+
+def test_shift_diagonally_and_off_the_top_and_bottom():
+    grid = BitGrid.from_cells(4, 5, [(0, 0), (1, 4), (3, 2)])
+    assert sorted(grid.shift(1, 2).cells()) == [(1, 2)]
+    assert sorted(grid.shift(-1, -2).cells()) == [(0, 2), (2, 0)]
+
+
+def test_shift_matches_cell_by_cell_moves():
+    lines = ['#..#.', '.##..', '#...#', '..#.#']
+    grid = BitGrid.from_lines(lines, '#')
+    for dr in range(-4, 5):
+        for dc in range(-6, 7):
+            moved = {(r + dr, c + dc) for r, c in grid.cells()}
+            assert set(grid.shift(dr, dc).cells()) == {(r, c) for r, c in moved if 0 <= r < 4 and 0 <= c < 5}
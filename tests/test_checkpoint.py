@@ -0,0 +1,39 @@
+import pytest
+
+from aoc.checkpoint import Checkpoint, snapshots
+
+
+def count_to(limit, directory, stop_at=None):
+    """A search counting to limit which snapshots every step, and can be interrupted at stop_at"""
+    with Checkpoint('count', limit, every=0, directory=directory) as checkpoint:
+        start = checkpoint.state or 0
+        for i in range(start, limit):
+            if i == stop_at:
+                raise KeyboardInterrupt
+            if checkpoint.due():
+                checkpoint.save(i)
+        return start
+
+
+def test_an_interrupted_search_resumes_from_its_last_snapshot(tmp_path):
+    with pytest.raises(KeyboardInterrupt):
+        count_to(100, tmp_path, stop_at=60)
+    assert [name for name, *_ in snapshots(tmp_path)] == ['count']
+    assert count_to(100, tmp_path) == 59
+    # a clean finish removes the snapshot
+    assert snapshots(tmp_path) == []
+    assert count_to(100, tmp_path) == 0
+
+
+def test_snapshots_are_kept_apart_by_key(tmp_path):
+    with pytest.raises(KeyboardInterrupt):
+        count_to(100, tmp_path, stop_at=30)
+    assert count_to(50, tmp_path) == 0
+    assert count_to(100, tmp_path) == 29
+
+
+def test_checkpointing_is_off_without_the_setting(monkeypatch):
+    monkeypatch.delenv('AOC_CHECKPOINT', raising=False)
+    checkpoint = Checkpoint('count', 1, every=0)
+    checkpoint.save(5)
+    assert checkpoint.state is None and not checkpoint.due() and not checkpoint.resumed
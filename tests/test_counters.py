@@ -0,0 +1,28 @@
+from aoc import counters
+from aoc.counters import collect
+from aoc.memo import memo_method
+
+
+def test_collect_counts_only_inside_its_block():
+    counters.add('outside.calls')
+    with collect() as counts:
+        counters.add('inside.calls', 3)
+        counters.add('inside.calls')
+    assert counts == {'inside.calls': 4}
+
+
+def test_memo_method_counts_survive_collected_instances():
+    import gc
+
+    class Towels:
+        @memo_method
+        def ways(self, n):
+            return 1 if n < 2 else self.ways(n - 1) + self.ways(n - 2)
+
+    with collect() as counts:
+        for _ in range(3):
+            assert Towels().ways(20) == 10946
+        gc.collect()
+    stats = Towels.ways.site.stats()
+    assert (stats.hits, stats.misses, stats.size) == (3 * 18, 3 * 21, 0)
+    assert (counts[f'{stats.name}.hits'], counts[f'{stats.name}.misses']) == (3 * 18, 3 * 21)
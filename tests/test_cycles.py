@@ -0,0 +1,53 @@
+import pytest
+
+from aoc.cycles import after, brent, history, period, search
+
+
+def walk(start, step, n):
+    state = start
+    for _ in range(n):
+        state = step(state)
+    return state
+
+
+def rho(lead: int, length: int):
+    """A step whose states 0 .. lead - 1 lead into a cycle of length states"""
+    return lambda x: x + 1 if x + 1 < lead + length else lead
+
+
+@pytest.mark.parametrize('lead, length', [(0, 1), (0, 7), (3, 1), (5, 12), (40, 3)])
+def test_brent_and_history_find_lead_and_period(lead, length):
+    step = rho(lead, length)
+    assert brent(0, step) == (lead, length)
+    assert period(0, step) == length
+    cycle = history(0, step)
+    assert (cycle.lead, cycle.period) == (lead, length)
+    for n in (0, lead, lead + length, 10 ** 18, 10 ** 18 + 1):
+        assert cycle.at(n) == walk(0, step, min(n, lead + (n - lead) % length if n >= lead else n))
+
+
+def test_keys_and_observables():
+    # states carry a step count which the key ignores, as a board and its sorted rocks do
+    step = lambda s: ((s[0] * 3 + 1) % 11, s[1] + 1)
+    key = lambda s: s[0]
+    cycle = history((2, 0), step, key, observe=lambda s: s[0] * 10)
+    lead, length = brent((2, 0), step, key)
+    assert (cycle.lead, cycle.period) == (lead, length)
+    assert cycle.at(1000) == walk((2, 0), step, 1000)[0] * 10
+    assert key(after((2, 0), step, 1000, key)) == walk((2, 0), step, 1000)[0]
+
+
+def test_ending_sequences_have_no_cycle():
+    step = lambda x: x + 1 if x < 5 else None
+    assert brent(0, step) is None
+    assert period(0, step) is None
+    assert history(0, step) is None
+    assert after(0, step, 3) == 3
+    assert after(0, step, 9) is None
+
+
+def test_search_stops_at_predicate_or_once_states_repeat():
+    step = rho(4, 6)
+    assert search(0, step, lambda x: x == 7) == 7
+    assert search(0, step, lambda x: x == 99) is None
+    assert history(0, rho(0, 10 ** 6), limit=100) is None
@@ -0,0 +1,26 @@
+"""The example asserts of every day's __main__ block, one test each, run together in a process pool
+
+    python -m pytest tests                  # every example, offline
+    python -m pytest tests -k y23d17        # one day's
+"""
+import pytest
+
+from aoc.examples import collect, run
+
+CASES = collect()
+
+
+@pytest.fixture(scope='session')
+def outcomes(request):
+    """Run every selected case at once, in parallel, the first time any of their results is needed"""
+    selected = [item.callspec.params['case'] for item in request.session.items
+                if hasattr(item, 'callspec') and 'case' in item.callspec.params]
+    return {outcome.name: outcome for outcome in run(selected)}
+
+
+@pytest.mark.parametrize('case', CASES, ids=str)
+def test_example(case, outcomes):
+    outcome = outcomes[case.name]
+    if outcome.status == 'skipped':
+        pytest.skip(outcome.message)
+    assert outcome.status == 'passed', f'{case.text}: {outcome.message}'
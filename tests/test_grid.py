@@ -0,0 +1,31 @@
+import pytest
+
+from aoc.grid import from_lines, load, to_lines
+
+
+@pytest.mark.parametrize('ending', ['\n', '\r\n'])
+@pytest.mark.parametrize('final', [True, False])
+def test_load_matches_the_lines(tmp_path, ending, final):
+    lines = ['#..#', '.##.', '....']
+    path = tmp_path / 'grid.txt'
+    path.write_bytes((ending.join(lines) + (ending if final else '')).encode())
+    assert to_lines(load(path)) == lines
+
+
+def test_load_finds_lines_longer_than_the_first_chunk(tmp_path):
+    cols = (1 << 16) + 5
+    lines = ['.' * (cols - 1) + '#', '#' + '.' * (cols - 1)]
+    path = tmp_path / 'wide.txt'
+    path.write_text('\n'.join(lines) + '\n')
+    grid = load(path)
+    assert grid.shape == (2, cols)
+    assert (grid == from_lines(lines)).all()
+    path.write_text(lines[0])
+    assert load(path).shape == (1, cols)
+
+
+def test_load_rejects_ragged_grids(tmp_path):
+    path = tmp_path / 'ragged.txt'
+    path.write_text('...\n..\n...\n')
+    with pytest.raises(ValueError):
+        load(path)
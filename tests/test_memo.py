@@ -0,0 +1,48 @@
+from aoc.memo import memo, memo_method, scope
+
+
+def test_memo_counts_hits_and_misses_and_scope_clears():
+    calls = []
+
+    @memo
+    def double(x):
+        calls.append(x)
+        return 2 * x
+
+    assert [double(x) for x in (1, 2, 1, 1, 3)] == [2, 4, 2, 2, 6]
+    stats = double.site.stats()
+    assert (stats.hits, stats.misses, stats.size) == (2, 3, 3)
+    with scope(double):
+        double(1)
+    assert double.site.stats().size == 0
+    double(1)
+    assert calls == [1, 2, 3, 1]
+    assert double.site.stats().misses == 4
+
+
+def test_bounded_memo_evicts():
+    @memo(maxsize=2)
+    def square(x):
+        return x * x
+
+    for x in (1, 2, 3, 1):
+        square(x)
+    stats = square.site.stats()
+    assert (stats.misses, stats.size, stats.evictions) == (4, 2, 2)
+
+
+def test_memo_method_caches_per_instance():
+    class Counter:
+        def __init__(self, offset):
+            self.offset = offset
+            self.calls = 0
+
+        @memo_method
+        def shifted(self, x):
+            self.calls += 1
+            return x + self.offset
+
+    a, b = Counter(1), Counter(10)
+    assert [a.shifted(1), a.shifted(1), b.shifted(1)] == [2, 2, 11]
+    assert (a.calls, b.calls) == (1, 1)
+    assert Counter.shifted.site.stats().hits == 1
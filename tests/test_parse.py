@@ -0,0 +1,44 @@
+import pytest
+
+from aoc.parse import BULK, bulk, integers, ragged, records, rows
+
+
+@pytest.mark.parametrize('text, signed, expected', [
+    ('3-5', True, [3, 5]),
+    ('-5 x=-5 y=+7', True, [-5, -5, 7]),
+    ('a - 4 --6', True, [4, -6]),
+    ('-5 3-5', False, [5, 3, 5]),
+    ('trailing -', True, []),
+    ('', True, []),
+    ('12345678901234', True, [12345678901234]),
+])
+def test_integers_and_minus_signs(text, signed, expected):
+    assert integers(text, signed).tolist() == expected
+
+
+def test_every_source_type_reads_the_same(tmp_path):
+    lines = ['p=0,4 v=3,-3', 'p=6,3 v=-1,-3']
+    path = tmp_path / 'input.txt'
+    path.write_text('\n'.join(lines) + '\n')
+    expected = [[0, 4, 3, -3], [6, 3, -1, -3]]
+    for source in (lines, '\n'.join(lines), '\n'.join(lines).encode(), path):
+        assert records(source).tolist() == expected
+
+
+def test_records_span_lines_and_check_their_width():
+    assert records(['1 2', '3 4', '5 6'], 3).tolist() == [[1, 2, 3], [4, 5, 6]]
+    assert records(['', 'x 1 2', '3 4']).tolist() == [[1, 2], [3, 4]]
+    with pytest.raises(ValueError):
+        records(['1 2 3', '4 5'])
+
+
+def test_ragged_skips_lines_without_integers():
+    values, offsets = ragged(['1 2 3', 'none here', '', '-4', '5 6'])
+    assert rows(values, offsets) == [[1, 2, 3], [-4], [5, 6]]
+    values, offsets = ragged([])
+    assert rows(values, offsets) == []
+
+
+def test_bulk_only_above_a_megabyte_of_characters():
+    assert not bulk(['1 2 3'] * 1000)
+    assert not bulk(['x' * (BULK - 1)]) and bulk(['x' * (BULK // 2)] * 2)
@@ -0,0 +1,41 @@
+import importlib.util
+
+from aoc.persist import persistent
+
+
+def load(path, name):
+    spec = importlib.util.spec_from_file_location(name, path)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+def test_persistent_results_survive_a_new_process_until_the_function_changes(tmp_path, monkeypatch):
+    monkeypatch.setenv('AOC_MEMO', str(tmp_path / 'memo.sqlite'))
+    source = tmp_path / 'squares.py'
+    source.write_text('def square(x):\n    return x * x\n')
+
+    def run(values):
+        function = persistent(load(source, 'squares').square)
+        answers = [function(x) for x in values]
+        return answers, function.site.finish()
+
+    answers, cold = run([2, 3])
+    assert answers == [4, 9] and (cold.loaded, cold.computed) == (0, 2)
+    answers, warm = run([2, 3, 4])
+    assert answers == [4, 9, 16] and (warm.loaded, warm.computed) == (2, 1)
+
+    # an edited function is a new version, so nothing stored by the old one is returned
+    source.write_text('def square(x):\n    return x * x + 1\n')
+    answers, edited = run([2, 3])
+    assert answers == [5, 10] and (edited.loaded, edited.computed) == (0, 2)
+
+
+def test_persistent_is_a_plain_memo_when_off(monkeypatch):
+    monkeypatch.delenv('AOC_MEMO', raising=False)
+
+    @persistent
+    def triple(x):
+        return 3 * x
+
+    assert triple(2) == 6 and not hasattr(triple.site, 'store')
@@ -0,0 +1,26 @@
+import pickle
+
+from aoc.point import Point
+
+
+class Step(Point):
+    __slots__ = ()
+
+    def turn(self):
+        return Step(-self.y, self.x)
+
+
+def test_arithmetic_with_points_tuples_and_integers():
+    p = Point(2, 3)
+    assert p + (1, -1) == (1, -1) + p == Point(3, 2)
+    assert p - (1, -1) == Point(1, 4) and (1, -1) - p == Point(-1, -4)
+    assert 1 + p == p + 1 == Point(3, 4) and 10 - p == Point(8, 7)
+    assert p * (1, -1) == (1, -1) * p == -1 and 2 * p == p * 2 == Point(4, 6)
+    assert isinstance((1, -1) + p, Point) and isinstance((1, -1) - p, Point)
+
+
+def test_subclasses_survive_arithmetic_and_pickling():
+    s = Step(1, 0)
+    assert isinstance(s + Point(0, 1), Step) and isinstance((0, 1) + s, Step)
+    assert (s + (0, 1)).turn() == Step(-1, 1)
+    assert pickle.loads(pickle.dumps(s)) == s
@@ -0,0 +1,18 @@
+from aoc.days import find
+from aoc.profiling import profile, write
+
+DAY = find(2023, 23)
+LINES = DAY.path.with_suffix('.test').read_text().splitlines()
+
+
+def test_a_module_level_entry_point_is_captured():
+    answer, capture = profile(DAY, 1, LINES, only=['part1'])
+    assert answer == 94 and capture.calls == 1
+    assert 'part1' in capture.cpu_report(5)
+
+
+def test_a_target_which_is_never_entered_reports_no_calls(tmp_path):
+    answer, capture = profile(DAY, 1, LINES, only=['HikingNetwork.search'])
+    assert answer == 94 and capture.calls == 0
+    assert capture.cpu_report() == 'no captured calls'
+    assert write(DAY, 1, capture, tmp_path) == []
@@ -0,0 +1,30 @@
+import signal
+
+import pytest
+
+from aoc.days import deadline
+from aoc.registry import registry
+from aoc.sampler import Sampler
+
+pytestmark = pytest.mark.skipif(not hasattr(signal, 'setitimer'), reason='sampling needs signal.setitimer')
+
+
+def spin(n):
+    return sum(i * i for i in range(n))
+
+
+def test_the_default_cpu_timer_runs_under_a_deadline():
+    with deadline(30):
+        with Sampler() as sampler:
+            spin(2_000_000)
+        # the deadline's alarm is still armed, and the sampler put SIGPROF back as it found it
+        assert signal.getitimer(signal.ITIMER_REAL)[0] > 0
+    assert sampler.cpu and sampler.samples > 0
+    assert signal.getsignal(signal.SIGPROF) in (signal.SIG_DFL, None)
+    assert any('test_sampler:spin' in stack for stack in sampler.named())
+
+
+def test_days_are_selected_from_the_registry():
+    days = registry().select([23], [9, 12])
+    assert [(d.year, d.day) for d in days] == [(2023, 9), (2023, 12)]
+    assert registry().select([2023], [9]) == days[:1]
@@ -0,0 +1,122 @@
+import os
+from dataclasses import dataclass, field
+from random import Random
+from typing import Any
+
+import pytest
+
+from aoc.search import CSR, astar, bfs, dial, dijkstra, manhattan, zero_one_bfs
+
+
+def grid(n: int, seed: int = 0, largest: int = 9) -> dict:
+    """An n x n grid graph whose step into a cell costs that cell's weight"""
+    rng = Random(seed)
+    cost = [[rng.randint(0 if largest == 1 else 1, largest) for _ in range(n)] for _ in range(n)]
+    return {(r, c): {(r + dr, c + dc): cost[r + dr][c + dc]
+                     for dr, dc in ((0, 1), (1, 0), (0, -1), (-1, 0)) if 0 <= r + dr < n and 0 <= c + dc < n}
+            for r in range(n) for c in range(n)}
+
+
+def as_csr(graph: dict, n: int) -> CSR:
+    indptr, indices, weights = [0], [], []
+    for r in range(n):
+        for c in range(n):
+            for (rr, cc), w in graph[(r, c)].items():
+                indices.append(rr * n + cc)
+                weights.append(w)
+            indptr.append(len(indices))
+    return CSR(indptr, indices, weights)
+
+
+@dataclass(order=True)
+class Item:
+    priority: int
+    item: Any = field(compare=False)
+
+
+def copied_heap_dijkstra(graph: dict, start) -> dict:
+    """The Heap and Item Dijkstra which y24d16, y24d18, y24d19 and y24d20 each used to carry"""
+    from heapq import heappush, heappop
+    queue, distances = [Item(0, start)], {start: 0}
+    while queue:
+        item = heappop(queue)
+        score, key = item.priority, item.item
+        if distances[key] < score or key not in graph:
+            continue
+        for node, weight in graph[key].items():
+            if distances.get(node, score + weight + 1) > score + weight:
+                distances[node] = score + weight
+                heappush(queue, Item(score + weight, node))
+    return distances
+
+
+@pytest.mark.parametrize('seed', range(3))
+def test_weighted_searches_agree_on_every_graph_form(seed):
+    n = 12
+    graph = grid(n, seed)
+    expected = copied_heap_dijkstra(graph, (0, 0))
+    csr = as_csr(graph, n)
+    assert dict(dijkstra(graph, (0, 0)).distance) == expected
+    assert dict(dijkstra(lambda u: graph[u].items(), (0, 0)).distance) == expected
+    assert dijkstra(csr, 0).distance == [expected[divmod(i, n)] for i in range(n * n)]
+    assert dial(csr, 0).distance == [expected[divmod(i, n)] for i in range(n * n)]
+    assert dict(dial(graph, (0, 0)).distance) == expected
+    assert astar(graph, (0, 0), (n - 1, n - 1), manhattan((n - 1, n - 1))).cost == expected[(n - 1, n - 1)]
+
+
+def test_zero_one_bfs_matches_dijkstra():
+    graph = grid(10, 5, largest=1)
+    assert dict(zero_one_bfs(graph, (0, 0)).distance) == dict(dijkstra(graph, (0, 0)).distance)
+
+
+def test_dial_refuses_edges_heavier_than_largest():
+    graph = {0: [(1, 12)], 1: [(3, 1)], 3: []}
+    with pytest.raises(ValueError, match='largest=9'):
+        dial(graph, 0)
+    assert dict(dial(graph, 0, largest=12).distance) == dict(dijkstra(graph, 0).distance) == {0: 0, 1: 12, 3: 13}
+
+
+def test_unorderable_nodes_with_equal_distances():
+    graph = {'a': [(1j, 1), (2j, 1)], 1j: [('b', 1)], 2j: [('b', 1)]}
+    assert dict(dijkstra(graph, 'a').distance) == {'a': 0, 1j: 1, 2j: 1, 'b': 2}
+    assert astar(graph, 'a', 'b', lambda node: 0).cost == 2
+
+
+def test_bfs_counts_edges_and_ignores_weights():
+    graph = {0: {1: 5, 2: 1}, 1: {3: 7}, 2: {1: 1}, 3: {}}
+    paths = bfs(graph, 0)
+    assert dict(paths.distance) == {0: 0, 1: 1, 2: 1, 3: 2}
+    assert paths.distance[4] == -1
+
+
+def test_path_goal_and_several_sources():
+    graph = {'a': {'b': 1, 'c': 4}, 'b': {'c': 1, 'd': 5}, 'c': {'d': 1}, 'd': {}}
+    paths = dijkstra(graph, 'a', 'd')
+    assert paths.cost == 3
+    assert paths.path() == ['a', 'b', 'c', 'd']
+    assert dijkstra(graph, 'a', lambda node: node == 'z').cost == -1
+    assert dict(dijkstra(graph, sources={'a': 0, 'c': 0}).distance) == {'a': 0, 'b': 1, 'c': 0, 'd': 1}
+    csr = CSR([0, 1, 2, 2], [1, 2], [3, 4])
+    found = dijkstra(csr, 0, 2)
+    assert found.cost == 7 and found.path() == [0, 1, 2]
+
+
+@pytest.mark.skipif(not os.environ.get('AOC_BENCH'), reason='a timing benchmark, run with AOC_BENCH=1')
+def test_shared_dijkstra_beats_the_copied_heap_classes():
+    from time import perf_counter
+    n = 120
+    graph = grid(n, 1)
+    csr = as_csr(graph, n)
+
+    def fastest(search, runs=5):
+        times = []
+        for _ in range(runs):
+            start = perf_counter()
+            search()
+            times.append(perf_counter() - start)
+        return min(times)
+
+    before = fastest(lambda: copied_heap_dijkstra(graph, (0, 0)))
+    # packed integer heap entries over a CSR measured about 1.8 times as fast; tuples over a dict vary
+    # from a little slower to a quarter faster, so only the CSR is held to a margin
+    assert before / fastest(lambda: dijkstra(csr, 0)) > 1.3
@@ -0,0 +1,35 @@
+from aoc.topology import BACK, E, LEFT, N, RIGHT, S, W, Topology, state, turn, unstate
+
+LINES = ['..#.',
+         '.#..',
+         '....']
+
+
+def test_index_and_position_round_trip_inside_the_frame():
+    grid = Topology.from_lines(LINES)
+    assert grid.width == 6 and len(grid) == 6 * 5
+    for r in range(3):
+        for c in range(4):
+            i = grid.index(r, c)
+            assert grid.position(i) == (r, c)
+            assert grid.cells[i] == LINES[r][c]
+    assert grid.interior() == [grid.index(r, c) for r in range(3) for c in range(4)]
+
+
+def test_every_step_off_the_grid_reads_the_wall():
+    grid = Topology.from_lines(LINES)
+    for i in grid.interior():
+        for d in grid.offsets8:
+            assert 0 <= i + d < len(grid)
+            r, c = grid.position(i + d)
+            inside = 0 <= r < 3 and 0 <= c < 4
+            assert grid.cells[i + d] == (LINES[r][c] if inside else grid.wall)
+
+
+def test_headings_and_states():
+    assert [LEFT[RIGHT[h]] for h in (N, E, S, W)] == [N, E, S, W]
+    assert [BACK[h] for h in (N, E, S, W)] == [S, W, N, E]
+    packed = state(17, E)
+    assert unstate(packed) == (17, E)
+    assert unstate(turn(packed, RIGHT)) == (17, S)
+    assert unstate(turn(packed, LEFT)) == (17, N)
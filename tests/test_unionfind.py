@@ -0,0 +1,47 @@
+from random import Random
+
+import numpy as np
+
+from aoc.unionfind import UnionFind, label, members, regions
+
+
+def test_union_find_matches_naive_components():
+    rng = Random(3)
+    n = 200
+    sets = UnionFind(n)
+    naive = {x: {x} for x in range(n)}
+    for _ in range(150):
+        a, b = rng.randrange(n), rng.randrange(n)
+        joined = naive[a] is not naive[b]
+        assert sets.union(a, b) == joined
+        if joined:
+            merged = naive[a] | naive[b]
+            for x in merged:
+                naive[x] = merged
+    distinct = {id(s): s for s in naive.values()}
+    assert sets.count == len(distinct) == len(sets.roots())
+    assert sorted(map(sorted, sets.groups())) == sorted(map(sorted, distinct.values()))
+    assert all(sets.set_size(x) == len(naive[x]) for x in range(n))
+
+
+def test_add_grows_the_sets():
+    sets = UnionFind()
+    a, b, c = sets.add(), sets.add(), sets.add()
+    sets.union(a, c)
+    assert len(sets) == 3 and sets.count == 2
+    assert sets.connected(a, c) and not sets.connected(a, b)
+
+
+def test_label_and_regions_of_a_grid():
+    grid = np.array([[1, 1, 0, 2],
+                     [0, 1, 0, 2],
+                     [3, 0, 1, 1]])
+    labels, count = label(grid)
+    assert count == 3
+    assert labels[2, 3] == labels[0, 3] != labels[0, 0]
+    labels, count = label(grid, diagonal=True)
+    assert count == 1
+    labels, count = regions(grid)
+    assert count == 7
+    assert labels.min() >= 1
+    assert [len(m) for m in members(*label(grid == 1))] == [3, 2]